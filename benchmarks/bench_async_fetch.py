@@ -0,0 +1,58 @@
+# Сравнение последовательной и асинхронной загрузки вакансий на тестовом сервере.
+# Запуск из корня проекта: python -m benchmarks.bench_async_fetch
+import tempfile
+import time
+
+from src.utils.async_fetch import AsyncFetcher, run_searches
+from src.utils.network import RateLimiter
+from src.utils.vacancies import VacHH, VacSJ
+from tests.stub_server import start_stub_server
+
+# Задержка ответа тестового сервера, имитирующая сетевую задержку, сек.
+LATENCY = 0.05
+# Количество поисков (ключевых слов/регионов), выполняемых за один запуск.
+SEARCHES = 8
+
+
+def make_searches(url: str, folders: list) -> list:
+    """
+    Создание набора поисков: поровну hh.ru и superjob.ru.
+    :param url: Адрес тестового сервера, str.
+    :param folders: Папки для сохранения результатов, list.
+    :return: Экземпляры классов VacHH и VacSJ, list.
+    """
+    limiter = RateLimiter(rate=1000)
+    searches = []
+    for num, folder in enumerate(folders):
+        if num % 2:
+            searches.append(VacSJ('водитель', url=url, path_vak=folder, rate_limiter=limiter))
+        else:
+            searches.append(VacHH('водитель', url=url, path_vak=folder, rate_limiter=limiter, max_workers=1))
+    return searches
+
+
+def main() -> None:
+    server = start_stub_server(found=2000, latency=LATENCY)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            folders = [tempfile.mkdtemp(dir=tmp) for _ in range(SEARCHES)]
+
+            start = time.perf_counter()
+            for search in make_searches(server.url, folders):
+                search.vacancies_all()
+            blocking = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with AsyncFetcher(rate_limiter=RateLimiter(rate=1000)) as fetcher:
+                run_searches(make_searches(server.url, folders), fetcher)
+            concurrent = time.perf_counter() - start
+
+        print(f'\nПоследовательно: {blocking:.2f} сек., асинхронно: {concurrent:.2f} сек., '
+              f'ускорение в {blocking / concurrent:.1f} раз.')
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# Сравнение прежнего заполнения словарей вакансий и заполнения по таблице полей (FieldExtractor).
+# Запуск из корня проекта: python -m benchmarks.bench_field_extractor
+import time
+import timeit
+
+from src.utils.constants import KEY_ID
+from src.utils.fields import FieldExtractor
+from src.utils.vacancies import FIELDS_HH, FIELDS_SJ
+from tests import reference_fields as reference
+from tests.stub_server import make_vacancy_hh, make_vacancy_sj
+
+# Количество повторов замера.
+REPEAT = 20
+
+# Поля hh.ru и superjob.ru, описанные в VacHH и VacSJ.
+EXTRACTOR_HH = FieldExtractor(FIELDS_HH)
+EXTRACTOR_SJ = FieldExtractor(FIELDS_SJ)
+
+
+def mixin_hh(value: dict) -> dict:
+    """
+    Прежнее заполнение словаря вакансии hh.ru.
+    """
+    keys = {
+        '03 Работодатель': ["employer", "name"],
+        '04 Населённый пункт': ["area", "name"],
+        '05 Адрес': ["address", "raw"],
+        '08 Валюта': ["salary", "currency"],
+        '09 График работы': ["schedule", "name"],
+        '10 Занятость': ["employment", "name"],
+        '11 Опыт работы': ["experience", "name"],
+        '12 Требования к соискателю': ["snippet", "requirement"],
+        '13 Обязанности': ["snippet", "responsibility"],
+    }
+    vacancy = {
+        '01 Дата публикации': value["published_at"].split('T')[0],
+        '02 Должность': value["name"] + '.',
+        '06 Зарплата от': reference.two_levels_salary(value, "salary", "from"),
+        '07 Зарплата до': reference.two_levels_salary(value, "salary", "to"),
+    }
+    for key_0, key in keys.items():
+        reference.two_levels(value, vacancy, key_0, key[0], key[1])
+    reference.one_level(value, vacancy, '14 Подробнее здесь (URL)', "alternate_url")
+    vacancy[KEY_ID] = str(value['id'])
+    return vacancy
+
+
+def mixin_sj(value: dict) -> dict:
+    """
+    Прежнее заполнение словаря вакансии superjob.ru.
+    """
+    keys_1 = {
+        '05 Адрес': ["address"],
+        '08 Валюта': ["currency"],
+        '13 Обязанности': ["vacancyRichText"],
+        '14 Подробнее здесь (URL)': ["link"]
+    }
+    keys_2 = {
+        '03 Работодатель': ["client", "title"],
+        '09 График работы': ["place_of_work", "title"],
+        '10 Занятость': ["type_of_work", "title"],
+        '11 Опыт работы': ["experience", "title"],
+        '12 Требования к соискателю': ["education", "title"],
+    }
+    vacancy = {
+        '01 Дата публикации': time.strftime("%Y-%m-%d", time.gmtime(float(value["date_published"]))),
+        '02 Должность': value["profession"] + '.',
+        '06 Зарплата от': reference.one_level_salary(value, "payment_from"),
+        '07 Зарплата до': reference.one_level_salary(value, "payment_to"),
+    }
+    for key_0, key in keys_1.items():
+        reference.one_level(value, vacancy, key_0, key[0])
+    for key_0, key in keys_2.items():
+        reference.two_levels(value, vacancy, key_0, key[0], key[1])
+    reference.three_levels(value, vacancy, '04 Населённый пункт', "client", "town", "title")
+    vacancy[KEY_ID] = str(value['id'])
+    return vacancy
+
+
+def main() -> None:
+    # 2000 вакансий hh.ru и 500 вакансий superjob.ru - максимум для одного запроса к сервисам.
+    items_hh = [make_vacancy_hh(num) for num in range(2000)]
+    items_sj = [make_vacancy_sj(num) for num in range(500)]
+    for title, items, old, extractor in (('hh.ru', items_hh, mixin_hh, EXTRACTOR_HH),
+                                         ('superjob.ru', items_sj, mixin_sj, EXTRACTOR_SJ)):
+        assert [old(item) for item in items] == [extractor.extract(item) for item in items]
+        old_time = min(timeit.repeat(lambda: [old(item) for item in items], number=1, repeat=REPEAT))
+        new_time = min(timeit.repeat(lambda: [extractor.extract(item) for item in items], number=1, repeat=REPEAT))
+        print(f'{title}, {len(items)} вакансий: прежнее заполнение {old_time * 1000:.1f} мс, '
+              f'FieldExtractor {new_time * 1000:.1f} мс (быстрее в {old_time / new_time:.1f} раза).')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+# Время расчёта статистики зарплат на синтетическом наборе вакансий.
+# Запуск из корня проекта: python -m benchmarks.bench_salary_stats [количество вакансий]
+import random
+import sys
+import time
+
+from src.utils.analytics import SalaryStats, GROUPS
+from src.utils.vacancy import Vacancy
+
+# Количество вакансий в синтетическом наборе данных.
+RECORDS = 300_000
+
+
+def make_vacancies(size: int) -> list:
+    """
+    Синтетический набор вакансий: 80 населённых пунктов, 2000 работодателей, четверть - без зарплаты.
+    :param size: Количество вакансий, int.
+    :return: Список вакансий, list[Vacancy].
+    """
+    rnd = random.Random(0)
+    schedules = ['Полный день', 'Сменный график', 'Удаленная работа', 'Гибкий график']
+    experience = ['Нет опыта', 'От 1 года до 3 лет', 'От 3 до 6 лет', 'Более 6 лет']
+    vacancies = []
+    for _ in range(size):
+        # Четверть вакансий - без зарплаты.
+        salary = rnd.randrange(20_000, 300_000, 1000) if rnd.random() < 0.75 else 0
+        vacancies.append(Vacancy(published='2023-11-05', name='Водитель.', salary_from=salary, salary_to=salary * 2,
+                                 currency='RUR',
+                                 area=f'Город {rnd.randrange(80)}', employer=f'Работодатель {rnd.randrange(2000)}',
+                                 schedule=rnd.choice(schedules), experience=rnd.choice(experience)))
+    return vacancies
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else RECORDS
+    vacancies = make_vacancies(count)
+
+    start = time.perf_counter()
+    stats = SalaryStats(vacancies)
+    print(f'Построение столбцов: {len(vacancies)} вакансий, {len(stats)} с зарплатой, '
+          f'{time.perf_counter() - start:.2f} сек.')
+
+    start = time.perf_counter()
+    stats.summary()
+    stats.histogram()
+    print(f'Сводная статистика и гистограмма: {time.perf_counter() - start:.2f} сек.')
+
+    for group in GROUPS:
+        start = time.perf_counter()
+        groups = stats.group_by(group)
+        print(f'Группировка {group}: {len(groups)} групп, {time.perf_counter() - start:.2f} сек.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+# Сравнение полной сортировки, выборки первых N вакансий с помощью кучи и таблицы VacancyTable.
+# Запуск из корня проекта: python -m benchmarks.bench_top_n
+import heapq
+import random
+import time
+from datetime import datetime
+
+from src.utils.constants import KEY_DAY, KEY_SALARY_MEAN
+from src.utils.table import VacancyTable
+from src.utils.vacancy import Vacancy
+
+# Количество вакансий в синтетическом наборе данных.
+RECORDS = 100_000
+# Количество вакансий, которое запрашивает пользователь.
+COUNTS = (5, 50, 500)
+
+
+def make_records(size: int) -> list:
+    """
+    Синтетический набор вакансий со случайными датами публикации и зарплатами.
+    Служебные поля для сортировки добавляются так же, как при обработке ответов API.
+    :param size: Количество вакансий, int.
+    :return: Список словарей с вакансиями, list.
+    """
+    rnd = random.Random(0)
+    records = [{'01 Дата публикации': f'2023-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}',
+                '06 Зарплата от': rnd.randrange(0, 300_000, 5000),
+                '07 Зарплата до': rnd.randrange(0, 500_000, 5000), '02 Должность': 'Водитель.',
+                '08 Валюта': 'RUR'} for _ in range(size)]
+    return [Vacancy.from_dict(record).to_dict() for record in records]
+
+
+def timed(func, *args) -> tuple:
+    """
+    Время выполнения функции.
+    :return: Результат функции и время выполнения, сек., tuple.
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    data = make_records(RECORDS)
+    table = VacancyTable.from_vacancies(data)
+    print(f'Вакансий: {RECORDS}')
+    for count in COUNTS:
+        # Прежний вариант: разбор даты через strptime и полная сортировка.
+        old_date, old_date_time = timed(lambda: sorted(data, key=lambda x: datetime.strptime(
+            x['01 Дата публикации'], '%Y-%m-%d'), reverse=True)[:count])
+        new_date, new_date_time = timed(heapq.nlargest, count, data, lambda x: x[KEY_DAY])
+        old_salary, old_salary_time = timed(lambda: sorted(data, key=lambda x: x[KEY_SALARY_MEAN], reverse=True)[:count])
+        new_salary, new_salary_time = timed(heapq.nlargest, count, data, lambda x: x[KEY_SALARY_MEAN])
+        table_salary, table_salary_time = timed(lambda: [vacancy.to_dict()
+                                                         for vacancy in table.top(count, 'salary')])
+        assert old_date == new_date and old_salary == new_salary == table_salary
+
+        print(f'N={count:>4}: по дате {old_date_time:.3f} -> {new_date_time:.3f} сек., '
+              f'по зарплате {old_salary_time:.3f} -> {new_salary_time:.3f} сек. '
+              f'(таблица VacancyTable - {table_salary_time:.3f} сек.)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+# Сравнение памяти, занимаемой вакансиями в виде словарей и записей Vacancy.
+# Запуск из корня проекта: python -m benchmarks.bench_vacancy_memory [количество синтетических вакансий]
+import gc
+import sys
+import tracemalloc
+
+from src.utils.vacancies import VacHH, VacSJ
+from src.utils.vacancy import Vacancy
+from tests.stub_server import make_vacancy_hh, make_vacancy_sj
+
+# Количество вакансий в синтетическом наборе данных.
+RECORDS = 1_000_000
+
+
+def measure(build) -> tuple:
+    """
+    Объём памяти, выделенной при построении структуры и не освобождённой после него.
+    :param build: Функция построения структуры, callable.
+    :return: Структура и объём памяти, байт, tuple.
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def report(title: str, vacancies: list) -> None:
+    """
+    Выводит размер одной вакансии в виде записи Vacancy и в виде словаря.
+    Значения полей у обоих вариантов общие, поэтому сравнивается только память самих контейнеров.
+    :param title: Название набора данных, str.
+    :param vacancies: Список вакансий, list[Vacancy].
+    """
+    records, records_size = measure(lambda: [Vacancy(**{field: getattr(vacancy, field) for field in Vacancy.__slots__})
+                                             for vacancy in vacancies])
+    dicts, dicts_size = measure(lambda: [vacancy.to_dict() for vacancy in vacancies])
+    count = len(vacancies)
+    print(f'{title}: {count} вакансий. Словарь: {dicts_size / count:.0f} байт, '
+          f'Vacancy: {records_size / count:.0f} байт на вакансию '
+          f'(в {dicts_size / records_size:.1f} раза меньше).')
+    del records, dicts
+
+
+def main() -> None:
+    # Вакансии в том виде, в котором они получаются при обработке ответов API: 2000 с hh.ru и 500 с superjob.ru.
+    vacancies = VacHH('водитель').parse_page({'items': [make_vacancy_hh(num) for num in range(2000)]})
+    vacancies += VacSJ('водитель').parse_page({'objects': [make_vacancy_sj(num) for num in range(500)]})
+    report('hh.ru + superjob.ru', vacancies)
+
+    # Синтетический набор: одна и та же вакансия, повторённая нужное количество раз.
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else RECORDS
+    report('Синтетический набор', vacancies[:1] * count)
+
+
+if __name__ == '__main__':
+    main()
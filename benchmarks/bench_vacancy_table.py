@@ -0,0 +1,90 @@
+# Сравнение списка словарей вакансий и таблицы VacancyTable: память, отбор и первые N.
+# Запуск из корня проекта: python -m benchmarks.bench_vacancy_table [количество вакансий]
+import gc
+import heapq
+import random
+import sys
+import time
+import tracemalloc
+
+from src.utils.constants import KEY_DAY, KEY_SALARY_MEAN
+from src.utils.table import VacancyTable
+from src.utils.vacancy import Vacancy
+
+# Количество вакансий в синтетическом наборе данных.
+RECORDS = 200_000
+# Количество вакансий, которое запрашивает пользователь.
+COUNT = 50
+
+
+def make_dicts(size: int) -> list:
+    """
+    Синтетический набор вакансий в формате хранилищ (словари с подписями).
+    :param size: Количество вакансий, int.
+    :return: Список словарей, list.
+    """
+    rnd = random.Random(0)
+    schedules = ['Полный день', 'Сменный график', 'Удаленная работа', 'Гибкий график']
+    vacancies = []
+    for num in range(size):
+        salary = rnd.randrange(0, 300_000, 1000)
+        vacancies.append(Vacancy(published=f'2023-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}',
+                                 name=f'Водитель {num}.', salary_from=salary, salary_to=salary * 2, currency='RUR',
+                                 area=f'Город {rnd.randrange(80)}', employer=f'Работодатель {rnd.randrange(2000)}',
+                                 schedule=rnd.choice(schedules), employment='Полная занятость',
+                                 experience='Нет опыта', vacancy_id=str(num),
+                                 url=f'https://hh.ru/vacancy/{num}').to_dict())
+    return vacancies
+
+
+def measure(func) -> tuple:
+    """
+    Объём памяти, оставшейся занятой результатом функции.
+    :param func: Функция без параметров, callable.
+    :return: Результат и память, байт, tuple.
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def timed(func) -> tuple:
+    """
+    Время выполнения функции.
+    :param func: Функция без параметров, callable.
+    :return: Результат и время, сек., tuple.
+    """
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else RECORDS
+    dicts = make_dicts(count)
+
+    # Прежний способ: записи из словарей, отбор и сортировка по списку.
+    records, records_size = measure(lambda: [Vacancy.from_dict(data) for data in dicts])
+    table, table_size = measure(lambda: VacancyTable.from_vacancies(dicts))
+    print(f'{count} вакансий. Память: список записей {records_size / 2 ** 20:.1f} МБ, '
+          f'таблица {table_size / 2 ** 20:.1f} МБ.')
+
+    old, old_time = timed(lambda: heapq.nlargest(
+        COUNT, [vacancy for vacancy in records if vacancy.schedule == 'Полный день' and vacancy.salary_rub >= 100_000],
+        key=lambda vacancy: vacancy[KEY_SALARY_MEAN]))
+    new, new_time = timed(lambda: list(table.filter(schedule='Полный день', salary_min=100_000).top(COUNT, 'salary')))
+    assert old == new
+    print(f'Отбор по графику и зарплате, первые {COUNT} по зарплате: список {old_time:.3f} сек., '
+          f'таблица {new_time:.3f} сек.')
+
+    old, old_time = timed(lambda: sorted(records, key=lambda vacancy: vacancy[KEY_DAY], reverse=True))
+    new, new_time = timed(lambda: table.sort('date'))
+    assert old[:COUNT] == list(new[:COUNT])
+    print(f'Полная сортировка по дате: список {old_time:.3f} сек., таблица {new_time:.3f} сек.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+# Пакетное выполнение запросов из файла (без диалога с пользователем).
+# Пример файла с запросами (CSV, первая строка - заголовок):
+#     service,keyword,region,salary,only_with_salary,sort,count
+#     hh,водитель,Ростов-на-Дону,50000,1,salary,100
+#     all,python,Москва,,,date,
+import argparse
+import sys
+
+from src.utils.batch import BatchRunner
+from src.utils.constants import PATH_BATCH, BATCH_WORKERS
+from src.utils.query_cache import get_cache
+from src.utils.utilities import loading_regions_hh, loading_regions_sj
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Пакетный поиск вакансий по запросам из файла.')
+    parser.add_argument('queries', help='файл CSV с запросами')
+    parser.add_argument('-o', '--output', default=PATH_BATCH, help='папка для файлов с результатами')
+    parser.add_argument('-w', '--workers', type=int, default=BATCH_WORKERS, help='количество одновременных запросов')
+    parser.add_argument('--no-cache', action='store_true', help='не использовать кэш результатов поиска')
+    args = parser.parse_args()
+
+    # Загружаем справочники регионов.
+    loading_regions_hh()  # hh.ru.
+    loading_regions_sj()  # superjob.ru.
+
+    # Читаем запросы из файла.
+    try:
+        queries = BatchRunner.read_queries(args.queries)
+    except (OSError, ValueError) as e:
+        sys.exit(f'Ошибка при чтении файла с запросами. {e}')
+
+    # Выполняем запросы и записываем результаты.
+    runner = BatchRunner(args.output, args.workers, cache=None if args.no_cache else get_cache())
+    rows = runner.run(queries)
+    errors = [row for row in rows if row['error']]
+    print(f'Выполнено запросов: {len(rows) - len(errors)} из {len(rows)}. Результаты в папке {args.output}.')
+    # Количество и продолжительность обращений к сервисам.
+    print(runner.session.report())
+    for row in rows:
+        if row['note']:
+            print(f"Запрос {row['num']} ({row['service']}, {row['keyword']}): {row['note']}")
+    for row in errors:
+        print(f"Запрос {row['num']} ({row['service']}, {row['keyword']}): {row['error']}")
+    sys.exit(1 if errors else 0)
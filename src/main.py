@@ -15,44 +15,33 @@ if __name__ == '__main__':
     # Выбираем сервис для получения данных или завершаем работу программы.
     num_vak = service_selection(name, service_menu_selection())
 
-    # Блок для работы с ресурсами HeadHunter (hh.ru).
+    # Выбираем id региона/населённого пункта для получения данных о вакансиях.
     if num_vak == 1:
-        # Выбираем id региона/населённого пункта для получения данных о вакансиях на hh.ru.
+        # HeadHunter (hh.ru).
+        service = 'hh'
+        area_id = choosing_region('hh', name, ID_RUSSIA_HH)
+    elif num_vak == 3:
+        # Оба сервиса: регион выбирается по справочнику hh.ru,
+        # для superjob.ru используется соответствующий ему регион.
+        service = 'all'
         area_id = choosing_region('hh', name, ID_RUSSIA_HH)
-
-        # Блок получения данных по запросу пользователя.
-        # Получаем название должности, которую ищет пользователь.
-        name_vak = name_vak_word(name)
-
-        # Получаем сведения об отображении вакансий с зарплатой или всех имеющихся.
-        only_with_salary = show_only_with_salary(name)
-
-        # Получаем сведения о размере желаемой заработной платы.
-        salary = looking_salary(only_with_salary)
-
-        # Получаем данные о методе сортировки: 1 - по датам, 2 - по размеру зарплаты.
-        sort_method = choose_sort_method(only_with_salary, name)
-
-        # Выводим данные о вакансиях на экран.
-        displaying_jobs_screen('hh', name, name_vak, area_id, only_with_salary, salary, sort_method)
-
-    # Блок для работы с ресурсами SuperJob (superjob.ru).
     else:
-        # Выбираем id региона/населённого пункта для получения данных о вакансиях на superjob.ru.
+        # SuperJob (superjob.ru).
+        service = 'sj'
         area_id = choosing_region('sj', name, ID_RUSSIA_SJ)
 
-        # Блок получения данных по запросу пользователя.
-        # Получаем название должности, которую ищет пользователь.
-        name_vak = name_vak_word(name)
+    # Блок получения данных по запросу пользователя.
+    # Получаем название должности, которую ищет пользователь.
+    name_vak = name_vak_word(name)
 
-        # Получаем сведения об отображении вакансий с зарплатой или всех имеющихся.
-        only_with_salary = show_only_with_salary(name)
+    # Получаем сведения об отображении вакансий с зарплатой или всех имеющихся.
+    only_with_salary = show_only_with_salary(name)
 
-        # Получаем сведения о размере желаемой заработной платы.
-        salary = looking_salary(only_with_salary)
+    # Получаем сведения о размере желаемой заработной платы.
+    salary = looking_salary(only_with_salary)
 
-        # Получаем данные о методе сортировки: 1 - по датам, 2 - по размеру зарплаты.
-        sort_method = choose_sort_method(only_with_salary, name)
+    # Получаем данные о методе сортировки: 1 - по датам, 2 - по размеру зарплаты.
+    sort_method = choose_sort_method(only_with_salary, name)
 
-        # Выводим данные о вакансиях на экран.
-        displaying_jobs_screen('sj', name, name_vak, area_id, only_with_salary, salary, sort_method)
+    # Выводим данные о вакансиях на экран.
+    displaying_jobs_screen(service, name, name_vak, area_id, only_with_salary, salary, sort_method)
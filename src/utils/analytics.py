@@ -0,0 +1,150 @@
+from array import array
+from bisect import bisect_right
+
+from src.utils.constants import STATS_PERCENTILES, STATS_BINS
+from src.utils.table import VacancyTable
+from src.utils.words import coord_words_num
+
+# Поля, по которым группируется статистика: {название группировки: поле записи Vacancy}.
+GROUPS = {
+    'region': 'area',
+    'employer': 'employer',
+    'schedule': 'schedule',
+    'experience': 'experience',
+}
+
+
+class SalaryStats:
+    """
+    Статистика зарплат по найденным вакансиям.
+    Данные берутся из таблицы вакансий VacancyTable: средние зарплаты в рублях - массив целых чисел,
+    поля группировки - массивы кодов и значения по кодам.
+    Учитываются только вакансии с указанной зарплатой.
+    """
+
+    def __init__(self, vacancies) -> None:
+        # Столбцы берутся из таблицы вакансий: строки с указанной зарплатой.
+        table = vacancies if isinstance(vacancies, VacancyTable) else VacancyTable.from_vacancies(vacancies)
+        table = table.filter(with_salary=True)
+        self.salary = array('q', table.column('salary_rub'))  # Средние зарплаты в рублях
+        self.codes = {}  # {группировка: коды значений поля}
+        self.values = {}  # {группировка: значения поля по кодам}
+        for group, field in GROUPS.items():
+            self.codes[group], values = table.codes(field)
+            self.values[group] = [value or 'нет данных.' for value in values]
+        self.__order = None  # Номера вакансий по возрастанию зарплаты (вычисляются при первом обращении)
+
+    @staticmethod
+    def percentile(values, percent: float) -> float:
+        """
+        Процентиль отсортированной последовательности с линейной интерполяцией между соседними значениями
+        (как numpy.percentile по умолчанию).
+        :param values: Отсортированные значения, array | list.
+        :param percent: Процент от 0 до 100, float.
+        :return: Значение процентиля, float.
+        """
+        rank = (len(values) - 1) * percent / 100
+        low = int(rank)
+        high = min(low + 1, len(values) - 1)
+        return values[low] + (values[high] - values[low]) * (rank - low)
+
+    @classmethod
+    def describe(cls, values, percentiles: tuple = STATS_PERCENTILES) -> dict:
+        """
+        Сводная статистика по отсортированной последовательности зарплат.
+        :param values: Отсортированные зарплаты, array | list.
+        :param percentiles: Процентили, tuple.
+        :return: Словарь со статистикой (count, min, max, mean, median, percentiles), dict.
+        """
+        if not values:
+            return {'count': 0}
+        return {
+            'count': len(values),
+            'min': values[0],
+            'max': values[-1],
+            'mean': round(sum(values) / len(values)),
+            'median': round(cls.percentile(values, 50)),
+            'percentiles': {percent: round(cls.percentile(values, percent)) for percent in percentiles},
+        }
+
+    def summary(self, percentiles: tuple = STATS_PERCENTILES) -> dict:
+        """
+        Статистика по всем вакансиям с указанной зарплатой.
+        :param percentiles: Процентили, tuple.
+        :return: Словарь со статистикой, dict.
+        """
+        return self.describe(sorted(self.salary), percentiles)
+
+    def group_by(self, group: str, percentiles: tuple = STATS_PERCENTILES, min_count: int = 1) -> dict:
+        """
+        Статистика по группам вакансий.
+        Номера вакансий сортируются по зарплате один раз для всех группировок,
+        после чего зарплаты раскладываются по группам за один проход и остаются отсортированными.
+        :param group: Группировка: 'region', 'employer', 'schedule' или 'experience', str.
+        :param percentiles: Процентили, tuple.
+        :param min_count: Минимальное количество вакансий в группе, int.
+        :return: {значение поля: статистика} по убыванию количества вакансий, dict.
+        """
+        if group not in GROUPS:
+            raise ValueError(f'Группировка {group} не поддерживается.')
+        codes, salary = self.codes[group], self.salary
+        if self.__order is None:
+            self.__order = sorted(range(len(salary)), key=salary.__getitem__)
+        buckets = [[] for _ in self.values[group]]
+        for num in self.__order:
+            buckets[codes[num]].append(salary[num])
+        result = {self.values[group][code]: self.describe(values, percentiles)
+                  for code, values in enumerate(buckets) if len(values) >= min_count}
+        return dict(sorted(result.items(), key=lambda item: -item[1]['count']))
+
+    def histogram(self, bins: int = STATS_BINS) -> list:
+        """
+        Гистограмма зарплат: интервалы одинаковой ширины от минимальной до максимальной зарплаты.
+        :param bins: Количество интервалов, int.
+        :return: Список кортежей (начало интервала, конец интервала, количество вакансий), list.
+        """
+        if not self.salary:
+            return []
+        low, high = min(self.salary), max(self.salary)
+        width = (high - low) / bins or 1
+        edges = [low + width * num for num in range(1, bins)]
+        counts = [0] * bins
+        for salary in self.salary:
+            counts[bisect_right(edges, salary)] += 1
+        bounds = [low] + [round(edge) for edge in edges] + [high]
+        return [(bounds[num], bounds[num + 1], counts[num]) for num in range(bins)]
+
+    def report(self, group: str = None, top: int = 5) -> str:
+        """
+        Текст со статистикой зарплат для вывода на экран.
+        :param group: Группировка (None - без группировки), str.
+        :param top: Количество самых многочисленных групп, int.
+        :return: Текст, str.
+        """
+        if not self.salary:
+            return 'Зарплата не указана ни в одной из найденных вакансий.'
+        lines = [self.format_stats('Зарплата (руб.)', self.summary())]
+        if group is not None:
+            for value, stats in list(self.group_by(group).items())[:top]:
+                lines.append(self.format_stats(f'  {value}', stats))
+        return '\n'.join(lines)
+
+    @staticmethod
+    def format_stats(title: str, stats: dict) -> str:
+        """
+        Строка со статистикой зарплат.
+        :param title: Заголовок, str.
+        :param stats: Статистика (результат describe), dict.
+        :return: Строка, str.
+        """
+        return (f"{title}: {coord_words_num(stats['count'])} с зарплатой, медиана {stats['median']}, "
+                f"от {stats['min']} до {stats['max']}, в среднем {stats['mean']}.")
+
+    def __len__(self) -> int:
+        return len(self.salary)
+
+    def __str__(self) -> str:
+        return f'Статистика зарплат по {len(self.salary)} вакансиям'
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.salary)})"
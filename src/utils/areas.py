@@ -1,9 +1,12 @@
 import json
 import os
+import time
 from abc import ABC, abstractmethod
-import requests
 from src.utils.constants import PATH_ARE_HH, PATH_VAK_DIR_HH, PATH_VAK_DIR_SJ, SUPERJOB_API_KEY, PATH_ARE_SJ, \
-    ID_RUSSIA_SJ, ID_RUSSIA_HH, URL_AREAS_HH, URL_AREAS_SJ
+    ID_RUSSIA_SJ, ID_RUSSIA_HH, URL_AREAS_HH, URL_AREAS_SJ, AREAS_TTL
+from src.utils.areas_index import AreasIndex
+from src.utils.areas_search import AreasSearch
+from src.utils.network import HttpSession, RateLimiter, get_session, get_rate_limiter, check_response
 
 
 class Areas(ABC):
@@ -20,6 +23,10 @@ class Areas(ABC):
     def extract_area_id(self):
         pass
 
+    @abstractmethod
+    def search_areas(self, limit: int = 5) -> list:
+        pass
+
     @abstractmethod
     def __str__(self):
         pass
@@ -56,6 +63,61 @@ class Mixin:
             content = json.load(file)
         return content
 
+    @staticmethod
+    def cache_is_fresh(path: str, ttl: float) -> bool:
+        """
+        Проверяет, загружен ли справочник недавно (не ранее ttl секунд назад).
+        :param path: Полное имя файла справочника, str.
+        :param ttl: Срок актуальности справочника, сек., float.
+        :return: True, если файл существует и ещё актуален, bool.
+        """
+        return os.path.isfile(path) and time.time() - os.path.getmtime(path) < ttl
+
+    @staticmethod
+    def meta_path(path: str) -> str:
+        """
+        Полное имя файла со служебными данными справочника (ETag, Last-Modified).
+        :param path: Полное имя файла справочника, str.
+        :return: Полное имя файла, str.
+        """
+        return os.path.splitext(path)[0] + '_meta.json'
+
+    def conditional_headers(self, path: str) -> dict:
+        """
+        Заголовки условного запроса: сервис ответит 304, если справочник не изменился.
+        :param path: Полное имя файла справочника, str.
+        :return: Заголовки If-None-Match / If-Modified-Since, dict.
+        """
+        headers = {}
+        if os.path.isfile(path) and os.path.isfile(self.meta_path(path)):
+            meta = self.load_json(self.meta_path(path))
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def save_meta(self, path: str, response) -> None:
+        """
+        Сохраняет ETag и Last-Modified ответа сервиса для последующих условных запросов.
+        :param path: Полное имя файла справочника, str.
+        :param response: Ответ сервиса, requests.Response.
+        :return: Ничего не возвращает.
+        """
+        self.save_to_json({'etag': response.headers.get('ETag'),
+                           'last_modified': response.headers.get('Last-Modified')}, self.meta_path(path))
+
+    @staticmethod
+    def renew_files(*paths: str) -> None:
+        """
+        Обновляет время изменения существующих файлов (в порядке перечисления).
+        :param paths: Полные имена файлов, str.
+        :return: Ничего не возвращает.
+        """
+        for path in paths:
+            if os.path.isfile(path):
+                os.utime(path)
+
     @staticmethod
     def delete_files_in_folder(folder_path) -> None:
         """
@@ -76,7 +138,8 @@ class Mixin:
 
 class AreasHH(Areas, Mixin):
     def __init__(self, url: str = URL_AREAS_HH, area: str = 'Россия', path_vak_dir_hh: str = PATH_VAK_DIR_HH,
-                 path_are_hh: str = PATH_ARE_HH) -> None:
+                 path_are_hh: str = PATH_ARE_HH, session: HttpSession = None,
+                 rate_limiter: RateLimiter = None) -> None:
         self.__url = url  # Поиск регионов в России
         self.__id = ID_RUSSIA_HH  # По-умолчанию Россия
         self.__area = area.lower()
@@ -84,37 +147,59 @@ class AreasHH(Areas, Mixin):
         self.__path_vak_dir_hh = path_vak_dir_hh
         # Путь к файлу, в котором хранятся данные о регионах в России, полученных с HH.ru.
         self.__path_are_hh = path_are_hh
+        # Пул HTTP-соединений.
+        self.__session = session or get_session()
+        # Ограничитель частоты запросов (по умолчанию - общий для всех запросов к сервису).
+        self.__rate_limiter = rate_limiter or get_rate_limiter(url)
 
-    def request_to_api(self) -> None:
+    def request_to_api(self, ttl: float = AREAS_TTL) -> None:
         """
         Получение запроса о регионах в России по api.
+        Справочник загружается, только если сохранённый файл старше ttl секунд
+        и изменился на сервисе с момента последней загрузки.
+        :param ttl: Срок актуальности сохранённого справочника, сек., float.
         :return: Сохраняет данные о регионах в json-файл.
         """
-        # Удаляем старый файл с данными о регионах areas.json
-        self.delete_files_in_folder(self.__path_vak_dir_hh)
+        # Справочник загружен недавно, используем файл на диске.
+        if self.cache_is_fresh(self.__path_are_hh, ttl):
+            return
         try:
-            # Посылаем запрос к API, преобразуем его в словарь
-            data_prof = json.loads(requests.get(url=self.__url).text)
-            # Сохраняем данные в json-файл
+            # Посылаем условный запрос к API
+            self.__rate_limiter.wait()
+            response = self.__session.get(url=self.__url, headers=self.conditional_headers(self.__path_are_hh))
+            check_response(response, self.__rate_limiter)
+            # Справочник не изменился, продлеваем срок актуальности файла на диске.
+            if response.status_code == 304:
+                self.renew_files(self.__path_are_hh, AreasIndex.index_path(self.__path_are_hh))
+                return
+            # Преобразуем ответ в словарь
+            data_prof = json.loads(response.text)
+            # Сохраняем данные в json-файл, заменяя старый
+            os.makedirs(self.__path_vak_dir_hh, exist_ok=True)
             self.save_to_json(data_prof, self.__path_are_hh)
+            self.save_meta(self.__path_are_hh, response)
+            # Строим индекс для быстрого поиска id по названию
+            AreasIndex.from_hh(data_prof).save(AreasIndex.index_path(self.__path_are_hh))
         except Exception as e:
             raise Exception(f'Ошибка при получении данных с {self.__url}. {e}')
 
     def extract_area_id(self) -> int:
         """Получение id региона (города)"""
-        areas = self.load_json(self.__path_are_hh)
-        # Ищем id указанного региона/населённого пункта.
-        for area in areas['areas']:
-            # Регион
-            if str(area['name']).lower() == self.__area:
-                self.__id = int(area['id'])
-            else:
-                # Населённый пункт
-                for city in area['areas']:
-                    if city['name'].lower() == self.__area:
-                        self.__id = int(city['id'])
+        # Ищем id указанного региона/населённого пункта по индексу справочника.
+        area_id = AreasIndex.for_directory(self.__path_are_hh, AreasIndex.from_hh).find(self.__area)
+        if area_id is not None:
+            self.__id = area_id
         return self.__id
 
+    def search_areas(self, limit: int = 5) -> list:
+        """
+        Нечёткий поиск регионов/населённых пунктов, похожих на указанное название.
+        :param limit: Максимальное количество результатов, int.
+        :return: Список кортежей (название, id, оценка сходства от 0 до 1) по убыванию оценки, list.
+        """
+        index = AreasIndex.for_directory(self.__path_are_hh, AreasIndex.from_hh)
+        return AreasSearch.for_index(index).search(self.__area, limit)
+
     def __str__(self) -> str:
         return f'Получение справочника регионов/городов России с сервиса hh.ru по API {self.__url}'
 
@@ -125,7 +210,8 @@ class AreasHH(Areas, Mixin):
 
 class AreasSJ(Areas, Mixin):
     def __init__(self, url: str = URL_AREAS_SJ, area: str = 'Россия', path_vak_dir_sj: str = PATH_VAK_DIR_SJ,
-                 path_are_sj: str = PATH_ARE_SJ) -> None:
+                 path_are_sj: str = PATH_ARE_SJ, session: HttpSession = None,
+                 rate_limiter: RateLimiter = None) -> None:
         self.__url = url  # Поиск регионов в России
         self.__id = ID_RUSSIA_SJ  # По-умолчанию Россия
         self.__area = area.lower()
@@ -133,46 +219,60 @@ class AreasSJ(Areas, Mixin):
         self.__path_vak_dir_sj = path_vak_dir_sj
         # Путь к файлу, в котором хранятся данные о регионах в России, полученных с superjob.ru.
         self.__path_are_sj = path_are_sj
+        # Пул HTTP-соединений.
+        self.__session = session or get_session()
+        # Ограничитель частоты запросов (по умолчанию - общий для всех запросов к сервису).
+        self.__rate_limiter = rate_limiter or get_rate_limiter(url)
 
-    def request_to_api(self) -> None:
+    def request_to_api(self, ttl: float = AREAS_TTL) -> None:
         """
         Получение запроса о регионах в России по api.
+        Справочник загружается, только если сохранённый файл старше ttl секунд
+        и изменился на сервисе с момента последней загрузки.
+        :param ttl: Срок актуальности сохранённого справочника, сек., float.
         :return: Сохраняет данные о регионах в json-файл.
         """
-        # Удаляем старый файл с данными о регионах areas.json
-        self.delete_files_in_folder(self.__path_vak_dir_sj)
+        # Справочник загружен недавно, используем файл на диске.
+        if self.cache_is_fresh(self.__path_are_sj, ttl):
+            return
         try:
-            # Посылаем запрос к API, преобразуем его в словарь
-            headers = {'X-Api-App-Id': SUPERJOB_API_KEY}
-            data_prof = json.loads(requests.get(url=self.__url, headers=headers).text)
-            # data_prof = json.loads(requests.get(url=self.__url).text)
-            # Сохраняем данные в json-файл только регионы и города России
+            # Посылаем условный запрос к API
+            headers = {'X-Api-App-Id': SUPERJOB_API_KEY, **self.conditional_headers(self.__path_are_sj)}
+            self.__rate_limiter.wait()
+            response = self.__session.get(url=self.__url, headers=headers)
+            check_response(response, self.__rate_limiter)
+            # Справочник не изменился, продлеваем срок актуальности файла на диске.
+            if response.status_code == 304:
+                self.renew_files(self.__path_are_sj, AreasIndex.index_path(self.__path_are_sj))
+                return
+            # Преобразуем ответ в словарь
+            data_prof = json.loads(response.text)
+            # Сохраняем данные в json-файл только регионы и города России, заменяя старый
+            os.makedirs(self.__path_vak_dir_sj, exist_ok=True)
             self.save_to_json(data_prof[0], self.__path_are_sj)
+            self.save_meta(self.__path_are_sj, response)
+            # Строим индекс для быстрого поиска id по названию
+            AreasIndex.from_sj(data_prof[0]).save(AreasIndex.index_path(self.__path_are_sj))
         except Exception as e:
             raise Exception(f'Ошибка при получении данных с {self.__url}. {e}')
 
     def extract_area_id(self) -> int:
         """Получение id региона (города)"""
-        areas = self.load_json(self.__path_are_sj)
-
-        # Ищем id указанного региона/населённого пункта.
-        # Города федерального значения
-        for area in areas['towns']:
-            if str(area['title']).lower() == self.__area:
-                self.__id = int(area['id'])
-
-        # Остальные регионы и города России
-        for area in areas['regions']:
-            # Регион
-            if str(area['title']).lower() == self.__area:
-                self.__id = int(area['id'])
-            else:
-                # Населённый пункт
-                for city in area['towns']:
-                    if city['title'].lower() == self.__area:
-                        self.__id = int(city['id'])
+        # Ищем id указанного региона/населённого пункта по индексу справочника.
+        area_id = AreasIndex.for_directory(self.__path_are_sj, AreasIndex.from_sj).find(self.__area)
+        if area_id is not None:
+            self.__id = area_id
         return self.__id
 
+    def search_areas(self, limit: int = 5) -> list:
+        """
+        Нечёткий поиск регионов/населённых пунктов, похожих на указанное название.
+        :param limit: Максимальное количество результатов, int.
+        :return: Список кортежей (название, id, оценка сходства от 0 до 1) по убыванию оценки, list.
+        """
+        index = AreasIndex.for_directory(self.__path_are_sj, AreasIndex.from_sj)
+        return AreasSearch.for_index(index).search(self.__area, limit)
+
     def __str__(self) -> str:
         return f'Получение справочника регионов/городов России с сервиса superjob.ru по API {self.__url}'
 
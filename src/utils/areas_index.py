@@ -0,0 +1,194 @@
+import json
+import os
+import threading
+
+
+class AreasIndex:
+    """
+    Компактный индекс справочника регионов/населённых пунктов.
+    Содержит хеш-таблицу "нормализованное название - id" и иерархию "регион - населённые пункты",
+    строится один раз после загрузки справочника и хранится рядом с ним.
+    """
+
+    # Загруженные в память индексы: {полное имя файла индекса: (время изменения файла, индекс)}.
+    __loaded = {}
+    __lock = threading.Lock()
+
+    def __init__(self, names: dict = None, regions: dict = None, titles: dict = None,
+                 region_titles: dict = None) -> None:
+        self.names = names or {}  # {нормализованное название: id}
+        self.regions = regions or {}  # {id региона: [id населённых пунктов]}
+        # Названия в справочнике. У superjob.ru id регионов и населённых пунктов могут совпадать,
+        # поэтому названия хранятся раздельно.
+        self.titles = titles or {}  # {id населённого пункта: название}
+        self.region_titles = region_titles or {}  # {id региона: название}
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """
+        Приводит название к виду, используемому для поиска: нижний регистр, без пробелов по краям.
+        :param name: Название региона/населённого пункта, str.
+        :return: Нормализованное название, str.
+        """
+        return str(name).lower().strip()
+
+    @staticmethod
+    def index_path(path_are: str) -> str:
+        """
+        Полное имя файла индекса, хранящегося рядом со справочником.
+        :param path_are: Полное имя файла справочника, str.
+        :return: Полное имя файла индекса, str.
+        """
+        return os.path.splitext(path_are)[0] + '_index.json'
+
+    def add(self, area_id: int, title: str, region_id: int = None) -> None:
+        """
+        Добавляет населённый пункт в индекс.
+        При совпадении названий сохраняется id, добавленный последним.
+        :param area_id: id населённого пункта, int.
+        :param title: Название, str.
+        :param region_id: id региона, к которому относится населённый пункт, int.
+        :return: Ничего не возвращает.
+        """
+        self.names[self.normalize(title)] = area_id
+        self.titles[area_id] = title
+        if region_id is not None:
+            self.regions.setdefault(region_id, []).append(area_id)
+
+    def add_region(self, region_id: int, title: str, cities: list) -> None:
+        """
+        Добавляет регион и его населённые пункты.
+        Населённый пункт, название которого совпадает с названием региона, в поиск не попадает:
+        по такому названию находится регион.
+        :param region_id: id региона, int.
+        :param title: Название региона, str.
+        :param cities: Населённые пункты региона [(id, название), ...], list.
+        :return: Ничего не возвращает.
+        """
+        self.names[self.normalize(title)] = region_id
+        self.region_titles[region_id] = title
+        self.regions.setdefault(region_id, [])
+        for city_id, city_title in cities:
+            if self.normalize(city_title) == self.normalize(title):
+                self.titles[city_id] = city_title
+                self.regions[region_id].append(city_id)
+            else:
+                self.add(city_id, city_title, region_id)
+
+    @classmethod
+    def from_hh(cls, areas: dict):
+        """
+        Построение индекса по справочнику hh.ru.
+        :param areas: Справочник регионов России в формате hh.ru, dict.
+        :return: Индекс, AreasIndex.
+        """
+        index = cls()
+        for area in areas['areas']:
+            index.add_region(int(area['id']), area['name'],
+                             [(int(city['id']), city['name']) for city in area['areas']])
+        return index
+
+    @classmethod
+    def from_sj(cls, areas: dict):
+        """
+        Построение индекса по справочнику superjob.ru.
+        :param areas: Справочник регионов России в формате superjob.ru, dict.
+        :return: Индекс, AreasIndex.
+        """
+        index = cls()
+        # Города федерального значения
+        for town in areas['towns']:
+            index.add(int(town['id']), town['title'])
+        # Остальные регионы и города России
+        for area in areas['regions']:
+            index.add_region(int(area['id']), area['title'],
+                             [(int(city['id']), city['title']) for city in area['towns']])
+        return index
+
+    def find(self, name: str):
+        """
+        Поиск id региона/населённого пункта по названию.
+        :param name: Название региона/населённого пункта, str.
+        :return: id или None, если название не найдено, int | None.
+        """
+        return self.names.get(self.normalize(name))
+
+    def save(self, path: str) -> None:
+        """
+        Сохраняет индекс в json-файл.
+        :param path: Полное имя файла индекса, str.
+        :return: Ничего не возвращает.
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'names': self.names, 'regions': self.regions, 'titles': self.titles,
+                       'region_titles': self.region_titles}, f, ensure_ascii=False, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        Загружает индекс из json-файла.
+        :param path: Полное имя файла индекса, str.
+        :return: Индекс, AreasIndex.
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        # Ключи словарей в json-файле хранятся как строки.
+        return cls(data['names'],
+                   {int(region_id): cities for region_id, cities in data['regions'].items()},
+                   {int(area_id): title for area_id, title in data['titles'].items()},
+                   {int(region_id): title for region_id, title in data['region_titles'].items()})
+
+    @classmethod
+    def for_directory(cls, path_are: str, build):
+        """
+        Возвращает индекс справочника: из памяти, из файла индекса или строит его заново,
+        если индекс отсутствует или устарел относительно справочника.
+        :param path_are: Полное имя файла справочника, str.
+        :param build: Функция построения индекса по справочнику (from_hh или from_sj), callable.
+        :return: Индекс, AreasIndex.
+        """
+        path_index = cls.index_path(path_are)
+        with cls.__lock:
+            if not os.path.isfile(path_index) or os.path.getmtime(path_index) < os.path.getmtime(path_are):
+                cls.rebuild(path_are, build)
+            mtime = os.path.getmtime(path_index)
+            loaded = cls.__loaded.get(path_index)
+            if loaded is None or loaded[0] != mtime:
+                try:
+                    index = cls.load(path_index)
+                except (KeyError, ValueError):
+                    # Файл индекса повреждён или сохранён в другом формате.
+                    index = cls.rebuild(path_are, build)
+                loaded = (os.path.getmtime(path_index), index)
+                cls.__loaded[path_index] = loaded
+            return loaded[1]
+
+    @classmethod
+    def rebuild(cls, path_are: str, build):
+        """
+        Строит индекс по справочнику и сохраняет его рядом со справочником.
+        :param path_are: Полное имя файла справочника, str.
+        :param build: Функция построения индекса по справочнику (from_hh или from_sj), callable.
+        :return: Индекс, AreasIndex.
+        """
+        with open(path_are, 'r', encoding='utf-8') as file:
+            index = build(json.load(file))
+        index.save(cls.index_path(path_are))
+        return index
+
+    def searchable(self) -> list:
+        """
+        Названия в справочнике, по которым находится id (без вытесненных одноимёнными).
+        :return: Список кортежей (название в справочнике, id), list.
+        """
+        return [(title, area_id) for titles in (self.region_titles, self.titles)
+                for area_id, title in titles.items() if self.names.get(self.normalize(title)) == area_id]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __str__(self) -> str:
+        return f'Индекс справочника регионов: {len(self.names)} названий, {len(self.regions)} регионов'
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.names)}, {len(self.regions)})"
@@ -0,0 +1,191 @@
+import json
+import os
+import re
+
+from src.utils.areas_index import AreasIndex
+from src.utils.areas_search import AreasSearch
+from src.utils.constants import ID_RUSSIA_HH, ID_RUSSIA_SJ, PATH_ARE_HH, PATH_ARE_SJ, PATH_AREAS_MAP
+
+# Сокращения в названиях регионов, которые по-разному записываются в справочниках сервисов.
+ABBREVIATIONS = {
+    'автономный округ': 'ао',
+    'автономная область': 'ао',
+}
+
+
+class AreasMapping:
+    """
+    Таблица соответствия регионов/населённых пунктов hh.ru и superjob.ru.
+    Строится объединением справочников по нормализованным названиям с учётом иерархии
+    "регион - населённый пункт", сохраняется на диске и позволяет переводить id в обе стороны.
+    У superjob.ru id регионов и населённых пунктов могут совпадать, поэтому они хранятся раздельно,
+    а для id superjob.ru запоминается, регион это или населённый пункт: поиск по ним задаётся разными параметрами.
+    """
+
+    def __init__(self, hh_to_sj: dict = None, sj_to_hh: dict = None, sj_regions_to_hh: dict = None) -> None:
+        self.hh_to_sj = hh_to_sj or {}  # {id hh.ru: (id superjob.ru, id - регион)}
+        self.sj_to_hh = sj_to_hh or {}  # {id населённого пункта superjob.ru: id hh.ru}
+        self.sj_regions_to_hh = sj_regions_to_hh or {}  # {id региона superjob.ru: id hh.ru}
+
+    @staticmethod
+    def fold(name: str) -> str:
+        """
+        Свёртка названия для сопоставления справочников: без уточнений в скобках и после тире,
+        с одинаково записанными сокращениями.
+        :param name: Название региона/населённого пункта, str.
+        :return: Свёрнутое название, str.
+        """
+        name = AreasSearch.fold(re.sub(r'\(.*?\)', ' ', str(name).split(' - ')[0]))
+        for full, short in ABBREVIATIONS.items():
+            name = name.replace(full, short)
+        return name
+
+    @staticmethod
+    def region_aliases(title: str) -> list:
+        """
+        Названия, под которыми регион superjob.ru может встречаться в справочнике hh.ru.
+        Например, "Тюменская область, включая Ханты-Мансийский АО и Ямало-Ненецкий АО"
+        объединяет три региона hh.ru.
+        :param title: Название региона superjob.ru, str.
+        :return: Список названий, list.
+        """
+        main, _, included = title.partition(', включая ')
+        return [main] + [alias for alias in included.split(' и ') if alias]
+
+    def link(self, hh_id: int, sj_id: int, sj_region: bool = False) -> None:
+        """
+        Добавляет пару соответствующих друг другу id.
+        :param hh_id: id hh.ru, int.
+        :param sj_id: id superjob.ru, int.
+        :param sj_region: id superjob.ru - регион (True) или населённый пункт (False), bool.
+        :return: Ничего не возвращает.
+        """
+        self.hh_to_sj.setdefault(hh_id, (sj_id, sj_region))
+        (self.sj_regions_to_hh if sj_region else self.sj_to_hh).setdefault(sj_id, hh_id)
+
+    @classmethod
+    def build(cls, index_hh: AreasIndex, index_sj: AreasIndex):
+        """
+        Построение таблицы по индексам справочников обоих сервисов.
+        :param index_hh: Индекс справочника hh.ru, AreasIndex.
+        :param index_sj: Индекс справочника superjob.ru, AreasIndex.
+        :return: Таблица соответствия, AreasMapping.
+        """
+        mapping = cls()
+        mapping.link(ID_RUSSIA_HH, ID_RUSSIA_SJ, sj_region=True)
+
+        # Населённые пункты superjob.ru: {id региона: {название: id}}, и единственные в стране названия.
+        sj_region_towns = {region_id: {cls.fold(index_sj.titles[town_id]): town_id for town_id in towns}
+                           for region_id, towns in index_sj.regions.items()}
+        sj_unique = cls.unique_names(index_sj.titles)
+        hh_unique = cls.unique_names(index_hh.titles)
+
+        # Регионы: совпадение названий, иначе - города федерального значения superjob.ru.
+        sj_regions = {cls.fold(alias): region_id for region_id, title in index_sj.region_titles.items()
+                      for alias in cls.region_aliases(title)}
+        for hh_region, title in index_hh.region_titles.items():
+            name = cls.fold(title)
+            if name in sj_regions:
+                mapping.link(hh_region, sj_regions[name], sj_region=True)
+                towns = sj_region_towns.get(sj_regions[name], {})
+            elif name in sj_unique:
+                mapping.link(hh_region, sj_unique[name])
+                towns = {}
+            else:
+                towns = {}
+            # Населённые пункты: совпадение названия внутри региона, иначе - единственное в обеих странах.
+            for hh_city in index_hh.regions.get(hh_region, ()):
+                city = cls.fold(index_hh.titles[hh_city])
+                if city in towns:
+                    mapping.link(hh_city, towns[city])
+                elif city in sj_unique and city in hh_unique:
+                    mapping.link(hh_city, sj_unique[city])
+        return mapping
+
+    @classmethod
+    def unique_names(cls, titles: dict) -> dict:
+        """
+        Названия, встречающиеся в справочнике только один раз.
+        :param titles: {id: название}, dict.
+        :return: {свёрнутое название: id}, dict.
+        """
+        names = {}
+        for area_id, title in titles.items():
+            name = cls.fold(title)
+            names[name] = None if name in names else area_id
+        return {name: area_id for name, area_id in names.items() if area_id is not None}
+
+    def to_sj(self, hh_id: int):
+        """
+        Перевод id hh.ru в id superjob.ru.
+        :param hh_id: id hh.ru, int.
+        :return: id superjob.ru и признак того, что это регион (а не населённый пункт),
+                 или None, если соответствие не найдено, tuple[int, bool] | None.
+        """
+        return self.hh_to_sj.get(int(hh_id))
+
+    def to_hh(self, sj_id: int, sj_region: bool = False):
+        """
+        Перевод id superjob.ru в id hh.ru.
+        :param sj_id: id superjob.ru, int.
+        :param sj_region: id - регион (True) или населённый пункт (False), bool.
+        :return: id hh.ru или None, если соответствие не найдено, int | None.
+        """
+        return (self.sj_regions_to_hh if sj_region else self.sj_to_hh).get(int(sj_id))
+
+    def save(self, path: str) -> None:
+        """
+        Сохраняет таблицу в json-файл.
+        :param path: Полное имя файла, str.
+        :return: Ничего не возвращает.
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'hh_to_sj': self.hh_to_sj, 'sj_to_hh': self.sj_to_hh,
+                       'sj_regions_to_hh': self.sj_regions_to_hh}, f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        Загружает таблицу из json-файла.
+        :param path: Полное имя файла, str.
+        :return: Таблица соответствия, AreasMapping.
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        # Ключи словарей в json-файле хранятся как строки, пары - как списки.
+        return cls({int(key): (int(sj_id), bool(sj_region)) for key, (sj_id, sj_region) in data['hh_to_sj'].items()},
+                   *({int(key): value for key, value in data[name].items()}
+                     for name in ('sj_to_hh', 'sj_regions_to_hh')))
+
+    @classmethod
+    def for_directories(cls, path_are_hh: str = PATH_ARE_HH, path_are_sj: str = PATH_ARE_SJ,
+                        path_map: str = PATH_AREAS_MAP):
+        """
+        Возвращает таблицу из файла или строит её заново, если файла нет
+        или справочники загружены позже.
+        :param path_are_hh: Полное имя файла справочника hh.ru, str.
+        :param path_are_sj: Полное имя файла справочника superjob.ru, str.
+        :param path_map: Полное имя файла таблицы, str.
+        :return: Таблица соответствия, AreasMapping.
+        """
+        index_hh = AreasIndex.for_directory(path_are_hh, AreasIndex.from_hh)
+        index_sj = AreasIndex.for_directory(path_are_sj, AreasIndex.from_sj)
+        if os.path.isfile(path_map) and os.path.getmtime(path_map) >= max(os.path.getmtime(path_are_hh),
+                                                                          os.path.getmtime(path_are_sj)):
+            try:
+                return cls.load(path_map)
+            except (KeyError, TypeError, ValueError):
+                # Повреждённая таблица или таблица прежнего формата (без признака региона) строится заново.
+                pass
+        mapping = cls.build(index_hh, index_sj)
+        mapping.save(path_map)
+        return mapping
+
+    def __len__(self) -> int:
+        return len(self.hh_to_sj)
+
+    def __str__(self) -> str:
+        return f'Таблица соответствия регионов hh.ru и superjob.ru: {len(self.hh_to_sj)} пар'
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.hh_to_sj)}, {len(self.sj_to_hh)}, {len(self.sj_regions_to_hh)})"
@@ -0,0 +1,128 @@
+import re
+import threading
+import weakref
+from bisect import bisect_left
+
+from src.utils.areas_index import AreasIndex
+
+
+class AreasSearch:
+    """
+    Нечёткий поиск по названиям регионов/населённых пунктов индекса справочника.
+    Сочетает поиск по префиксу (отсортированный список названий) и поиск похожих названий
+    (индекс триграмм с последующей оценкой расстояния Левенштейна).
+    """
+
+    # Поисковые структуры, построенные для индексов справочников.
+    __built = weakref.WeakKeyDictionary()
+    __lock = threading.Lock()
+
+    def __init__(self, index: AreasIndex, candidates: int = 50) -> None:
+        self.__candidates = candidates  # Кол-во кандидатов по триграммам для точной оценки
+        # Варианты названий: [(свёрнутое название, название в справочнике, id)].
+        self.__entries = []
+        for title, area_id in index.searchable():
+            self.__entries.append((self.fold(title), title, area_id))
+        # Отсортированные свёрнутые названия для поиска по префиксу.
+        self.__entries.sort()
+        self.__keys = [entry[0] for entry in self.__entries]
+        # Индекс триграмм: {триграмма: [номера вариантов названий]}.
+        self.__trigrams = {}
+        for num, key in enumerate(self.__keys):
+            for trigram in self.trigrams(key):
+                self.__trigrams.setdefault(trigram, []).append(num)
+
+    @classmethod
+    def for_index(cls, index: AreasIndex):
+        """
+        Возвращает поисковые структуры для индекса, строя их при первом обращении.
+        :param index: Индекс справочника, AreasIndex.
+        :return: Экземпляр AreasSearch, AreasSearch.
+        """
+        with cls.__lock:
+            search = cls.__built.get(index)
+            if search is None:
+                search = cls.__built[index] = cls(index)
+            return search
+
+    @staticmethod
+    def fold(name: str) -> str:
+        """
+        Свёртка названия для нечёткого сравнения: нижний регистр, "ё" заменена на "е",
+        дефисы, скобки и прочие знаки заменены пробелами.
+        :param name: Название, str.
+        :return: Свёрнутое название, str.
+        """
+        return ' '.join(re.sub(r'[^\w]+', ' ', str(name).lower().replace('ё', 'е')).split())
+
+    @staticmethod
+    def trigrams(key: str) -> set:
+        """
+        Триграммы строки (с пробелами по краям, чтобы учитывать начало и конец).
+        :param key: Свёрнутое название, str.
+        :return: Множество триграмм, set.
+        """
+        padded = f'  {key} '
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    @staticmethod
+    def similarity(first: str, second: str) -> float:
+        """
+        Сходство строк на основе расстояния Левенштейна: 1 - совпадают, 0 - ничего общего.
+        :param first: Первая строка, str.
+        :param second: Вторая строка, str.
+        :return: Сходство от 0 до 1, float.
+        """
+        if first == second:
+            return 1.0
+        previous = list(range(len(second) + 1))
+        for i, char_1 in enumerate(first, start=1):
+            current = [i]
+            for j, char_2 in enumerate(second, start=1):
+                current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_1 != char_2)))
+            previous = current
+        return 1 - previous[-1] / max(len(first), len(second))
+
+    def search(self, query: str, limit: int = 5) -> list:
+        """
+        Поиск названий, похожих на запрос, с ранжированием по степени сходства.
+        :param query: Название, введённое пользователем, str.
+        :param limit: Максимальное количество результатов, int.
+        :return: Список кортежей (название в справочнике, id, оценка от 0 до 1) по убыванию оценки, list.
+        """
+        key = self.fold(query)
+        if not key:
+            return []
+        scores = {}  # {номер варианта названия: оценка}
+
+        # Названия, начинающиеся с запроса.
+        start = bisect_left(self.__keys, key)
+        for num in range(start, min(start + self.__candidates, len(self.__keys))):
+            if not self.__keys[num].startswith(key):
+                break
+            scores[num] = 1.0 if self.__keys[num] == key else 0.5 + 0.45 * len(key) / len(self.__keys[num])
+
+        # Названия, имеющие больше всего общих триграмм с запросом.
+        common = {}
+        for trigram in self.trigrams(key):
+            for num in self.__trigrams.get(trigram, ()):
+                common[num] = common.get(num, 0) + 1
+        for num in sorted(common, key=common.get, reverse=True)[:self.__candidates]:
+            scores[num] = max(scores.get(num, 0.0), self.similarity(key, self.__keys[num]))
+
+        # Одно и то же место может встречаться под разными вариантами названия.
+        result = {}
+        for num, score in sorted(scores.items(), key=lambda item: (-item[1], self.__keys[item[0]])):
+            _, title, area_id = self.__entries[num]
+            if area_id not in result:
+                result[area_id] = (title, area_id, round(score, 3))
+        return list(result.values())[:limit]
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __str__(self) -> str:
+        return f'Нечёткий поиск по {len(self.__entries)} названиям регионов/населённых пунктов'
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.__entries)}, {self.__candidates})"
@@ -0,0 +1,98 @@
+import asyncio
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from urllib.parse import urlparse
+
+from src.utils.constants import MAX_PER_HOST, POOL_SIZE, PAGE_RETRIES, RETRY_BACKOFF
+from src.utils.network import RateLimiter, HttpSession, get_session, get_rate_limiter, check_response
+
+
+class AsyncFetcher:
+    """
+    Асинхронный движок запросов к API сервисов вакансий.
+    Все запросы выполняются в одном цикле событий через общий пул HTTP-соединений,
+    количество одновременных запросов к одному хосту ограничено.
+    Ответы "слишком много запросов" и ошибки сервиса повторяются до retries раз с растущими паузами.
+    """
+
+    def __init__(self, max_per_host: int = MAX_PER_HOST, pool_size: int = POOL_SIZE,
+                 rate_limiter: RateLimiter = None, session: HttpSession = None, retries: int = PAGE_RETRIES,
+                 backoff: float = RETRY_BACKOFF) -> None:
+        self.__max_per_host = max(1, max_per_host)  # Одновременных запросов к одному хосту
+        self.__pool_size = pool_size  # Количество потоков для выполнения запросов
+        # Ограничитель частоты запросов (None - общий для всех запросов к хосту).
+        self.__rate_limiter = rate_limiter
+        self.__retries = max(0, retries)  # Количество повторов запроса при ошибке
+        self.__backoff = backoff  # Пауза перед первым повтором, сек.
+        # Пул соединений, общий для всех запросов.
+        self.__session = session or get_session()
+        # Блокирующие вызовы requests выполняются в пуле потоков, не останавливая цикл событий.
+        self.__executor = ThreadPoolExecutor(max_workers=pool_size)
+        # Семафоры по хостам для каждого цикла событий: {цикл: {хост: asyncio.Semaphore}}.
+        # Семафор привязывается к циклу, в котором его ждали, а run_searches каждый раз запускает новый цикл.
+        self.__semaphores = weakref.WeakKeyDictionary()
+
+    async def get(self, url: str, params: dict = None, headers: dict = None) -> str:
+        """
+        Асинхронный GET-запрос.
+        :param url: URL запроса, str.
+        :param params: Параметры запроса, dict.
+        :param headers: Заголовки запроса, dict.
+        :return: Текст ответа, str.
+        """
+        host = urlparse(url).netloc
+        semaphores = self.__semaphores.setdefault(asyncio.get_running_loop(), {})
+        semaphore = semaphores.setdefault(host, asyncio.Semaphore(self.__max_per_host))
+        rate_limiter = self.__rate_limiter or get_rate_limiter(url)
+        for attempt in range(self.__retries + 1):
+            try:
+                async with semaphore:
+                    await asyncio.sleep(rate_limiter.reserve())
+                    loop = asyncio.get_running_loop()
+                    response = await loop.run_in_executor(
+                        self.__executor, partial(self.__session.get, url, params=params, headers=headers))
+                # Проверяем код ответа и подстраиваем частоту запросов
+                return check_response(response, rate_limiter).text
+            except Exception as e:
+                if attempt == self.__retries or not getattr(e, 'retryable', True):
+                    raise
+            # Пауза перед повтором не занимает место среди одновременных запросов к хосту.
+            await asyncio.sleep(self.__backoff * 2 ** attempt)
+
+    def close(self) -> None:
+        """
+        Закрывает пул потоков. Пул соединений остаётся доступным для других запросов.
+        :return: Ничего не возвращает.
+        """
+        self.__executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        return f'Асинхронная загрузка данных: не более {self.__max_per_host} запросов к одному сервису одновременно'
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__max_per_host}, {self.__pool_size})"
+
+
+def run_searches(searches: list, fetcher: AsyncFetcher = None) -> list:
+    """
+    Выполняет несколько поисков вакансий одновременно в одном цикле событий.
+    :param searches: Экземпляры классов VacHH и/или VacSJ, list.
+    :param fetcher: Асинхронный движок запросов, если не указан - создаётся новый, AsyncFetcher.
+    :return: Количество найденных вакансий по каждому поиску (в порядке следования), list.
+    """
+
+    async def run_all(engine: AsyncFetcher) -> list:
+        await asyncio.gather(*(search.vacancies_all_async(engine) for search in searches))
+        return [search.size_dict for search in searches]
+
+    if fetcher is not None:
+        return asyncio.run(run_all(fetcher))
+    with AsyncFetcher() as fetcher:
+        return asyncio.run(run_all(fetcher))
@@ -0,0 +1,253 @@
+import csv
+import os
+import re
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import redirect_stdout
+
+from tqdm import tqdm
+
+from src.utils.analytics import SalaryStats
+from src.utils.areas import AreasHH, AreasSJ
+from src.utils.areas_mapping import AreasMapping
+from src.utils.constants import PATH_BATCH, BATCH_WORKERS, ID_RUSSIA_HH, ID_RUSSIA_SJ, URL_VAC_HH, URL_VAC_SJ, \
+    PATH_ARE_HH, PATH_ARE_SJ, FUZZY_THRESHOLD
+from src.utils.dedup import DedupIndex
+from src.utils.network import RateLimiter, HttpSession, get_session
+from src.utils.query_cache import QueryCache
+from src.utils.refresh import RefreshState
+from src.utils.storage import JsonLinesStore, make_store
+from src.utils.table import VacancyTable
+from src.utils.vacancies import VacHH, VacSJ
+
+# Столбцы файла с запросами (первая строка файла - заголовок).
+QUERY_FIELDS = ('service', 'keyword', 'region', 'salary', 'only_with_salary', 'sort', 'count')
+# Столбцы итогового файла summary.csv.
+SUMMARY_FIELDS = ('num', 'service', 'keyword', 'region', 'area_id', 'found', 'with_salary', 'median', 'file',
+                  'seconds', 'note', 'error')
+
+
+class BatchRunner:
+    """
+    Пакетное (без диалога с пользователем) выполнение запросов из файла.
+    Регионы находятся по справочникам сервисов (классы AreasHH и AreasSJ, с нечётким поиском),
+    запросы выполняются пулом из workers потоков с общими ограничителями частоты запросов к сервисам
+    так же, как в диалоговом режиме (повторы страниц, разбиение запросов, остановка на последней странице).
+    Результат каждого запроса - отсортированные вакансии в отдельном файле JSON Lines,
+    сводка по всем запросам - в файле summary.csv.
+    """
+
+    def __init__(self, output: str = PATH_BATCH, workers: int = BATCH_WORKERS, cache: QueryCache = None,
+                 rate_limiter: RateLimiter = None, session: HttpSession = None, urls: dict = None,
+                 path_are_hh: str = PATH_ARE_HH, path_are_sj: str = PATH_ARE_SJ) -> None:
+        self.__output = output  # Папка для файлов с результатами
+        self.__workers = max(1, workers)  # Количество одновременно выполняемых запросов
+        self.__cache = cache  # Кэш результатов поиска (None - без кэширования)
+        # Ограничитель частоты запросов (None - общие для приложения ограничители по сервисам).
+        self.__rate_limiter = rate_limiter
+        self.__session = session or get_session()  # Пул HTTP-соединений
+        self.__urls = {'hh': URL_VAC_HH, 'sj': URL_VAC_SJ, **(urls or {})}  # URL поиска вакансий сервисов
+        self.__path_are_hh = path_are_hh  # Полное имя файла справочника регионов hh.ru
+        self.__path_are_sj = path_are_sj  # Полное имя файла справочника регионов superjob.ru
+        self.__areas = {}  # Найденные регионы: {(сервис, название): id}
+        self.__lock = threading.Lock()
+
+    @property
+    def session(self) -> HttpSession:
+        return self.__session
+
+    @staticmethod
+    def read_queries(path: str) -> list:
+        """
+        Чтение запросов из файла CSV. Пустые строки и строки, начинающиеся с #, пропускаются.
+        :param path: Полное имя файла, str.
+        :return: Список запросов, list[dict].
+        """
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            lines = [line for line in f if line.strip() and not line.lstrip().startswith('#')]
+        return [BatchRunner.parse_query(row, num) for num, row in enumerate(csv.DictReader(lines), start=1)]
+
+    @staticmethod
+    def parse_query(row: dict, num: int) -> dict:
+        """
+        Проверка и приведение к нужным типам параметров запроса.
+        :param row: Строка файла с запросами, dict.
+        :param num: Номер запроса, int.
+        :return: Запрос, dict.
+        """
+        query = {field: (row.get(field) or '').strip() for field in QUERY_FIELDS}
+        if query['service'] not in ('hh', 'sj', 'all'):
+            raise ValueError(f'Запрос {num}: неизвестный сервис "{query["service"]}".')
+        if not query['keyword']:
+            raise ValueError(f'Запрос {num}: не указано ключевое слово.')
+        for field in ('salary', 'count'):
+            if query[field] and not query[field].isdigit():
+                raise ValueError(f'Запрос {num}: некорректное значение {field} "{query[field]}".')
+            query[field] = int(query[field] or 0)
+        query['only_with_salary'] = query['only_with_salary'].lower() in ('1', 'true', 'yes', 'да')
+        # Метод сортировки: по размеру зарплаты (1) или по датам (2, по умолчанию).
+        sort = {'': 'date', '2': 'date', 'date': 'date', '1': 'salary', 'salary': 'salary'}.get(query['sort'].lower())
+        if sort is None:
+            raise ValueError(f'Запрос {num}: некорректный метод сортировки "{query["sort"]}".')
+        query['sort'] = sort
+        return query
+
+    def find_area(self, service: str, region: str) -> int:
+        """
+        Поиск id региона/населённого пункта по справочнику сервиса: точное название или наиболее похожее.
+        :param service: Сервис: 'hh' или 'sj', str.
+        :param region: Название региона/населённого пункта (пустое - вся Россия), str.
+        :return: id региона/населённого пункта, если не найден - id России, int.
+        """
+        area_id_country = ID_RUSSIA_HH if service == 'hh' else ID_RUSSIA_SJ
+        if not region:
+            return area_id_country
+        with self.__lock:
+            if (service, region) in self.__areas:
+                return self.__areas[service, region]
+        if service == 'hh':
+            area = AreasHH(area=region, path_are_hh=self.__path_are_hh)
+        else:
+            area = AreasSJ(area=region, path_are_sj=self.__path_are_sj)
+        area_id = area.extract_area_id()
+        if area_id == area_id_country:
+            candidates = area.search_areas(limit=1)
+            if candidates and candidates[0][2] >= FUZZY_THRESHOLD:
+                area_id = candidates[0][1]
+        with self.__lock:
+            self.__areas[service, region] = area_id
+        return area_id
+
+    def area_ids(self, query: dict) -> tuple:
+        """
+        id региона запроса на каждом из сервисов запроса.
+        Для поиска на обоих сервисах регион находится по справочнику hh.ru,
+        для superjob.ru используется соответствующий ему регион или населённый пункт.
+        Если регион не найден, поиск идёт по всей России, о чём сообщается в примечании.
+        :param query: Запрос, dict.
+        :return: {сервис: (id региона, id - регион superjob.ru)} и примечание, tuple[dict, str].
+        """
+        service = 'hh' if query['service'] == 'all' else query['service']
+        area_id = self.find_area(service, query['region'])
+        area_id_country = ID_RUSSIA_HH if service == 'hh' else ID_RUSSIA_SJ
+        if query['region'] and query['region'].lower() != 'россия' and area_id == area_id_country:
+            note = f'Регион "{query["region"]}" не найден, поиск по всей России.'
+        else:
+            note = ''
+        if query['service'] != 'all':
+            return {service: (area_id, False)}, note
+        area_sj = AreasMapping.for_directories(self.__path_are_hh, self.__path_are_sj).to_sj(area_id)
+        if area_sj is None:
+            area_sj = ID_RUSSIA_SJ, False
+            note = note or f'Регион "{query["region"]}" не найден на superjob.ru, там поиск по всей России.'
+        return {'hh': (area_id, False), 'sj': area_sj}, note
+
+    def make_searches(self, query: dict, areas: dict, work: str) -> list:
+        """
+        Экземпляры классов VacHH и/или VacSJ для выполнения запроса.
+        Вакансии каждого сервиса и состояние инкрементального обновления сохраняются в рабочей папке запроса,
+        поэтому запросы не мешают друг другу и диалоговому режиму приложения.
+        :param query: Запрос, dict.
+        :param areas: {сервис: (id региона, id - регион superjob.ru)}, dict.
+        :param work: Рабочая папка запроса, str.
+        :return: Список поисков, list.
+        """
+        searches = []
+        state = RefreshState(os.path.join(work, 'refresh.json'))
+        for service, (area_id, region) in areas.items():
+            path_vak = os.path.join(work, service)
+            os.makedirs(path_vak, exist_ok=True)
+            params = {'only_with_salary': query['only_with_salary'], 'salary': query['salary'],
+                      'url': self.__urls[service], 'path_vak': path_vak, 'session': self.__session,
+                      'store': make_store(service, path_vak, 'jsonl'), 'rate_limiter': self.__rate_limiter,
+                      'state': state, 'cache': self.__cache}
+            if service == 'hh':
+                searches.append(VacHH(query['keyword'], area=area_id, **params))
+            else:
+                searches.append(VacSJ(query['keyword'], area=area_id, region=region, **params))
+        return searches
+
+    @staticmethod
+    def file_name(num: int, query: dict) -> str:
+        """
+        Имя файла с результатом запроса: номер, сервис и ключевое слово.
+        :param num: Номер запроса, int.
+        :param query: Запрос, dict.
+        :return: Имя файла, str.
+        """
+        slug = re.sub(r'\W+', '_', query['keyword'].lower()).strip('_')[:40]
+        return f"{num:03d}_{query['service']}_{slug}.jsonl"
+
+    def run_query(self, num: int, query: dict) -> dict:
+        """
+        Выполнение одного запроса: поиск вакансий, сортировка, запись результата в файл.
+        Ошибка запроса не прерывает выполнение остальных, а попадает в сводку.
+        :param num: Номер запроса, int.
+        :param query: Запрос, dict.
+        :return: Строка сводки, dict.
+        """
+        start = time.perf_counter()
+        row = dict.fromkeys(SUMMARY_FIELDS, '')
+        row.update(num=num, service=query['service'], keyword=query['keyword'], region=query['region'], found=0)
+        work = os.path.join(self.__output, 'work', f'{num:03d}')
+        try:
+            areas, row['note'] = self.area_ids(query)
+            row['area_id'] = ' '.join(str(area_id) for area_id, region in areas.values())
+            searches = self.make_searches(query, areas, work)
+            for search in searches:
+                search.vacancies_all()
+            # Вакансия, опубликованная на обоих сервисах, попадает в результат один раз.
+            stores = {service: search.store for service, search in zip(areas, searches)}
+            table = VacancyTable.from_vacancies(DedupIndex().unique(stores))
+            result = JsonLinesStore(os.path.join(self.__output, self.file_name(num, query)))
+            result.clear()
+            result.append([vacancy.to_dict() for vacancy in table.top(query['count'] or len(table), query['sort'])])
+            summary = SalaryStats(table).summary()
+            row.update(found=len(table), with_salary=summary['count'], median=summary.get('median', ''),
+                       file=os.path.basename(result.path))
+        except Exception as e:
+            row['error'] = str(e)
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+        row['seconds'] = round(time.perf_counter() - start, 2)
+        return row
+
+    def run(self, queries: list, progress: bool = True) -> list:
+        """
+        Выполнение запросов пулом потоков и запись сводки.
+        Счётчики запросов пула соединений обнуляются, чтобы по ним можно было оценить этот запуск.
+        :param queries: Список запросов, list[dict].
+        :param progress: Показывать индикатор выполнения, bool.
+        :return: Строки сводки в порядке запросов, list[dict].
+        """
+        os.makedirs(self.__output, exist_ok=True)
+        self.__session.reset_stats()
+        # Сообщения поисков одновременно выполняемых запросов не выводим: результат каждого запроса - в сводке.
+        with open(os.devnull, 'w', encoding='utf-8') as devnull, redirect_stdout(devnull), \
+                ThreadPoolExecutor(max_workers=self.__workers) as executor:
+            futures = [executor.submit(self.run_query, num, query) for num, query in enumerate(queries, start=1)]
+            for _ in tqdm(as_completed(futures), total=len(futures), desc='Выполняем запросы', disable=not progress):
+                pass
+        rows = [future.result() for future in futures]
+        self.write_summary(rows)
+        shutil.rmtree(os.path.join(self.__output, 'work'), ignore_errors=True)
+        return rows
+
+    def write_summary(self, rows: list) -> None:
+        """
+        Запись сводки по запросам в файл summary.csv.
+        :param rows: Строки сводки, list[dict].
+        :return: Ничего не возвращает.
+        """
+        with open(os.path.join(self.__output, 'summary.csv'), 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+    def __str__(self) -> str:
+        return f'Пакетное выполнение запросов: {self.__workers} потоков, результаты в папке {self.__output}'
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__output}, {self.__workers})"
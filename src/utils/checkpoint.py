@@ -0,0 +1,63 @@
+import json
+import os
+import threading
+
+
+class PageCheckpoint:
+    """
+    Контрольная точка постраничной загрузки вакансий.
+    Хранит ключ запроса, номера страниц, уже сохранённых в хранилище, общее количество страниц
+    и состояние загрузки, необходимое для её продолжения. Файл находится в папке с вакансиями сервиса
+    и удаляется вместе с ними перед новой загрузкой, а также после успешного окончания загрузки.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.__path = path  # Полное имя файла контрольной точки
+        self.__lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def load(self, key: str):
+        """
+        Чтение контрольной точки запроса.
+        :param key: Ключ запроса, str.
+        :return: Данные контрольной точки или None, если её нет или она относится к другому запросу, dict | None.
+        """
+        with self.__lock:
+            if not os.path.isfile(self.__path):
+                return None
+            try:
+                with open(self.__path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                return None
+        return data if data.get('key') == key else None
+
+    def save(self, key: str, **data) -> None:
+        """
+        Запись контрольной точки запроса. Файл записывается под временным именем и заменяет старый целиком.
+        :param key: Ключ запроса, str.
+        :param data: Данные контрольной точки (сохранённые страницы, количество страниц и т.п.).
+        :return: Ничего не возвращает.
+        """
+        with self.__lock:
+            with open(self.__path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump({'key': key, **data}, f, ensure_ascii=False)
+            os.replace(self.__path + '.tmp', self.__path)
+
+    def clear(self) -> None:
+        """
+        Удаляет контрольную точку.
+        :return: Ничего не возвращает.
+        """
+        with self.__lock:
+            if os.path.isfile(self.__path):
+                os.remove(self.__path)
+
+    def __str__(self) -> str:
+        return f'Контрольная точка загрузки {self.__path}'
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__path})"
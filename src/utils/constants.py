@@ -1,16 +1,31 @@
 import os
 from dotenv import load_dotenv, find_dotenv
 
+# Срок, в течение которого загруженный справочник регионов считается актуальным, сек. (сутки).
+AREAS_TTL = 24 * 60 * 60
+# Минимальная оценка сходства (от 0 до 1), при которой похожее название региона принимается без уточнения.
+FUZZY_THRESHOLD = 0.85
+
 # URL регионы
 URL_AREAS_HH = 'https://api.hh.ru/areas/113'
 # Путь к папке, в которой хранятся файлы с данными о вакансиях, полученных с HH.ru.
 PATH_VAK_HH = os.path.join('..', 'src', 'data', 'hh')
+# Имя файла (JSON Lines), в котором хранятся вакансии, полученные с HH.ru.
+FILE_VAK_HH = 'vakhh.jsonl'
+# Имя файла контрольной точки постраничной загрузки вакансий с HH.ru.
+FILE_PAGES_HH = 'vakhh_pages.json'
 # Путь к файлу, в котором хранятся данные о регионах в России, полученных с HH.ru.
 PATH_ARE_HH = os.path.join('..', 'src', 'data', 'hh', 'areas', 'areas.json')
 # Путь к папке, в которой хранятся данные о регионах в России, полученных с HH.ru.
 PATH_VAK_DIR_HH = os.path.join('..', 'src', 'data', 'hh', 'areas')
 # id России для поиска вакансий
 ID_RUSSIA_HH = 113
+# URL вакансии
+URL_VAC_HH = 'https://api.hh.ru/vacancies'
+# Максимальное количество вакансий, которое можно получить с hh.ru по одному запросу.
+MAX_VAK_HH = 2000
+# Максимальное количество одновременных запросов страниц к hh.ru.
+MAX_WORKERS_HH = 5
 
 
 # Секретный ключ.
@@ -20,9 +35,102 @@ SUPERJOB_API_KEY = os.getenv('TOKEN_SJ')
 URL_AREAS_SJ = 'https://api.superjob.ru/2.0/regions/combined/'
 # Путь к файлу данных с вакансиями SuperJob.ru.
 PATH_VAK_SJ = os.path.join('..', 'src', 'data', 'sj')
+# Имя файла (JSON Lines), в котором хранятся вакансии, полученные с SuperJob.ru.
+FILE_VAK_SJ = 'vaksj.jsonl'
+# Имя файла контрольной точки постраничной загрузки вакансий с SuperJob.ru.
+FILE_PAGES_SJ = 'vaksj_pages.json'
 # Путь к файлу, в котором хранятся данные о регионах в России, полученных с HH.ru.
 PATH_ARE_SJ = os.path.join('..', 'src', 'data', 'sj', 'areas', 'areas.json')
 # Путь к папке, в которой хранятся данные о регионах в России, полученных с HH.ru.
 PATH_VAK_DIR_SJ = os.path.join('..', 'src', 'data', 'sj', 'areas')
 # id России для поиска вакансий.
 ID_RUSSIA_SJ = 1
+
+# Путь к файлу таблицы соответствия регионов/населённых пунктов hh.ru и superjob.ru.
+PATH_AREAS_MAP = os.path.join('..', 'src', 'data', 'areas_map.json')
+# URL вакансии
+URL_VAC_SJ = 'https://api.superjob.ru/2.0/vacancies/'
+# Максимальное количество вакансий, которое можно получить с superjob.ru по одному запросу.
+MAX_VAK_SJ = 500
+# Максимальное количество одновременных запросов страниц к superjob.ru (при загрузке запроса по частям).
+MAX_WORKERS_SJ = 4
+
+# Служебные поля вакансии для сортировки, фильтрации и поиска повторов (на экран не выводятся):
+# id вакансии на сервисе, номер дня публикации, средняя зарплата в пределах "вилки" и она же в рублях.
+KEY_ID = '_id'
+KEY_DAY = '_day'
+KEY_SALARY_MEAN = '_salary_mean'
+KEY_SALARY_RUB = '_salary_rub'
+# Примерные курсы валют к рублю для сравнения зарплат в разных валютах (коды валют hh.ru и superjob.ru).
+CURRENCY_RATES = {
+    'rur': 1, 'rub': 1, 'usd': 90, 'eur': 98, 'kzt': 0.19, 'uah': 2.4, 'byr': 28, 'byn': 28,
+    'uzs': 0.0074, 'azn': 53, 'gel': 34, 'kgs': 1,
+}
+
+# Процентили и количество интервалов гистограммы в статистике зарплат.
+STATS_PERCENTILES = (10, 25, 50, 75, 90)
+STATS_BINS = 10
+
+# Способ хранения загруженных вакансий: 'jsonl' - файлы JSON Lines в папках сервисов, 'sqlite' - база данных SQLite.
+VAK_STORAGE = 'jsonl'
+# Путь к файлу базы данных SQLite с вакансиями обоих сервисов.
+PATH_VAK_DB = os.path.join('..', 'src', 'data', 'vacancies.db')
+
+# Инкрементальное обновление: повторный запрос загружает только вакансии, опубликованные после предыдущего.
+VAK_INCREMENTAL = False
+# Путь к файлу состояния инкрементального обновления (даты самых свежих вакансий по запросам).
+PATH_REFRESH_STATE = os.path.join('..', 'src', 'data', 'refresh.json')
+
+# Разбиение запроса, по которому найдено больше вакансий, чем сервис отдаёт (MAX_VAK_HH, MAX_VAK_SJ), на части
+# по дочерним регионам, диапазонам зарплат (superjob.ru) и окнам дат публикации, чтобы получить все вакансии.
+VAK_SHARDING = False
+# Диапазон дат публикации, который делится на окна, - последние дни.
+SHARD_PERIOD_DAYS = 30
+# Наименьшее окно дат публикации, сек.
+SHARD_MIN_WINDOW = 60
+# Наименьший диапазон зарплат, руб.
+SHARD_MIN_PAYMENT = 1000
+# Наибольшее количество частей одного запроса (ограничивает время загрузки).
+SHARD_LIMIT = 200
+
+# Точность сравнения зарплат при поиске одной и той же вакансии на разных сервисах, руб.
+DEDUP_SALARY_STEP = 1000
+
+# Путь к папке с кэшем результатов поиска.
+PATH_QUERY_CACHE = os.path.join('..', 'src', 'data', 'cache')
+# Срок хранения результата поиска в кэше, сек. (час).
+QUERY_CACHE_TTL = 60 * 60
+# Количество результатов поиска, хранящихся в памяти.
+QUERY_CACHE_SIZE = 8
+# Количество результатов поиска, хранящихся на диске.
+QUERY_CACHE_FILES = 50
+
+# Путь к папке с результатами пакетного выполнения запросов.
+PATH_BATCH = os.path.join('..', 'src', 'data', 'batch')
+# Количество одновременно выполняемых запросов в пакетном режиме.
+BATCH_WORKERS = 4
+
+# Максимальное количество запросов к API в секунду (для всех потоков, отдельно по каждому сервису).
+REQUESTS_PER_SECOND = 10
+# Количество запросов, которые можно отправить сразу после простоя.
+RATE_BURST = 5
+# Наименьшая частота запросов в секунду, до которой она снижается при ответах "слишком много запросов".
+RATE_MIN = 0.5
+# Прибавка частоты запросов в секунду после каждого успешного ответа.
+RATE_STEP = 0.2
+# Наибольшая пауза по заголовку Retry-After, сек.
+RETRY_AFTER_MAX = 60
+# Максимальное количество одновременных запросов к одному сервису (хосту) в асинхронном режиме.
+MAX_PER_HOST = 6
+# Размер пула HTTP-соединений.
+POOL_SIZE = 20
+# Максимальное время ожидания ответа сервиса, сек.
+TIMEOUT = 30
+# Количество повторных попыток загрузки страницы при ошибке.
+PAGE_RETRIES = 3
+# Пауза перед первой повторной попыткой, сек. (каждая следующая - вдвое длиннее).
+RETRY_BACKOFF = 1.0
+# Продолжать прерванную загрузку того же запроса с недостающих страниц.
+PAGES_RESUME = True
+# Количество вакансий на одном экране при постраничном выводе.
+PAGE_SIZE = 5
@@ -0,0 +1,154 @@
+import hashlib
+import re
+import threading
+from collections import Counter
+
+from src.utils.constants import KEY_ID, KEY_SALARY_RUB, DEDUP_SALARY_STEP
+
+# Организационно-правовые формы, которые по-разному записываются в названиях работодателей на разных сервисах.
+LEGAL_FORMS = re.compile(r'\b(ооо|оао|зао|пао|нао|ао|ип|гбу|мбу|фгуп|муп|llc|ltd)\b')
+
+
+class DedupIndex:
+    """
+    Индекс для отбрасывания повторяющихся вакансий по мере получения страниц.
+    Точные повторы - вакансии одного сервиса с одинаковым id (страницы выдачи могут перекрываться,
+    если во время загрузки появляются новые вакансии, части запроса пересекаются).
+    Почти-повторы - одна и та же вакансия, опубликованная на разных сервисах: совпадает отпечаток
+    из нормализованных должности, работодателя, населённого пункта и зарплаты (с точностью до salary_step руб.).
+    Точные повторы отбрасываются сразу; почти-повторы остаются в хранилищах сервисов (результат каждого
+    сервиса полон и кэшируется независимо), а при объединении вакансий сервисов вакансия сохраняется
+    с сервиса, указанного в services раньше. Потокобезопасен: один индекс может использоваться
+    несколькими поисками, загружающими вакансии одновременно.
+    """
+
+    def __init__(self, services: tuple = ('hh', 'sj'), salary_step: int = DEDUP_SALARY_STEP) -> None:
+        self.__services = services  # Сервисы в порядке предпочтения при объединении
+        self.__salary_step = max(1, salary_step)  # Точность сравнения зарплат, руб.
+        self.__ids = {service: set() for service in services}  # {сервис: id вакансий}
+        self.__prints = {service: Counter() for service in services}  # {сервис: {отпечаток: количество вакансий}}
+        self.__stats = {'exact': 0}  # Количество отброшенных точных повторов
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def normalize(value) -> str:
+        """
+        Нормализация текста для сравнения: нижний регистр, "е" вместо "ё", без знаков препинания и лишних пробелов.
+        :param value: Текст, str.
+        :return: Нормализованный текст, str.
+        """
+        return ' '.join(re.sub(r'[\W_]+', ' ', str(value or '').lower().replace('ё', 'е')).split())
+
+    def fingerprint(self, vacancy) -> str:
+        """
+        Отпечаток вакансии для поиска почти-повторов на разных сервисах.
+        :param vacancy: Вакансия (запись или словарь с подписями в качестве ключей), Vacancy | dict.
+        :return: Отпечаток, str.
+        """
+        employer = ' '.join(LEGAL_FORMS.sub(' ', self.normalize(vacancy.get('03 Работодатель'))).split())
+        salary = round((vacancy.get(KEY_SALARY_RUB) or 0) / self.__salary_step)
+        key = '|'.join((self.normalize(vacancy.get('02 Должность')), employer,
+                        self.normalize(vacancy.get('04 Населённый пункт')), str(salary)))
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+    def add(self, service: str, vacancies: list) -> list:
+        """
+        Добавляет в индекс вакансии очередной страницы сервиса и отбрасывает точные повторы.
+        :param service: Сервис, str.
+        :param vacancies: Список вакансий, list[Vacancy].
+        :return: Список вакансий без точных повторов, list[Vacancy].
+        """
+        result = []
+        with self.__lock:
+            ids, prints = self.__ids[service], self.__prints[service]
+            for vacancy in vacancies:
+                if vacancy.vacancy_id is not None and vacancy.vacancy_id in ids:
+                    self.__stats['exact'] += 1
+                    continue
+                if vacancy.vacancy_id is not None:
+                    ids.add(vacancy.vacancy_id)
+                prints[self.fingerprint(vacancy)] += 1
+                result.append(vacancy)
+        return result
+
+    def seed(self, service: str, store) -> None:
+        """
+        Заполняет индекс вакансиями сервиса, уже находящимися в хранилище (при дозагрузке или из кэша).
+        :param service: Сервис, str.
+        :param store: Хранилище вакансий сервиса, JsonLinesStore | SQLiteStore.
+        :return: Ничего не возвращает.
+        """
+        prints = Counter(self.fingerprint(record) for record in store)
+        ids = store.ids()
+        with self.__lock:
+            self.__ids[service] = ids
+            self.__prints[service] = prints
+
+    def forget(self, service: str) -> None:
+        """
+        Удаляет из индекса вакансии сервиса (перед новой загрузкой).
+        :param service: Сервис, str.
+        :return: Ничего не возвращает.
+        """
+        with self.__lock:
+            self.__ids[service] = set()
+            self.__prints[service] = Counter()
+
+    @property
+    def near_duplicates(self) -> int:
+        """
+        Количество вакансий, которые при объединении сервисов будут отброшены как почти-повторы
+        (вакансии с отпечатком, уже встречавшимся на сервисе, указанном в services раньше).
+        :return: Количество вакансий, int.
+        """
+        count, seen = 0, set()
+        with self.__lock:
+            for service in self.__services:
+                prints = self.__prints[service]
+                count += sum(number for fingerprint, number in prints.items() if fingerprint in seen)
+                seen.update(prints)
+        return count
+
+    @property
+    def stats(self) -> dict:
+        """
+        Счётчики индекса: отброшенные точные повторы и почти-повторы при объединении сервисов.
+        :return: {'exact', 'near'}, dict.
+        """
+        with self.__lock:
+            exact = self.__stats['exact']
+        return {'exact': exact, 'near': self.near_duplicates}
+
+    def unique(self, sources: dict):
+        """
+        Потоковое объединение вакансий нескольких сервисов без повторов: сервисы перебираются в порядке
+        services, вакансия пропускается, если её id уже встречался на том же сервисе или её отпечаток -
+        на сервисе, указанном раньше.
+        :param sources: {сервис: вакансии (хранилище или поток словарей)}, dict.
+        :return: Генератор вакансий.
+        """
+        seen = set()
+        for service in self.__services:
+            if service not in sources:
+                continue
+            ids, prints = set(), set()
+            for record in sources[service]:
+                vacancy_id, fingerprint = record.get(KEY_ID), self.fingerprint(record)
+                if vacancy_id is not None and vacancy_id in ids or fingerprint in seen:
+                    continue
+                if vacancy_id is not None:
+                    ids.add(vacancy_id)
+                prints.add(fingerprint)
+                yield record
+            seen |= prints
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return sum(len(ids) for ids in self.__ids.values())
+
+    def __str__(self) -> str:
+        stats = self.stats
+        return f"Индекс повторов: точных повторов {stats['exact']}, почти-повторов на разных сервисах {stats['near']}"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__services}, {self.__salary_step})"
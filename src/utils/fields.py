@@ -0,0 +1,131 @@
+from collections.abc import Iterable
+
+# Значение текстового поля, отсутствующего в ответе API.
+NO_DATA = 'нет данных.'
+
+
+class Salary:
+    """
+    Описание поля с размером зарплаты: путь к значению в ответе API.
+    Отсутствующая зарплата заменяется нулём.
+    """
+
+    def __init__(self, *path: str) -> None:
+        self.path = path
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}{self.path}"
+
+
+class FieldExtractor:
+    """
+    Извлечение полей вакансии из ответа API по таблице описаний полей.
+    Сервис один раз описывает поля: {подпись: путь к значению (кортеж ключей), Salary(путь) или функция},
+    по описанию строится список функций-извлекателей, которые заполняют словарь вакансии за один проход.
+    Результат совпадает с прежним заполнением словаря вакансии по уровням вложенности ключей
+    (эталон для сравнения - tests/reference_fields.py).
+    """
+
+    # Признак значения, которого нет (путь прервался) или которое не заносится в вакансию.
+    SKIP = object()
+
+    def __init__(self, spec: dict) -> None:
+        self.__spec = spec  # Описание полей
+        # Скомпилированные извлекатели: [(подпись, функция)].
+        self.__getters = [(label, self.compile(rule)) for label, rule in spec.items()]
+
+    @classmethod
+    def compile(cls, rule):
+        """
+        Строит функцию извлечения значения поля по его описанию.
+        :param rule: Путь к значению (кортеж ключей), Salary(путь) или функция от словаря вакансии,
+                     tuple | Salary | callable.
+        :return: Функция, возвращающая значение поля или cls.SKIP, если поле не заполняется, callable.
+        """
+        if isinstance(rule, Salary):
+            path = cls.compile_path(rule.path)
+
+            def get_salary(source: dict):
+                value = path(source)
+                return 0 if value is None or value is cls.SKIP else value
+            return get_salary
+
+        if isinstance(rule, tuple):
+            path = cls.compile_path(rule)
+
+            def get_text(source: dict):
+                value = path(source)
+                # Строки (в т.ч. пустые) принимаются как есть, отсутствующие и скалярные значения -
+                # "нет данных.", коллекции - если все их элементы непустые.
+                if type(value) is str:
+                    return value
+                if value is None or value is cls.SKIP or not isinstance(value, Iterable):
+                    return NO_DATA
+                return value if all(value) else cls.SKIP
+            return get_text
+
+        if callable(rule):
+            return rule
+        raise TypeError(f'Некорректное описание поля: {rule!r}.')
+
+    @classmethod
+    def compile_path(cls, path: tuple):
+        """
+        Строит функцию получения значения по пути из ключей вложенных словарей.
+        Для путей из одного-трёх ключей функции развёрнуты без цикла.
+        :param path: Ключи словарей от внешнего к внутреннему, tuple.
+        :return: Функция, возвращающая значение или cls.SKIP, если по пути встретился не словарь, callable.
+        """
+        skip = cls.SKIP
+        if len(path) == 1:
+            key_1, = path
+            return lambda source: source.get(key_1)
+        if len(path) == 2:
+            key_1, key_2 = path
+
+            def get_2(source: dict):
+                value = source.get(key_1)
+                return value.get(key_2) if type(value) is dict else skip
+            return get_2
+        if len(path) == 3:
+            key_1, key_2, key_3 = path
+
+            def get_3(source: dict):
+                value = source.get(key_1)
+                if type(value) is not dict:
+                    return skip
+                value = value.get(key_2)
+                return value.get(key_3) if type(value) is dict else skip
+            return get_3
+
+        def get_n(source: dict):
+            value = source
+            for key in path:
+                if type(value) is not dict:
+                    return skip
+                value = value.get(key)
+            return value
+        return get_n
+
+    def extract(self, source: dict) -> dict:
+        """
+        Заполняет словарь вакансии по элементу ответа API.
+        :param source: Вакансия в формате ответа API, dict.
+        :return: Словарь вакансии {подпись: значение}, dict.
+        """
+        vacancy = {}
+        skip = self.SKIP
+        for label, getter in self.__getters:
+            value = getter(source)
+            if value is not skip:
+                vacancy[label] = value
+        return vacancy
+
+    def __len__(self) -> int:
+        return len(self.__getters)
+
+    def __str__(self) -> str:
+        return f'Извлечение {len(self.__getters)} полей вакансии по таблице описаний'
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self.__spec)})"
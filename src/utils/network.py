@@ -0,0 +1,305 @@
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.utils.constants import REQUESTS_PER_SECOND, POOL_SIZE, TIMEOUT, PAGE_RETRIES, RETRY_BACKOFF, RATE_BURST, \
+    RATE_MIN, RATE_STEP, RETRY_AFTER_MAX
+
+
+class ApiError(Exception):
+    """
+    Ошибка, которую вернул сервис в ответ на запрос (код ответа 4xx/5xx).
+    """
+
+    def __init__(self, message: str, status: int = None, retryable: bool = False) -> None:
+        super().__init__(message)
+        self.status = status  # Код ответа
+        self.retryable = retryable  # Имеет ли смысл повторить запрос
+
+
+class RateLimitError(ApiError):
+    """
+    Сервис ответил, что запросов слишком много (429, 503): запрос можно повторить позже.
+    """
+
+    def __init__(self, message: str, status: int = None, retry_after: float = None) -> None:
+        super().__init__(message, status, retryable=True)
+        self.retry_after = retry_after  # Рекомендованная сервисом пауза, сек.
+
+
+class RateLimiter:
+    """
+    Ограничитель частоты запросов к API ("ведро с токенами").
+    Токены пополняются со скоростью rate в секунду, но накапливается не более burst штук:
+    после простоя несколько запросов уходят сразу, дальше - с заданной частотой.
+    Частота подстраивается под ответы сервиса: при ответе "слишком много запросов" она снижается вдвое
+    (но не ниже min_rate), а запросы приостанавливаются на время, указанное сервисом в заголовке Retry-After;
+    после каждого успешного ответа частота увеличивается на step, пока не достигнет исходной.
+    Потокобезопасен: один экземпляр может использоваться несколькими потоками одновременно.
+    """
+
+    def __init__(self, rate: float = REQUESTS_PER_SECOND, burst: int = RATE_BURST, min_rate: float = RATE_MIN,
+                 step: float = RATE_STEP) -> None:
+        self.__max_rate = rate  # Исходная (наибольшая) частота запросов в секунду, 0 - без ограничения
+        self.__rate = rate  # Текущая частота запросов в секунду
+        self.__burst = max(1, burst)  # Наибольшее количество накопленных токенов
+        self.__min_rate = min(min_rate, rate)  # Наименьшая частота запросов в секунду
+        self.__step = step  # Прибавка частоты после успешного ответа
+        # Количество токенов (отрицательное - запросы, ожидающие своей очереди) на момент self.__updated.
+        self.__tokens = float(self.__burst)
+        self.__updated = time.monotonic()
+        # Момент времени, до которого запросы приостановлены по требованию сервиса.
+        self.__paused_until = 0.0
+        self.__lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self.__rate
+
+    def reserve(self) -> float:
+        """
+        Резервирует "окно" для очередного запроса.
+        :return: Время, которое нужно подождать перед отправкой запроса, сек., float.
+        """
+        if self.__max_rate <= 0:
+            return 0.0
+        with self.__lock:
+            now = time.monotonic()
+            # Во время паузы токены не пополняются: отсчёт начинается с её окончания.
+            start = max(now, self.__paused_until)
+            if start > self.__updated:
+                self.__tokens = min(self.__burst, self.__tokens + (start - self.__updated) * self.__rate)
+                self.__updated = start
+            self.__tokens -= 1
+            wait = -self.__tokens / self.__rate if self.__tokens < 0 else 0.0
+            return start - now + wait
+
+    def wait(self) -> None:
+        """
+        Ожидает, пока не станет возможной отправка очередного запроса.
+        :return: Ничего не возвращает.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def penalize(self, retry_after: float = None) -> None:
+        """
+        Реакция на ответ "слишком много запросов": частота снижается вдвое, запросы приостанавливаются.
+        :param retry_after: Пауза, указанная сервисом, сек. (None - интервал между запросами при новой частоте),
+                            float.
+        :return: Ничего не возвращает.
+        """
+        if self.__max_rate <= 0:
+            return
+        with self.__lock:
+            now = time.monotonic()
+            self.__rate = max(self.__min_rate, self.__rate / 2)
+            pause = 1 / self.__rate if retry_after is None else retry_after
+            self.__paused_until = max(self.__paused_until, now + pause)
+            # После паузы запросы возобновляются по одному, уже зарезервированные сохраняют очередь.
+            self.__tokens = min(self.__tokens, 1.0)
+            self.__updated = max(self.__updated, self.__paused_until)
+
+    def reward(self) -> None:
+        """
+        Реакция на успешный ответ: частота увеличивается на step, но не выше исходной.
+        :return: Ничего не возвращает.
+        """
+        with self.__lock:
+            self.__rate = min(self.__max_rate, self.__rate + self.__step)
+
+    def __str__(self) -> str:
+        return f'Ограничение частоты запросов: не чаще {self.__rate:g} раз в секунду'
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__max_rate}, {self.__burst}, {self.__min_rate}, {self.__step})"
+
+
+def parse_retry_after(value: str):
+    """
+    Пауза, указанная в заголовке Retry-After: количество секунд или дата HTTP.
+    Слишком длинная пауза сокращается до RETRY_AFTER_MAX.
+    :param value: Значение заголовка, str.
+    :return: Пауза, сек., или None, если заголовка нет или он некорректен, float | None.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return min(float(value), RETRY_AFTER_MAX)
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return min(max((moment - datetime.now(timezone.utc)).total_seconds(), 0.0), RETRY_AFTER_MAX)
+
+
+def check_response(response: requests.Response, rate_limiter: RateLimiter = None) -> requests.Response:
+    """
+    Проверка кода ответа сервиса с подстройкой частоты запросов.
+    :param response: Ответ сервиса, requests.Response.
+    :param rate_limiter: Ограничитель частоты запросов к сервису, RateLimiter.
+    :return: Тот же ответ, если запрос выполнен успешно (код 2xx/3xx), requests.Response.
+    """
+    status = response.status_code
+    if status in (429, 503):
+        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+        if rate_limiter is not None:
+            rate_limiter.penalize(retry_after)
+        raise RateLimitError(f'Слишком много запросов к {response.url} (код ответа {status}).', status, retry_after)
+    if status == 403 and 'captcha' in response.text:
+        # hh.ru требует капчу при подозрении на автоматические запросы: запросы нужно замедлить,
+        # но повтор без ввода капчи не поможет.
+        if rate_limiter is not None:
+            rate_limiter.penalize()
+        raise ApiError(f'Сервис {response.url} требует ввести капчу (код ответа {status}).', status)
+    if status >= 400:
+        raise ApiError(f'Ошибка запроса к {response.url} (код ответа {status}).', status, retryable=status >= 500)
+    if rate_limiter is not None:
+        rate_limiter.reward()
+    return response
+
+
+class HttpSession:
+    """
+    Общий пул HTTP-соединений для запросов к API сервисов.
+    Соединения переиспользуются (keep-alive), ответы принимаются в сжатом виде (gzip).
+    Ведёт счётчики количества и продолжительности запросов по каждому хосту.
+    """
+
+    def __init__(self, pool_size: int = POOL_SIZE, timeout: float = TIMEOUT) -> None:
+        self.__pool_size = pool_size  # Размер пула соединений (на один хост)
+        self.__timeout = timeout  # Время ожидания ответа, сек.
+        self.__session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.__session.mount('http://', adapter)
+        self.__session.mount('https://', adapter)
+        self.__session.headers.update({'Accept-Encoding': 'gzip, deflate', 'Connection': 'keep-alive'})
+        # Счётчики запросов: {хост: {'count': кол-во, 'total': общее время, 'max': максимальное время}}.
+        self.__stats = {}
+        self.__lock = threading.Lock()
+
+    def get(self, url: str, params: dict = None, headers: dict = None) -> requests.Response:
+        """
+        GET-запрос через пул соединений.
+        :param url: URL запроса, str.
+        :param params: Параметры запроса, dict.
+        :param headers: Дополнительные заголовки запроса, dict.
+        :return: Ответ сервиса, requests.Response.
+        """
+        start = time.perf_counter()
+        response = self.__session.get(url, params=params, headers=headers, timeout=self.__timeout)
+        self.count_request(urlparse(url).netloc, time.perf_counter() - start)
+        return response
+
+    def count_request(self, host: str, elapsed: float) -> None:
+        """
+        Учитывает запрос в счётчиках.
+        :param host: Хост, к которому выполнялся запрос, str.
+        :param elapsed: Продолжительность запроса, сек., float.
+        :return: Ничего не возвращает.
+        """
+        with self.__lock:
+            stat = self.__stats.setdefault(host, {'count': 0, 'total': 0.0, 'max': 0.0})
+            stat['count'] += 1
+            stat['total'] += elapsed
+            stat['max'] = max(stat['max'], elapsed)
+
+    @property
+    def stats(self) -> dict:
+        """
+        Счётчики запросов по хостам, включая среднее время запроса.
+        :return: {хост: {'count', 'total', 'max', 'avg'}}, dict.
+        """
+        with self.__lock:
+            return {host: dict(stat, avg=stat['total'] / stat['count']) for host, stat in self.__stats.items()}
+
+    def reset_stats(self) -> None:
+        """
+        Обнуляет счётчики запросов.
+        :return: Ничего не возвращает.
+        """
+        with self.__lock:
+            self.__stats.clear()
+
+    def report(self) -> str:
+        """
+        Текстовый отчёт по счётчикам запросов: по строке на каждый хост.
+        :return: Текст, str.
+        """
+        stats = self.stats
+        if not stats:
+            return 'Запросов к сервисам не было.'
+        return '\n'.join(f"{host}: запросов - {stat['count']}, в среднем {stat['avg']:.2f} сек., "
+                         f"максимум {stat['max']:.2f} сек." for host, stat in sorted(stats.items()))
+
+    def close(self) -> None:
+        """
+        Закрывает все соединения пула.
+        :return: Ничего не возвращает.
+        """
+        self.__session.close()
+
+    def __str__(self) -> str:
+        return f'Пул HTTP-соединений на {self.__pool_size} соединений'
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__pool_size}, {self.__timeout})"
+
+
+def call_with_retries(func, retries: int = PAGE_RETRIES, backoff: float = RETRY_BACKOFF):
+    """
+    Вызов функции с повторными попытками при ошибке.
+    Паузы между попытками растут экспоненциально: backoff, 2 * backoff, 4 * backoff и т.д.
+    Ошибки, повтор которых не поможет (ApiError с retryable=False), возбуждаются сразу.
+    :param func: Функция без аргументов, callable.
+    :param retries: Количество повторных попыток, int.
+    :param backoff: Пауза перед первой повторной попыткой, сек., float.
+    :return: Результат функции. Если все попытки неудачны, возбуждается исключение последней из них.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return func()
+        except Exception as e:
+            if attempt == retries or not getattr(e, 'retryable', True):
+                raise
+            time.sleep(backoff * 2 ** attempt)
+
+
+# Общий для всего приложения пул соединений (создаётся при первом обращении).
+_session = None
+_session_lock = threading.Lock()
+# Общие ограничители частоты запросов: {хост: RateLimiter}.
+_limiters = {}
+
+
+def get_session() -> HttpSession:
+    """
+    Возвращает общий пул HTTP-соединений приложения.
+    :return: Экземпляр HttpSession, HttpSession.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = HttpSession()
+        return _session
+
+
+def get_rate_limiter(url: str) -> RateLimiter:
+    """
+    Возвращает общий для приложения ограничитель частоты запросов к хосту сервиса:
+    все запросы к одному сервису (вакансии, справочники, в т.ч. из разных потоков) расходуют одни токены.
+    :param url: URL или хост сервиса, str.
+    :return: Экземпляр RateLimiter, RateLimiter.
+    """
+    host = urlparse(url).netloc or url
+    with _session_lock:
+        if host not in _limiters:
+            _limiters[host] = RateLimiter()
+        return _limiters[host]
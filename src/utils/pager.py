@@ -0,0 +1,131 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.constants import PAGE_SIZE
+
+# Подсказка с командами постраничного просмотра.
+PROMPT = ("\n ✅ [Enter] - следующая страница, +N - пропустить N вакансий, N - перейти к вакансии № N\n"
+          " ❌ Введите 'q', чтобы выйти из программы: ")
+
+
+class Pager:
+    """
+    Постраничный вывод вакансий на экран.
+    Страница форматируется только тогда, когда она понадобится: первая страница выводится сразу,
+    а следующая форматируется в фоновом потоке, пока пользователь читает текущую.
+    Вакансии запрашиваются у последовательности срезами (список или таблица вакансий),
+    поэтому при пропуске вакансий пропущенные записи не создаются и не форматируются.
+    """
+
+    def __init__(self, data, render, page_size: int = PAGE_SIZE, prefetch: bool = True) -> None:
+        self.__data = data  # Вакансии для вывода: последовательность с длиной и срезами
+        self.__render = render  # Форматирование вакансии: render(вакансия, номер) -> str
+        self.__page_size = max(1, page_size)  # Количество вакансий на странице
+        # Фоновое форматирование следующей страницы.
+        self.__executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        self.__pages = {}  # Отформатированные (или форматируемые) страницы: {позиция первой вакансии: Future}
+        self.position = 0  # Позиция первой вакансии текущей страницы (номер вакансии - 1)
+
+    def format_page(self, start: int) -> str:
+        """
+        Форматирование страницы.
+        :param start: Позиция первой вакансии страницы, int.
+        :return: Текст страницы, str.
+        """
+        items = self.__data[start:start + self.__page_size]
+        return '\n'.join(self.__render(item, number) for number, item in enumerate(items, start=start + 1))
+
+    def prefetch(self, start: int):
+        """
+        Запускает форматирование страницы в фоне (если она ещё не форматируется и существует).
+        :param start: Позиция первой вакансии страницы, int.
+        :return: Будущий текст страницы или None, Future | None.
+        """
+        if self.__executor is None or not 0 <= start < len(self.__data):
+            return None
+        if start not in self.__pages:
+            self.__pages[start] = self.__executor.submit(self.format_page, start)
+        return self.__pages[start]
+
+    def page(self, start: int) -> str:
+        """
+        Текст страницы: готовый, если она уже отформатирована в фоне. Сразу запускает форматирование следующей.
+        Отформатированные страницы, кроме следующей, не хранятся.
+        :param start: Позиция первой вакансии страницы, int.
+        :return: Текст страницы, str.
+        """
+        future = self.__pages.pop(start, None)
+        following = start + self.__page_size
+        self.__pages = {key: value for key, value in self.__pages.items() if key == following}
+        self.prefetch(following)
+        return future.result() if future is not None else self.format_page(start)
+
+    def pages(self):
+        """
+        Все страницы по порядку (для вывода без остановок).
+        :return: Генератор текстов страниц.
+        """
+        for start in range(0, len(self.__data), self.__page_size):
+            yield self.page(start)
+
+    def command(self, text: str):
+        """
+        Разбор команды пользователя.
+        :param text: Введённая строка, str.
+        :return: Позиция первой вакансии следующей страницы, None - выход, False - некорректная команда.
+        """
+        text = text.strip().lower()
+        if not text:
+            return self.position + self.__page_size
+        if text == 'q':
+            return None
+        if text.startswith('+') and text[1:].isdigit():
+            # Пропуск N вакансий после текущей страницы.
+            return self.position + self.__page_size + int(text[1:])
+        if text.isdigit() and 1 <= int(text) <= len(self.__data):
+            return int(text) - 1
+        return False
+
+    def run(self, ask=None, show=print) -> bool:
+        """
+        Интерактивный просмотр страниц. Просмотр заканчивается после последней страницы.
+        :param ask: Функция ввода команды (по умолчанию - input), callable.
+        :param show: Функция вывода текста, callable.
+        :return: True - просмотрены все вакансии, False - пользователь решил выйти, bool.
+        """
+        ask = ask or input
+        position = 0
+        while position < len(self.__data):
+            self.position = position
+            show(self.page(position))
+            if position + self.__page_size >= len(self.__data):
+                break
+            position = False
+            while position is False:
+                position = self.command(ask(PROMPT))
+                show()
+                if position is False:
+                    show(f'Введите команду из списка (номер вакансии - от 1 до {len(self.__data)}).')
+            if position is None:
+                return False
+        return True
+
+    def close(self) -> None:
+        """
+        Останавливает фоновое форматирование.
+        :return: Ничего не возвращает.
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+        self.__pages = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        return f'Постраничный вывод: {len(self.__data)} вакансий по {self.__page_size} на странице'
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.__data)}, {self.__page_size})"
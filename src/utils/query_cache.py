@@ -0,0 +1,201 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from src.utils.constants import PATH_QUERY_CACHE, QUERY_CACHE_TTL, QUERY_CACHE_SIZE, QUERY_CACHE_FILES
+
+
+class QueryCache:
+    """
+    Кэш результатов поиска вакансий по одинаковым запросам.
+    Два уровня: в памяти (не более max_size последних запросов, вытеснение давно не использовавшихся - LRU)
+    и на диске (по файлу на запрос, не более max_files самых свежих файлов).
+    Результат, сохранённый раньше, чем ttl секунд назад, считается устаревшим и удаляется при обращении.
+    Ведёт счётчики попаданий и промахов.
+    """
+
+    def __init__(self, path: str = PATH_QUERY_CACHE, ttl: float = QUERY_CACHE_TTL, max_size: int = QUERY_CACHE_SIZE,
+                 max_files: int = QUERY_CACHE_FILES) -> None:
+        self.__path = path  # Папка с файлами кэша
+        self.__ttl = ttl  # Срок хранения результата, сек.
+        self.__max_size = max_size  # Количество запросов в памяти
+        self.__max_files = max_files  # Количество файлов на диске
+        self.__memory = OrderedDict()  # {ключ запроса: (время сохранения, вакансии)} от давних к недавним
+        self.__stats = {'memory': 0, 'disk': 0, 'miss': 0, 'expired': 0, 'evicted': 0}
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def key(service: str, **query) -> str:
+        """
+        Ключ запроса: сервис и параметры запроса. Текст запроса приводится к нижнему регистру,
+        лишние пробелы удаляются.
+        :param service: Сервис: 'hh' или 'sj', str.
+        :param query: Параметры запроса.
+        :return: Ключ, str.
+        """
+        query = {name: ' '.join(value.lower().split()) if isinstance(value, str) else value
+                 for name, value in query.items()}
+        return f'{service}:' + json.dumps(query, ensure_ascii=False, sort_keys=True)
+
+    def file_path(self, key: str) -> str:
+        """
+        Полное имя файла кэша для запроса.
+        :param key: Ключ запроса, str.
+        :return: Полное имя файла, str.
+        """
+        return os.path.join(self.__path, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+    def get(self, key: str):
+        """
+        Результат запроса из кэша: сначала из памяти, затем с диска (найденный на диске результат
+        переносится в память).
+        :param key: Ключ запроса, str.
+        :return: Список словарей с вакансиями или None, если результата нет или он устарел, list | None.
+        """
+        with self.__lock:
+            now = time.time()
+            entry = self.__memory.get(key)
+            if entry is None:
+                entry = self.load_file(key)
+                if entry is not None and now - entry[0] < self.__ttl:
+                    self.remember(key, entry)
+                    self.__stats['disk'] += 1
+                    return entry[1]
+            elif now - entry[0] < self.__ttl:
+                self.__memory.move_to_end(key)
+                self.__stats['memory'] += 1
+                return entry[1]
+            if entry is not None:
+                # Устаревший результат удаляется из памяти и с диска.
+                self.__memory.pop(key, None)
+                if os.path.isfile(self.file_path(key)):
+                    os.remove(self.file_path(key))
+                self.__stats['expired'] += 1
+            self.__stats['miss'] += 1
+            return None
+
+    def put(self, key: str, records: list) -> None:
+        """
+        Сохраняет результат запроса в памяти и на диске.
+        :param key: Ключ запроса, str.
+        :param records: Список словарей с вакансиями, list.
+        :return: Ничего не возвращает.
+        """
+        entry = (time.time(), records)
+        with self.__lock:
+            self.remember(key, entry)
+            os.makedirs(self.__path, exist_ok=True)
+            path = self.file_path(key)
+            # Файл записывается под временным именем и заменяет старый целиком.
+            with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump({'key': key, 'time': entry[0], 'records': records}, f, ensure_ascii=False,
+                          separators=(',', ':'))
+            os.replace(path + '.tmp', path)
+            self.trim_files()
+
+    def remember(self, key: str, entry: tuple) -> None:
+        """
+        Помещает результат в память, вытесняя давно не использовавшиеся запросы.
+        :param key: Ключ запроса, str.
+        :param entry: Время сохранения и вакансии, tuple.
+        :return: Ничего не возвращает.
+        """
+        self.__memory[key] = entry
+        self.__memory.move_to_end(key)
+        while len(self.__memory) > self.__max_size:
+            self.__memory.popitem(last=False)
+            self.__stats['evicted'] += 1
+
+    def load_file(self, key: str):
+        """
+        Чтение результата запроса с диска.
+        :param key: Ключ запроса, str.
+        :return: Время сохранения и вакансии или None, если файла нет или он повреждён, tuple | None.
+        """
+        path = self.file_path(key)
+        if not os.path.isfile(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        # Совпадение хеша имени файла при разных ключах не должно приводить к чужому результату.
+        if data.get('key') != key:
+            return None
+        return data['time'], data['records']
+
+    def trim_files(self) -> None:
+        """
+        Удаляет самые старые файлы кэша сверх max_files.
+        :return: Ничего не возвращает.
+        """
+        files = [os.path.join(self.__path, name) for name in os.listdir(self.__path) if name.endswith('.json')]
+        if len(files) > self.__max_files:
+            files.sort(key=os.path.getmtime)
+            for path in files[:len(files) - self.__max_files]:
+                os.remove(path)
+                self.__stats['evicted'] += 1
+
+    def clear(self) -> None:
+        """
+        Очищает кэш в памяти и на диске.
+        :return: Ничего не возвращает.
+        """
+        with self.__lock:
+            self.__memory.clear()
+            if os.path.isdir(self.__path):
+                for name in os.listdir(self.__path):
+                    if name.endswith('.json'):
+                        os.remove(os.path.join(self.__path, name))
+
+    @property
+    def stats(self) -> dict:
+        """
+        Счётчики кэша: попадания в памяти и на диске, промахи, устаревшие и вытесненные результаты,
+        доля попаданий.
+        :return: {'memory', 'disk', 'miss', 'expired', 'evicted', 'hit_rate'}, dict.
+        """
+        with self.__lock:
+            hits = self.__stats['memory'] + self.__stats['disk']
+            total = hits + self.__stats['miss']
+            return dict(self.__stats, hit_rate=hits / total if total else 0.0)
+
+    def reset_stats(self) -> None:
+        """
+        Обнуляет счётчики кэша.
+        :return: Ничего не возвращает.
+        """
+        with self.__lock:
+            self.__stats = dict.fromkeys(self.__stats, 0)
+
+    def __len__(self) -> int:
+        return len(self.__memory)
+
+    def __str__(self) -> str:
+        stats = self.stats
+        return (f"Кэш результатов поиска: попаданий {stats['memory'] + stats['disk']}, "
+                f"промахов {stats['miss']}")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__path}, {self.__ttl}, {self.__max_size}, {self.__max_files})"
+
+
+# Общий для всего приложения кэш результатов поиска (создаётся при первом обращении).
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> QueryCache:
+    """
+    Возвращает общий кэш результатов поиска приложения.
+    :return: Экземпляр QueryCache, QueryCache.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = QueryCache()
+        return _cache
@@ -0,0 +1,90 @@
+import json
+import os
+import threading
+
+from src.utils.constants import PATH_REFRESH_STATE
+
+
+class RefreshState:
+    """
+    Состояние инкрементального обновления вакансий.
+    Для каждого запроса (сервис, ключевое слово, регион, фильтр по зарплате) хранит самую позднюю
+    дату публикации среди уже загруженных вакансий в формате API сервиса: при повторном запросе
+    загружаются только вакансии, опубликованные не раньше неё.
+    В хранилище сервиса находятся вакансии одного запроса, поэтому полная загрузка по запросу
+    удаляет состояние остальных запросов того же сервиса.
+    """
+
+    def __init__(self, path: str = PATH_REFRESH_STATE) -> None:
+        self.__path = path  # Полное имя файла состояния
+        self.__lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @staticmethod
+    def key(service: str, **query) -> str:
+        """
+        Ключ запроса в файле состояния.
+        :param service: Сервис: 'hh' или 'sj', str.
+        :param query: Параметры запроса (ключевое слово, регион, фильтр по зарплате).
+        :return: Ключ, str.
+        """
+        return f'{service}:' + json.dumps(query, ensure_ascii=False, sort_keys=True)
+
+    def load(self) -> dict:
+        """
+        Чтение состояния из файла.
+        :return: {ключ запроса: дата публикации самой свежей вакансии}, dict.
+        """
+        if not os.path.isfile(self.__path):
+            return {}
+        try:
+            with open(self.__path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            # Повреждённый файл означает отсутствие состояния: будет выполнена полная загрузка.
+            return {}
+
+    def get(self, key: str):
+        """
+        Дата публикации самой свежей из загруженных по запросу вакансий.
+        :param key: Ключ запроса, str.
+        :return: Дата в формате API сервиса или None, если запрос ещё не выполнялся, str | int.
+        """
+        with self.__lock:
+            return self.load().get(key)
+
+    def set(self, key: str, published) -> None:
+        """
+        Запоминает дату публикации самой свежей вакансии по запросу.
+        Состояние остальных запросов сервиса при полной загрузке удаляется заранее (forget).
+        :param key: Ключ запроса, str.
+        :param published: Дата в формате API сервиса, str | int.
+        :return: Ничего не возвращает.
+        """
+        with self.__lock:
+            state = self.load()
+            state[key] = published
+            with open(self.__path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False, indent=2)
+
+    def forget(self, service: str) -> None:
+        """
+        Удаляет состояние всех запросов сервиса.
+        :param service: Сервис: 'hh' или 'sj', str.
+        :return: Ничего не возвращает.
+        """
+        with self.__lock:
+            state = self.load()
+            rest = {name: value for name, value in state.items() if not name.startswith(f'{service}:')}
+            if rest != state:
+                with open(self.__path, 'w', encoding='utf-8') as f:
+                    json.dump(rest, f, ensure_ascii=False, indent=2)
+
+    def __str__(self) -> str:
+        return f'Состояние инкрементального обновления вакансий {self.__path}'
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__path})"
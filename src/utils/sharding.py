@@ -0,0 +1,270 @@
+import json
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from src.utils.constants import PATH_ARE_HH, PATH_ARE_SJ, MAX_VAK_HH, MAX_VAK_SJ, MAX_WORKERS_HH, MAX_WORKERS_SJ, \
+    SHARD_PERIOD_DAYS, SHARD_MIN_WINDOW, SHARD_MIN_PAYMENT, SHARD_LIMIT, ID_RUSSIA_SJ
+
+# Формат даты и времени публикации в параметрах date_from и date_to API hh.ru.
+DATE_FORMAT = '%Y-%m-%dT%H:%M:%S%z'
+
+
+class ShardPlanner(ABC):
+    """
+    Разбиение запроса, по которому найдено больше вакансий, чем сервис отдаёт (max_results),
+    на части (шарды), каждая из которых укладывается в этот предел.
+    Шард - параметры, которые заменяют параметры исходного запроса: регион, диапазон зарплат, окно дат публикации.
+    Способы деления (splitters) перебираются по порядку: если части, полученные очередным способом,
+    не покрывают всех вакансий шарда (например, часть вакансий привязана к самому региону, а не к дочерним),
+    шард делится следующим способом. Последний способ - деление окна дат публикации пополам,
+    пока окно не станет короче min_window секунд.
+    Первая страница каждого шарда запрашивается при планировании (чтобы узнать количество вакансий)
+    и возвращается вместе с ним, чтобы не запрашивать её повторно.
+    Количество шардов ограничено max_shards, чтобы время загрузки оставалось ограниченным.
+    """
+    # Названия параметров начала и конца окна дат публикации.
+    date_keys = ('date_from', 'date_to')
+
+    def __init__(self, path_are: str, max_results: int, period: tuple = None, min_window: float = SHARD_MIN_WINDOW,
+                 max_workers: int = MAX_WORKERS_HH, max_shards: int = SHARD_LIMIT) -> None:
+        self._path_are = path_are  # Полное имя файла справочника регионов сервиса
+        self.__max_results = max_results  # Наибольшее количество вакансий, которое сервис отдаёт по запросу
+        # Диапазон дат публикации (начало, конец), по умолчанию - последние SHARD_PERIOD_DAYS дней.
+        self.__period = period
+        self.__min_window = min_window  # Наименьшее окно дат публикации, сек.
+        self.__max_workers = max(1, max_workers)  # Количество одновременных запросов при планировании
+        self.__max_shards = max(1, max_shards)  # Наибольшее количество шардов
+        self.__tree = None  # Справочник регионов (загружается при первом обращении)
+        self.__lock = threading.Lock()
+        self.truncated = 0  # Количество вакансий, не поместившихся в шарды при последнем планировании
+
+    def tree(self) -> dict:
+        """
+        Справочник регионов сервиса.
+        :return: Справочник (пустой, если он не загружен), dict.
+        """
+        with self.__lock:
+            if self.__tree is None:
+                try:
+                    with open(self._path_are, 'r', encoding='utf-8') as f:
+                        self.__tree = json.load(f)
+                except (OSError, json.JSONDecodeError):
+                    self.__tree = {}
+            return self.__tree
+
+    @abstractmethod
+    def found(self, page: dict) -> int:
+        """Количество вакансий, найденных по запросу, по странице ответа API."""
+        pass
+
+    @abstractmethod
+    def splitters(self) -> list:
+        """Способы деления шарда в порядке перебора: функции (шард, date_from) -> список шардов."""
+        pass
+
+    @abstractmethod
+    def parse_date(self, value) -> datetime:
+        """Дата публикации в формате API -> datetime."""
+        pass
+
+    @abstractmethod
+    def format_date(self, moment: datetime):
+        """datetime -> дата публикации в формате API."""
+        pass
+
+    def period(self, date_from=None) -> tuple:
+        """
+        Диапазон дат публикации, который делится на окна.
+        :param date_from: Дата публикации, начиная с которой запрашиваются вакансии (в формате API).
+        :return: Начало и конец диапазона, tuple[datetime, datetime].
+        """
+        if self.__period is not None:
+            start, end = self.__period
+        else:
+            end = datetime.now().astimezone()
+            start = end - timedelta(days=SHARD_PERIOD_DAYS)
+        if date_from is not None:
+            start = max(start, self.parse_date(date_from))
+        return start, end
+
+    def split_dates(self, shard: dict, date_from=None) -> list:
+        """
+        Деление окна дат публикации шарда пополам.
+        :param shard: Шард, dict.
+        :param date_from: Дата публикации, начиная с которой запрашиваются вакансии (в формате API).
+        :return: Два шарда или пустой список, если окно уже не делится, list[dict].
+        """
+        key_from, key_to = self.date_keys
+        if key_from in shard:
+            start, end = self.parse_date(shard[key_from]), self.parse_date(shard[key_to])
+        else:
+            start, end = self.period(date_from)
+        if (end - start).total_seconds() <= self.__min_window:
+            return []
+        middle = start + (end - start) / 2
+        # Границы окон совпадают: вакансии, опубликованные ровно на границе, отсекаются по id.
+        return [{**shard, key_from: self.format_date(start), key_to: self.format_date(middle)},
+                {**shard, key_from: self.format_date(middle), key_to: self.format_date(end)}]
+
+    def plan(self, probe, shard: dict, first_page: dict, date_from=None) -> list:
+        """
+        Планирование шардов запроса.
+        :param probe: Функция запроса первой страницы шарда: probe(шард) -> страница ответа API, callable.
+        :param shard: Параметры исходного запроса, которые могут делиться (например, регион), dict.
+        :param first_page: Первая страница ответа API на исходный запрос, dict.
+        :param date_from: Дата публикации, начиная с которой запрашиваются вакансии (в формате API).
+        :return: Шарды с первыми страницами, list[tuple[dict, dict]].
+        """
+        self.truncated = 0
+        splitters = self.splitters()
+        done, leaves = [], 1
+        # Шарды, которые предстоит проверить: (шард, первая страница, номер первого способа деления).
+        pending = [(shard, first_page, 0)]
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            while pending:
+                splits = []
+                for item, page, level in pending:
+                    parts = []
+                    if self.found(page) > self.__max_results:
+                        # Первый способ деления, который даёт части.
+                        while level < len(splitters) and not parts:
+                            parts = splitters[level](item, date_from)
+                            level += 0 if parts else 1
+                    if not parts or leaves + len(parts) - 1 > self.__max_shards:
+                        # Шард укладывается в предел или не делится: сохраняем то, что сервис отдаёт.
+                        self.truncated += max(self.found(page) - self.__max_results, 0)
+                        done.append((item, page))
+                        continue
+                    leaves += len(parts) - 1
+                    splits.append((item, page, level, parts))
+                # Первые страницы всех новых шардов запрашиваются одновременно.
+                pages = iter(list(executor.map(probe, [part for *_, parts in splits for part in parts])))
+                pending = []
+                for item, page, level, parts in splits:
+                    children = [(part, next(pages), level) for part in parts]
+                    covered = sum(self.found(child_page) for part, child_page, _ in children)
+                    if level + 1 < len(splitters) and covered < self.found(page):
+                        # Части не покрывают всех вакансий шарда: делим его следующим способом.
+                        leaves -= len(parts) - 1
+                        pending.append((item, page, level + 1))
+                    else:
+                        pending.extend(children)
+        return done
+
+    def __str__(self) -> str:
+        return f'Разбиение запросов на части не более чем по {self.__max_results} вакансий'
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}({self._path_are}, {self.__max_results}, {self.__period}, "
+                f"{self.__min_window}, {self.__max_workers}, {self.__max_shards})")
+
+
+class ShardPlannerHH(ShardPlanner):
+    """
+    Разбиение запроса к hh.ru: по дочерним регионам из дерева справочника регионов (area),
+    затем по окнам дат публикации (date_from, date_to).
+    """
+
+    def __init__(self, path_are_hh: str = PATH_ARE_HH, max_results: int = MAX_VAK_HH, period: tuple = None,
+                 min_window: float = SHARD_MIN_WINDOW, max_workers: int = MAX_WORKERS_HH,
+                 max_shards: int = SHARD_LIMIT) -> None:
+        super().__init__(path_are_hh, max_results, period, min_window, max_workers, max_shards)
+        self.__children = None  # Дерево регионов: {id региона: [id дочерних регионов]}
+
+    def children(self, area_id) -> list:
+        """
+        id дочерних регионов/населённых пунктов по справочнику регионов hh.ru.
+        :param area_id: id региона, int | str.
+        :return: Список id дочерних регионов (пустой, если их нет или справочник не загружен), list[int].
+        """
+        if self.__children is None:
+            children, stack = {}, [self.tree()]
+            while stack:
+                node = stack.pop()
+                children[str(node.get('id'))] = [int(child['id']) for child in node.get('areas', [])]
+                stack.extend(node.get('areas', []))
+            self.__children = children
+        return self.__children.get(str(area_id), [])
+
+    def split_area(self, shard: dict, date_from: str = None) -> list:
+        """
+        Деление шарда по дочерним регионам.
+        :param shard: Шард, dict.
+        :param date_from: Не используется (для единообразия способов деления).
+        :return: Список шардов (пустой, если дочерних регионов нет), list[dict].
+        """
+        return [{**shard, 'area': area_id} for area_id in self.children(shard['area'])]
+
+    def found(self, page: dict) -> int:
+        return page['found']
+
+    def splitters(self) -> list:
+        return [self.split_area, self.split_dates]
+
+    def parse_date(self, value: str) -> datetime:
+        return datetime.strptime(value, DATE_FORMAT)
+
+    def format_date(self, moment: datetime) -> str:
+        return moment.strftime(DATE_FORMAT)
+
+
+class ShardPlannerSJ(ShardPlanner):
+    """
+    Разбиение запроса к superjob.ru: страна - по регионам (o) и городам вне регионов (town),
+    регион - по его городам; затем по диапазонам зарплат (payment_from, payment_to), если запрос
+    фильтрует по зарплате; затем по окнам дат публикации (date_published_from, date_published_to).
+    """
+    date_keys = ('date_published_from', 'date_published_to')
+
+    def __init__(self, path_are_sj: str = PATH_ARE_SJ, max_results: int = MAX_VAK_SJ, period: tuple = None,
+                 min_window: float = SHARD_MIN_WINDOW, max_workers: int = MAX_WORKERS_SJ,
+                 max_shards: int = SHARD_LIMIT, min_payment: int = SHARD_MIN_PAYMENT) -> None:
+        super().__init__(path_are_sj, max_results, period, min_window, max_workers, max_shards)
+        self.__min_payment = min_payment  # Наименьший диапазон зарплат, руб.
+
+    def split_area(self, shard: dict, date_from: int = None) -> list:
+        """
+        Деление шарда по регионам и городам справочника superjob.ru.
+        :param shard: Шард, dict.
+        :param date_from: Не используется (для единообразия способов деления).
+        :return: Список шардов (пустой, если шард - город), list[dict].
+        """
+        tree = self.tree()
+        if 'town' in shard:
+            return []
+        if 'o' in shard:
+            region = next((region for region in tree.get('regions', []) if region['id'] == shard['o']), {})
+            return [{**shard, 'town': town['id']} for town in region.get('towns', [])]
+        if tree.get('id', ID_RUSSIA_SJ) != ID_RUSSIA_SJ:
+            return []
+        return ([{**shard, 'o': region['id']} for region in tree.get('regions', [])] +
+                [{**shard, 'town': town['id']} for town in tree.get('towns', [])])
+
+    def split_payment(self, shard: dict, date_from: int = None) -> list:
+        """
+        Деление диапазона зарплат шарда пополам (только если запрос фильтрует по зарплате).
+        :param shard: Шард, dict.
+        :param date_from: Не используется (для единообразия способов деления).
+        :return: Два шарда или пустой список, list[dict].
+        """
+        if 'payment_from' not in shard:
+            return []
+        low, high = shard['payment_from'], shard['payment_to']
+        if high - low <= self.__min_payment:
+            return []
+        middle = (low + high) // 2
+        return [{**shard, 'payment_to': middle}, {**shard, 'payment_from': middle}]
+
+    def found(self, page: dict) -> int:
+        return page['total']
+
+    def splitters(self) -> list:
+        return [self.split_area, self.split_payment, self.split_dates]
+
+    def parse_date(self, value: int) -> datetime:
+        return datetime.fromtimestamp(int(value), timezone.utc)
+
+    def format_date(self, moment: datetime) -> int:
+        return int(moment.timestamp())
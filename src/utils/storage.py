@@ -0,0 +1,232 @@
+import json
+import os
+import sqlite3
+import threading
+from contextlib import closing
+
+from src.utils.constants import FILE_VAK_HH, FILE_VAK_SJ, VAK_STORAGE, PATH_VAK_DB, TIMEOUT, KEY_SALARY_MEAN, \
+    KEY_ID
+
+
+class JsonLinesStore:
+    """
+    Хранилище вакансий в формате JSON Lines: одна вакансия - одна строка файла.
+    Страницы дописываются в конец файла по мере получения, чтение выполняется потоком,
+    без загрузки всего файла в память.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.__path = path  # Полное имя файла хранилища
+        self.__lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def append(self, records: list) -> None:
+        """
+        Дописывает вакансии в конец хранилища.
+        :param records: Список словарей с вакансиями, list.
+        :return: Ничего не возвращает.
+        """
+        lines = ''.join(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n' for record in records)
+        with self.__lock:
+            with open(self.__path, 'a', encoding='utf-8') as f:
+                f.write(lines)
+
+    def __iter__(self):
+        """
+        Потоковое чтение вакансий из хранилища.
+        :return: Генератор словарей с вакансиями.
+        """
+        if not os.path.isfile(self.__path):
+            return
+        with open(self.__path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def ids(self) -> set:
+        """
+        id вакансий, находящихся в хранилище (для поиска повторов при дозагрузке).
+        :return: Множество id, set.
+        """
+        return {record[KEY_ID] for record in self if KEY_ID in record}
+
+    def clear(self) -> None:
+        """
+        Удаляет все вакансии из хранилища.
+        :return: Ничего не возвращает.
+        """
+        with self.__lock:
+            if os.path.isfile(self.__path):
+                os.remove(self.__path)
+
+    def __len__(self) -> int:
+        if not os.path.isfile(self.__path):
+            return 0
+        with open(self.__path, 'r', encoding='utf-8') as f:
+            return sum(1 for line in f if line.strip())
+
+    def __str__(self) -> str:
+        return f'Хранилище вакансий {self.__path}'
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__path})"
+
+
+class SQLiteStore:
+    """
+    Хранилище вакансий в базе данных SQLite.
+    Вакансии обоих сервисов хранятся в одной таблице с индексами по дате публикации, средней зарплате,
+    сервису и населённому пункту, поэтому выборка "первых N" по дате или зарплате выполняется
+    запросом по индексу, без загрузки и сортировки всех вакансий.
+    """
+
+    # Таблица вакансий и индексы для выборок по сервису, дате публикации, средней зарплате и населённому пункту.
+    __schema = """
+        CREATE TABLE IF NOT EXISTS vacancies (
+            num INTEGER PRIMARY KEY,
+            service TEXT NOT NULL,
+            area TEXT,
+            published TEXT NOT NULL,
+            salary_mean INTEGER NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS vacancies_published ON vacancies (published DESC, num);
+        CREATE INDEX IF NOT EXISTS vacancies_salary ON vacancies (salary_mean DESC, num);
+        CREATE INDEX IF NOT EXISTS vacancies_service_published ON vacancies (service, published DESC, num);
+        CREATE INDEX IF NOT EXISTS vacancies_service_salary ON vacancies (service, salary_mean DESC, num);
+        CREATE INDEX IF NOT EXISTS vacancies_area ON vacancies (area);
+    """
+
+    def __init__(self, path: str, service: str = None) -> None:
+        self.__path = path  # Полное имя файла базы данных
+        self.__service = service  # Сервис: 'hh', 'sj' или None (вакансии всех сервисов)
+        self.__lock = threading.Lock()
+        with self.connect() as conn:
+            conn.executescript(self.__schema)
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Открывает соединение с базой данных.
+        :return: Соединение, sqlite3.Connection.
+        """
+        return closing(sqlite3.connect(self.__path, timeout=TIMEOUT))
+
+    def where(self) -> tuple:
+        """
+        Условие отбора вакансий сервиса хранилища.
+        :return: Текст условия и его параметры, tuple(str, tuple).
+        """
+        if self.__service is None:
+            return '', ()
+        return ' WHERE service = ?', (self.__service,)
+
+    def append(self, records: list) -> None:
+        """
+        Дописывает вакансии в хранилище.
+        :param records: Список словарей с вакансиями, list.
+        :return: Ничего не возвращает.
+        """
+        if self.__service is None:
+            raise ValueError('Для добавления вакансий в хранилище необходимо указать сервис.')
+        rows = [(self.__service, record.get('04 Населённый пункт'), record['01 Дата публикации'],
+                 record.get(KEY_SALARY_MEAN, (record['06 Зарплата от'] + record['07 Зарплата до']) // 2),
+                 json.dumps(record, ensure_ascii=False, separators=(',', ':'))) for record in records]
+        with self.__lock, self.connect() as conn, conn:
+            conn.executemany('INSERT INTO vacancies (service, area, published, salary_mean, data)'
+                             ' VALUES (?, ?, ?, ?, ?)', rows)
+
+    def select(self, order: str, count: int = None) -> list:
+        """
+        Выборка вакансий в заданном порядке.
+        Вакансии с одинаковым значением ключа сортировки следуют в порядке добавления.
+        :param order: Столбец сортировки по убыванию: 'published' или 'salary_mean', str.
+        :param count: Количество вакансий (None - все), int.
+        :return: Список словарей с вакансиями, list.
+        """
+        if order not in ('published', 'salary_mean'):
+            raise ValueError(f'Сортировка по столбцу {order} не поддерживается.')
+        where, params = self.where()
+        query = f'SELECT data FROM vacancies{where} ORDER BY {order} DESC, num'
+        if count is not None:
+            query, params = query + ' LIMIT ?', params + (count,)
+        with self.connect() as conn:
+            return [json.loads(data) for data, in conn.execute(query, params)]
+
+    def newest(self, count: int = None) -> list:
+        """
+        Самые свежие вакансии.
+        :param count: Количество вакансий (None - все), int.
+        :return: Список словарей с вакансиями, list.
+        """
+        return self.select('published', count)
+
+    def top_by_salary(self, count: int = None) -> list:
+        """
+        Вакансии с наибольшей средней зарплатой в пределах "вилки" "от и до".
+        :param count: Количество вакансий (None - все), int.
+        :return: Список словарей с вакансиями, list.
+        """
+        return self.select('salary_mean', count)
+
+    def __iter__(self):
+        """
+        Потоковое чтение вакансий в порядке добавления.
+        :return: Генератор словарей с вакансиями.
+        """
+        where, params = self.where()
+        with self.connect() as conn:
+            for data, in conn.execute(f'SELECT data FROM vacancies{where} ORDER BY num', params):
+                yield json.loads(data)
+
+    def ids(self) -> set:
+        """
+        id вакансий сервиса, находящихся в хранилище (для поиска повторов при дозагрузке).
+        :return: Множество id, set.
+        """
+        where, params = self.where()
+        with self.connect() as conn:
+            rows = conn.execute(f"SELECT json_extract(data, '$.{KEY_ID}') FROM vacancies{where}", params)
+            return {vacancy_id for vacancy_id, in rows if vacancy_id is not None}
+
+    def clear(self) -> None:
+        """
+        Удаляет из хранилища все вакансии сервиса.
+        :return: Ничего не возвращает.
+        """
+        where, params = self.where()
+        with self.__lock, self.connect() as conn, conn:
+            conn.execute(f'DELETE FROM vacancies{where}', params)
+
+    def __len__(self) -> int:
+        where, params = self.where()
+        with self.connect() as conn:
+            return conn.execute(f'SELECT COUNT(*) FROM vacancies{where}', params).fetchone()[0]
+
+    def __str__(self) -> str:
+        return f'Хранилище вакансий SQLite {self.__path}'
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__path}, {self.__service})"
+
+
+def make_store(service: str, path_vak: str, backend: str = VAK_STORAGE, path_db: str = PATH_VAK_DB):
+    """
+    Создаёт хранилище вакансий сервиса в соответствии с выбранным способом хранения.
+    :param service: Сервис: 'hh' или 'sj', str.
+    :param path_vak: Папка для хранения файлов с вакансиями сервиса, str.
+    :param backend: Способ хранения: 'jsonl' или 'sqlite', str.
+    :param path_db: Полное имя файла базы данных SQLite, str.
+    :return: Хранилище вакансий, JsonLinesStore | SQLiteStore.
+    """
+    if backend == 'sqlite':
+        return SQLiteStore(path_db, service)
+    if backend == 'jsonl':
+        return JsonLinesStore(os.path.join(path_vak, FILE_VAK_HH if service == 'hh' else FILE_VAK_SJ))
+    raise ValueError(f'Неизвестный способ хранения вакансий: {backend}.')
@@ -0,0 +1,180 @@
+import heapq
+from array import array
+
+from src.utils.vacancy import Vacancy
+
+# Поля записи Vacancy, хранящиеся в таблице в виде кодов (повторяющиеся значения).
+ENCODED = ('published', 'currency', 'schedule', 'employment', 'experience', 'area', 'employer')
+# Поля записи Vacancy, хранящиеся в таблице в виде целых чисел.
+NUMERIC = ('day', 'salary_from', 'salary_to', 'salary_mean', 'salary_rub')
+# Остальные поля записи Vacancy: хранятся списками значений.
+PLAIN = tuple(field for field in Vacancy.__slots__ if field not in ENCODED + NUMERIC)
+# Ключи сортировки: {название: числовой столбец}.
+SORT_KEYS = {'date': 'day', 'salary': 'salary_mean', 'salary_rub': 'salary_rub'}
+
+
+class VacancyTable:
+    """
+    Таблица вакансий в памяти, хранящая данные по столбцам.
+    Номера дней и зарплаты - массивы целых чисел, повторяющиеся строки (дата, валюта, график, занятость, опыт,
+    населённый пункт, работодатель) - массивы кодов и словари значений.
+    Фильтрация, сортировка и отбор первых N возвращают представление той же таблицы
+    с другим набором номеров строк, без копирования столбцов.
+    """
+
+    def __init__(self, columns: dict, values: dict, index: array = None) -> None:
+        self.__columns = columns  # {поле: столбец (array или list)}
+        self.__values = values  # {кодируемое поле: значения по кодам}
+        # Номера строк представления в порядке вывода.
+        self.__index = index if index is not None else array('l', range(len(columns['day'])))
+
+    @classmethod
+    def from_vacancies(cls, vacancies):
+        """
+        Построение таблицы по вакансиям.
+        :param vacancies: Вакансии (записи или словари в формате хранилищ), iterable.
+        :return: Таблица, VacancyTable.
+        """
+        columns = {field: array('q') for field in NUMERIC}
+        columns.update({field: array('l') for field in ENCODED})
+        columns.update({field: [] for field in PLAIN})
+        values = {field: [] for field in ENCODED}
+        encoders = {field: {} for field in ENCODED}
+
+        numeric = [(field, columns[field].append) for field in NUMERIC]
+        encoded = [(field, columns[field].append, values[field], encoders[field]) for field in ENCODED]
+        plain = [(field, columns[field].append) for field in PLAIN]
+        for vacancy in vacancies:
+            if not isinstance(vacancy, Vacancy):
+                vacancy = Vacancy.from_dict(vacancy)
+            for field, append in numeric:
+                append(getattr(vacancy, field))
+            for field, append, field_values, encoder in encoded:
+                value = getattr(vacancy, field)
+                code = encoder.get(value)
+                if code is None:
+                    code = encoder[value] = len(field_values)
+                    field_values.append(value)
+                append(code)
+            for field, append in plain:
+                append(getattr(vacancy, field))
+        return cls(columns, values)
+
+    def column(self, field: str) -> list:
+        """
+        Значения столбца для строк представления (кодируемые поля - раскодированные).
+        :param field: Поле записи Vacancy, str.
+        :return: Список значений, list.
+        """
+        column = self.__columns[field]
+        if field in ENCODED:
+            values = self.__values[field]
+            return [values[column[num]] for num in self.__index]
+        return [column[num] for num in self.__index]
+
+    def codes(self, field: str) -> tuple:
+        """
+        Коды кодируемого столбца для строк представления и значения по кодам.
+        :param field: Кодируемое поле записи Vacancy, str.
+        :return: Коды (array) и значения по кодам (list), tuple.
+        """
+        column = self.__columns[field]
+        return array('l', (column[num] for num in self.__index)), self.__values[field]
+
+    def view(self, index) -> 'VacancyTable':
+        """
+        Представление той же таблицы с другим набором строк.
+        :param index: Номера строк, iterable.
+        :return: Таблица, VacancyTable.
+        """
+        return VacancyTable(self.__columns, self.__values, array('l', index))
+
+    def filter(self, salary_min: int = None, salary_max: int = None, with_salary: bool = False,
+               day_from: int = None, **equal) -> 'VacancyTable':
+        """
+        Отбор строк по условиям. Строковые условия проверяются по кодам значений.
+        :param salary_min: Минимальная средняя зарплата в рублях, int.
+        :param salary_max: Максимальная средняя зарплата в рублях, int.
+        :param with_salary: Только вакансии с указанной зарплатой, bool.
+        :param day_from: Номер дня, начиная с которого опубликованы вакансии, int.
+        :param equal: Условия на кодируемые поля: {поле: значение или набор значений}, например schedule='Полный день'.
+        :return: Таблица с отобранными строками, VacancyTable.
+        """
+        index = self.__index
+        salary = self.__columns['salary_rub']
+        if with_salary:
+            index = [num for num in index if salary[num] > 0]
+        if salary_min is not None:
+            index = [num for num in index if salary[num] >= salary_min]
+        if salary_max is not None:
+            index = [num for num in index if salary[num] <= salary_max]
+        if day_from is not None:
+            day = self.__columns['day']
+            index = [num for num in index if day[num] >= day_from]
+        for field, wanted in equal.items():
+            if field not in ENCODED:
+                raise ValueError(f'Отбор по полю {field} не поддерживается.')
+            wanted = {wanted} if isinstance(wanted, str) or wanted is None else set(wanted)
+            codes = {code for code, value in enumerate(self.__values[field]) if value in wanted}
+            column = self.__columns[field]
+            index = [num for num in index if column[num] in codes]
+        return self.view(index)
+
+    def sort(self, by: str = 'date') -> 'VacancyTable':
+        """
+        Сортировка по убыванию даты или зарплаты. Строки с равными ключами сохраняют порядок.
+        :param by: Ключ сортировки: 'date', 'salary' (средняя зарплата) или 'salary_rub' (она же в рублях), str.
+        :return: Отсортированная таблица, VacancyTable.
+        """
+        return self.view(sorted(self.__index, key=self.sort_column(by).__getitem__, reverse=True))
+
+    def top(self, count: int, by: str = 'date') -> 'VacancyTable':
+        """
+        Первые count строк по убыванию даты или зарплаты, в том же порядке, что и sort(by)[:count].
+        :param count: Количество строк, int.
+        :param by: Ключ сортировки: 'date', 'salary' или 'salary_rub', str.
+        :return: Таблица, VacancyTable.
+        """
+        return self.view(heapq.nlargest(count, self.__index, key=self.sort_column(by).__getitem__))
+
+    def sort_column(self, by: str) -> array:
+        """
+        Числовой столбец, соответствующий ключу сортировки.
+        :param by: Ключ сортировки: 'date', 'salary' или 'salary_rub', str.
+        :return: Столбец, array.
+        """
+        if by not in SORT_KEYS:
+            raise ValueError(f'Сортировка по {by} не поддерживается.')
+        return self.__columns[SORT_KEYS[by]]
+
+    def row(self, num: int) -> Vacancy:
+        """
+        Запись вакансии по номеру строки таблицы.
+        :param num: Номер строки таблицы, int.
+        :return: Запись вакансии, Vacancy.
+        """
+        values = {field: self.__columns[field][num] for field in NUMERIC + PLAIN}
+        values.update({field: self.__values[field][self.__columns[field][num]] for field in ENCODED})
+        return Vacancy(**values)
+
+    def __iter__(self):
+        """
+        Записи вакансий в порядке строк представления.
+        :return: Генератор записей, Vacancy.
+        """
+        for num in self.__index:
+            yield self.row(num)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self.view(self.__index[item])
+        return self.row(self.__index[item])
+
+    def __len__(self) -> int:
+        return len(self.__index)
+
+    def __str__(self) -> str:
+        return f'Таблица вакансий: {len(self.__index)} строк'
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.__index)}, {len(self.__columns['day'])})"
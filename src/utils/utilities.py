@@ -1,37 +1,45 @@
 # Функции для модуля main.py
+from concurrent.futures import ThreadPoolExecutor
+
 from src.utils.areas import AreasHH, AreasSJ
-from src.utils.constants import PATH_VAK_DIR_HH, PATH_ARE_HH, PATH_VAK_DIR_SJ, PATH_ARE_SJ, URL_AREAS_HH, URL_AREAS_SJ
+from src.utils.areas_mapping import AreasMapping
+from src.utils.constants import PATH_VAK_DIR_HH, PATH_ARE_HH, PATH_VAK_DIR_SJ, PATH_ARE_SJ, URL_AREAS_HH, URL_AREAS_SJ, \
+    AREAS_TTL, ID_RUSSIA_HH, ID_RUSSIA_SJ, FUZZY_THRESHOLD
+from src.utils.dedup import DedupIndex
+from src.utils.query_cache import get_cache
 from src.utils.vacancies import VacHH, VacSJ, VacPrint
 
 
 def loading_regions_hh(url: str = URL_AREAS_HH, path_vak_dir_hh: str = PATH_VAK_DIR_HH,
-                       path_are_hh: str = PATH_ARE_HH) -> None:
+                       path_are_hh: str = PATH_ARE_HH, ttl: float = AREAS_TTL) -> None:
     """
     Загружает перечни регионов и городов с сервиса hh.ru.
     :param url: URL регионов, str.
     :param path_vak_dir_hh: Путь к директории для хранения файла, str.
     :param path_are_hh: Полное имя файла, str.
+    :param ttl: Срок актуальности ранее загруженного справочника, сек., float.
     :return: Json-файл с регионами/населёнными пунктами.
     """
     # Создаём экземпляр класса AreasHH, по-умолчанию регион "Россия".
     area_hh = AreasHH(url=url, path_vak_dir_hh=path_vak_dir_hh, path_are_hh=path_are_hh)
     # Получаем словарь с регионами и сохраняем его в json-файл.
-    area_hh.request_to_api()
+    area_hh.request_to_api(ttl)
 
 
 def loading_regions_sj(url: str = URL_AREAS_SJ, path_vak_dir_sj: str = PATH_VAK_DIR_SJ,
-                       path_are_sj: str = PATH_ARE_SJ) -> None:
+                       path_are_sj: str = PATH_ARE_SJ, ttl: float = AREAS_TTL) -> None:
     """
     Загружает перечни регионов и городов с сервиса superjob.ru.
     :param url: URL регионов, str.
     :param path_vak_dir_sj: Путь к директории для хранения файла, str.
     :param path_are_sj: Полное имя файла, str.
+    :param ttl: Срок актуальности ранее загруженного справочника, сек., float.
     :return: Json-файл с регионами/населёнными пунктами.
     """
     # Создаём экземпляр класса AreasSJ, по-умолчанию регион "Россия".
     area_sj = AreasSJ(url=url, path_vak_dir_sj=path_vak_dir_sj, path_are_sj=path_are_sj)
     # Получаем словарь с регионами и сохраняем его в json-файл.
-    area_sj.request_to_api()
+    area_sj.request_to_api(ttl)
 
 
 def program_info() -> str:
@@ -81,6 +89,7 @@ def service_menu_selection() -> str:
                  f'Для этого введите:\n'
                  f'   ✅ HeadHunter (hh.ru)........ - 1\n'
                  f'   ✅ SuperJob (superjob.ru).... - 2\n'
+                 f'   ✅ Оба сервиса одновременно.. - 3\n'
                  f'   ❌ Завершить работу программы - 0.\n\n'
                  f'Введите команду: ')
 
@@ -103,6 +112,9 @@ def service_selection(name: str, num_vak: str) -> int:
                 # SuperJob (superjob.ru)
                 case 2:
                     print(f'\n{name}, Вы выбрали SuperJob (superjob.ru). 👌\n')
+                # Оба сервиса
+                case 3:
+                    print(f'\n{name}, Вы выбрали оба сервиса: HeadHunter (hh.ru) и SuperJob (superjob.ru). 👌\n')
                 # Завершение работы программы.
                 case 0:
                     exit_program(name)  # Выход из приложения
@@ -185,23 +197,71 @@ def search_area_id(area_vak: str, service: str, name: str) -> int:
         # Если выбран HeadHunter
         if service == 'hh':
             # Переопределяем экземпляр класса AreasHH с указанием региона, указанного пользователем.
-            area_hh = AreasHH(area=area_vak)
-            # Получаем id региона/населённого пункта, который указал пользователь.
-            return area_hh.extract_area_id()
+            area = AreasHH(area=area_vak)
+            area_id_country = ID_RUSSIA_HH
         # Если выбран SuperJob
         elif service == 'sj':
             # Переопределяем экземпляр класса AreasSJ с указанием региона, указанного пользователем.
-            area_sj = AreasSJ(area=area_vak)
-            # Получаем id региона/населённого пункта, который указал пользователь.
-            return area_sj.extract_area_id()
+            area = AreasSJ(area=area_vak)
+            area_id_country = ID_RUSSIA_SJ
         # Если указано что-то другое
         else:
             print('Программа не ищет данные на указанном сервисе.')
             exit_program(name)
+        # Получаем id региона/населённого пункта, который указал пользователь.
+        area_id = area.extract_area_id()
+        # Если точного совпадения нет, ищем похожие названия.
+        if area_id == area_id_country:
+            area_id = refine_area_id(area, area_id_country)
+        return area_id
     except ValueError:
         raise ValueError('Некорректные данные о сервисе.')
 
 
+def refine_area_id(area: object, area_id_country: int) -> int:
+    """
+    Нечёткий поиск региона/населённого пункта, название которого не найдено точно
+    (опечатки, пробелы вместо дефисов, "е" вместо "ё").
+    :param area: Экземпляр класса AreasHH или AreasSJ с названием, указанным пользователем, object.
+    :param area_id_country: id страны по умолчанию (Россия), int.
+    :return: id наиболее похожего региона/населённого пункта или id страны, int.
+    """
+    candidates = area.search_areas()
+    # Название почти совпадает с имеющимся в справочнике.
+    if candidates and candidates[0][2] >= FUZZY_THRESHOLD:
+        print(f'\nМы нашли похожий регион/населённый пункт: {candidates[0][0]}.')
+        return candidates[0][1]
+    # Показываем пользователю похожие варианты.
+    if candidates:
+        print(f'\nВозможно, Вы имели в виду: {", ".join(title for title, _, _ in candidates)}.')
+    return area_id_country
+
+
+def convert_area_id(area_id: int, service: str, region: bool = False) -> tuple:
+    """
+    Перевод id региона/населённого пункта одного сервиса в id другого сервиса
+    по таблице соответствия справочников.
+    У superjob.ru id регионов и населённых пунктов могут совпадать, поэтому вместе с id
+    передаётся признак региона.
+    :param area_id: id региона/населённого пункта, int.
+    :param service: Сервис, которому принадлежит id: "hh" - HeadHunter, "sj" - SuperJob, str.
+    :param region: id superjob.ru - регион (True) или населённый пункт (False), bool.
+    :return: id на другом сервисе и признак региона superjob.ru (для hh.ru - False),
+             если соответствие не найдено, то id России, tuple[int, bool].
+    """
+    mapping = AreasMapping.for_directories()
+    if service == 'hh':
+        area_sj = mapping.to_sj(area_id)
+        if area_sj is None:
+            if area_id != ID_RUSSIA_HH:
+                print('\nРегион/населённый пункт не найден в справочнике superjob.ru:'
+                      ' на superjob.ru ищем вакансии по всей России.')
+            return ID_RUSSIA_SJ, False
+        return area_sj
+    area_id = mapping.to_hh(area_id, region)
+    return (ID_RUSSIA_HH if area_id is None else area_id), False
+
+
 def selection_menu_sections_id(num_area: str, name: str) -> tuple:
     """
     Выбор пунктов меню для поиска id региона/населённого пункта.
@@ -391,7 +451,7 @@ def get_job_info(service: str, name: str, name_vak: str, area_id: int, only_with
                  sort_method: int) -> tuple:
     """
     Получение информации о вакансиях при помощи классов VakHH и VakSJ.
-    :param service: Строка, указывающая на выбор сервиса: "hh" - HeadHunter, "sj" - SuperJob, str.
+    :param service: Строка, указывающая на выбор сервиса: "hh" - HeadHunter, "sj" - SuperJob, "all" - оба, str.
     :param name: Имя пользователя, str.
     :param name_vak: Ключевое слово для поиска вакансии, str.
     :param area_id: ID региона для поиска вакансий, int.
@@ -406,10 +466,11 @@ def get_job_info(service: str, name: str, name_vak: str, area_id: int, only_with
         if service == 'hh':
             # Создаём экземпляр класса VacHH - вакансии с hh.ru.
             if only_with_salary or salary != 0:
-                prof_hh = VacHH(position=name_vak, area=area_id, only_with_salary=only_with_salary, salary=salary)
+                prof_hh = VacHH(position=name_vak, area=area_id, only_with_salary=only_with_salary, salary=salary,
+                                cache=get_cache())
                 prof_print = VacPrint(sort_method=sort_method)
             else:
-                prof_hh = VacHH(position=name_vak, area=area_id)
+                prof_hh = VacHH(position=name_vak, area=area_id, cache=get_cache())
                 prof_print = VacPrint()
 
             # Получаем все вакансии в соответствии с запросом пользователя,
@@ -423,10 +484,11 @@ def get_job_info(service: str, name: str, name_vak: str, area_id: int, only_with
         elif service == 'sj':
             # Создаём экземпляр класса VacSJ - вакансии с superjob.ru.
             if only_with_salary or salary != 0:
-                prof_sj = VacSJ(position=name_vak, area=area_id, only_with_salary=only_with_salary, salary=salary)
+                prof_sj = VacSJ(position=name_vak, area=area_id, only_with_salary=only_with_salary, salary=salary,
+                                cache=get_cache())
                 prof_print = VacPrint(sort_method=sort_method)
             else:
-                prof_sj = VacSJ(position=name_vak, area=area_id)
+                prof_sj = VacSJ(position=name_vak, area=area_id, cache=get_cache())
                 prof_print = VacPrint()
 
             # Получаем все вакансии в соответствии с запросом пользователя,
@@ -436,6 +498,32 @@ def get_job_info(service: str, name: str, name_vak: str, area_id: int, only_with
             # Размер словаря с вакансиями.
             return prof_sj.size_dict, prof_print
 
+        # Если выбраны оба сервиса
+        elif service == 'all':
+            # Регион выбран по справочнику hh.ru, для superjob.ru находим соответствующий ему.
+            area_id_sj, region_sj = convert_area_id(area_id, 'hh')
+            # Общий индекс повторов: одна и та же вакансия с обоих сервисов учитывается один раз.
+            dedup = DedupIndex()
+            if only_with_salary or salary != 0:
+                prof_hh = VacHH(position=name_vak, area=area_id, only_with_salary=only_with_salary, salary=salary,
+                                cache=get_cache(), dedup=dedup)
+                prof_sj = VacSJ(position=name_vak, area=area_id_sj, only_with_salary=only_with_salary, salary=salary,
+                                cache=get_cache(), dedup=dedup, region=region_sj)
+                prof_print = VacPrint(sort_method=sort_method)
+            else:
+                prof_hh = VacHH(position=name_vak, area=area_id, cache=get_cache(), dedup=dedup)
+                prof_sj = VacSJ(position=name_vak, area=area_id_sj, cache=get_cache(), dedup=dedup, region=region_sj)
+                prof_print = VacPrint()
+
+            # Получаем вакансии с обоих сервисов одновременно, сохраняя их в json-файлы.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [executor.submit(prof.vacancies_all) for prof in (prof_hh, prof_sj)]
+                for future in futures:
+                    future.result()
+
+            # Общий размер словарей с вакансиями без вакансий, опубликованных на обоих сервисах.
+            return prof_hh.size_dict + prof_sj.size_dict - dedup.near_duplicates, prof_print
+
         # Если указано что-то другое
         else:
             print('Программа не ищет данные на указанном сервисе.')
@@ -458,11 +546,11 @@ def reselect_position() -> str:
 def print_vacancies(service: str, count_vak: str, size_dict_vak: int, prof_print: object, one_each: int = 1) -> bool:
     """
     Вывод вакансий на экран.
-    :param service: Строка, указывающая на выбор сервиса: "hh" - HeadHunter, "sj" - SuperJob, str.
+    :param service: Строка, указывающая на выбор сервиса: "hh" - HeadHunter, "sj" - SuperJob, "all" - оба, str.
     :param count_vak: Количество вакансий, выбранных пользователем, str.
     :param size_dict_vak: Найденное количество вакансий, int.
     :param prof_print: Экземпляр класса вывода вакансий в терминал, object.
-    :param one_each: Вывод вакансий: 1 - по одной, другое - все сразу, int.
+    :param one_each: Вывод вакансий: 1 - постранично, другое - все сразу, int.
     :return: Флаг, который при выполнении задачи, прекращает итерации цикла, bool.
     """
 
@@ -492,7 +580,7 @@ def displaying_jobs_screen(service: str, name: str, name_vak: str, area_id: int,
                            sort_method: int) -> None:
     """
     Вывод данных о вакансиях на экран.
-    :param service: Строка, указывающая на выбор сервиса: "hh" - HeadHunter, "sj" - SuperJob, str.
+    :param service: Строка, указывающая на выбор сервиса: "hh" - HeadHunter, "sj" - SuperJob, "all" - оба, str.
     :param name: Имя пользователя, str.
     :param name_vak: Ключевое слово для поиска вакансии, str.
     :param area_id: ID региона для поиска вакансий, int.
@@ -526,6 +614,8 @@ def displaying_jobs_screen(service: str, name: str, name_vak: str, area_id: int,
                     print(f'\n❗{name}, Вы ввели некорректную команду. Попробуйте ещё раз: ')
                     all_ok_position = False
         else:
+            # Статистика зарплат по найденным вакансиям: по всем и по самым многочисленным населённым пунктам.
+            print(prof_print.salary_stats(service).report(group='region'), end='\n\n')
             # Вывод информации о вакансиях
             count_vak = input(f'Какое количество вакансий из найденных '
                               f'({size_dict_vak} шт.) Вы бы хотели увидеть? ')
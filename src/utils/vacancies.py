@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import sys
@@ -5,27 +6,237 @@ from abc import ABC, abstractmethod
 import time
 from datetime import datetime
 
-import requests
-from tqdm import trange
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from tqdm import tqdm, trange
 import re
 
-from src.utils.constants import PATH_VAK_HH, SUPERJOB_API_KEY, PATH_VAK_SJ, ID_RUSSIA_HH, ID_RUSSIA_SJ
+from src.utils.analytics import SalaryStats
+from src.utils.async_fetch import AsyncFetcher
+from src.utils.checkpoint import PageCheckpoint
+from src.utils.dedup import DedupIndex
+from src.utils.fields import FieldExtractor, Salary
+from src.utils.constants import PATH_VAK_HH, SUPERJOB_API_KEY, PATH_VAK_SJ, ID_RUSSIA_HH, ID_RUSSIA_SJ, URL_VAC_HH, \
+    MAX_VAK_HH, MAX_WORKERS_HH, URL_VAC_SJ, MAX_VAK_SJ, VAK_STORAGE, PATH_VAK_DB, KEY_ID, \
+    VAK_INCREMENTAL, FILE_PAGES_HH, FILE_PAGES_SJ, PAGE_RETRIES, RETRY_BACKOFF, PAGES_RESUME, VAK_SHARDING, \
+    MAX_WORKERS_SJ
+from src.utils.network import RateLimiter, HttpSession, ApiError, get_session, get_rate_limiter, call_with_retries, \
+    check_response
+from src.utils.pager import Pager
+from src.utils.query_cache import QueryCache
+from src.utils.refresh import RefreshState
+from src.utils.sharding import ShardPlanner, ShardPlannerHH, ShardPlannerSJ
+from src.utils.storage import JsonLinesStore, SQLiteStore, make_store
+from src.utils.table import VacancyTable
+from src.utils.vacancy import Vacancy
+from src.utils.words import coord_words_num
+
+
+# Поля вакансии hh.ru: {подпись: путь к значению в ответе API или функция от вакансии в формате API}.
+FIELDS_HH = {
+    '01 Дата публикации': lambda value: value["published_at"].split('T')[0],
+    '02 Должность': lambda value: value["name"] + '.',
+    '03 Работодатель': ("employer", "name"),
+    '04 Населённый пункт': ("area", "name"),
+    '05 Адрес': ("address", "raw"),
+    '06 Зарплата от': Salary("salary", "from"),
+    '07 Зарплата до': Salary("salary", "to"),
+    '08 Валюта': ("salary", "currency"),
+    '09 График работы': ("schedule", "name"),
+    '10 Занятость': ("employment", "name"),
+    '11 Опыт работы': ("experience", "name"),
+    '12 Требования к соискателю': ("snippet", "requirement"),
+    '13 Обязанности': ("snippet", "responsibility"),
+    '14 Подробнее здесь (URL)': ("alternate_url",),
+    KEY_ID: lambda value: str(value['id']),
+}
+
+# Поля вакансии superjob.ru: {подпись: путь к значению в ответе API или функция от вакансии в формате API}.
+FIELDS_SJ = {
+    '01 Дата публикации': lambda value: time.strftime("%Y-%m-%d", time.gmtime(float(value["date_published"]))),
+    '02 Должность': lambda value: value["profession"] + '.',
+    '03 Работодатель': ("client", "title"),
+    '04 Населённый пункт': ("client", "town", "title"),
+    '05 Адрес': ("address",),
+    '06 Зарплата от': Salary("payment_from"),
+    '07 Зарплата до': Salary("payment_to"),
+    '08 Валюта': ("currency",),
+    '09 График работы': ("place_of_work", "title"),
+    '10 Занятость': ("type_of_work", "title"),
+    '11 Опыт работы': ("experience", "title"),
+    '12 Требования к соискателю': ("education", "title"),
+    '13 Обязанности': ("vacancyRichText",),
+    '14 Подробнее здесь (URL)': ("link",),
+    KEY_ID: lambda value: str(value['id']),
+}
 
 
 class Vacancies(ABC):
     """
     Абстрактный класс выполнения запросов по API:
     поиска, обработки, фильтрации и вывода вакансий.
+    Общая для сервисов часть загрузки - хранилище вакансий, инкрементальное обновление, кэш результатов
+    и контрольная точка постраничной загрузки; параметры запроса, от которых зависит его результат,
+    и обработку страницы ответа API задают наследники (query_params, save_page).
     """
 
+    # Сервис, вакансии которого загружаются: 'hh' или 'sj'.
+    service = ''
+    # Имя файла контрольной точки постраничной загрузки (в папке с вакансиями).
+    file_pages = ''
+
+    def __init__(self, url: str, path_vak: str, store, incremental: bool, state: RefreshState, dedup: DedupIndex,
+                 cache: QueryCache, planner: ShardPlanner, resume: bool) -> None:
+        self._url = url  # URL поиска вакансий
+        self._path_vak = path_vak  # Папка для хранения файлов с вакансиями
+        # Хранилище вакансий (по умолчанию - в соответствии с константой VAK_STORAGE)
+        self._store = store if store is not None else make_store(self.service, path_vak)
+        self.size_dict = 0  # Счётчик количества словарей с вакансиями
+        self.size_new = 0  # Количество новых вакансий, добавленных в хранилище при последнем запросе
+        self.__incremental = incremental  # Дозагружать только вакансии, опубликованные после предыдущего запроса
+        self.__state = state if state is not None else RefreshState()  # Состояние инкрементального обновления
+        self._date_from = None  # Дата публикации, начиная с которой запрашиваются вакансии (в формате API)
+        self._newest = None  # Дата публикации самой свежей из полученных вакансий (в формате API)
+        # Индекс повторов: id и отпечатки вакансий, уже находящихся в хранилище (может быть общим для сервисов)
+        self._dedup = dedup if dedup is not None else DedupIndex()
+        self.__cache = cache  # Кэш результатов поиска (None - без кэширования)
+        # Планировщик разбиения запроса на части сверх предела выдачи сервиса (None - без разбиения)
+        self._planner = planner
+        self.__resume = resume  # Продолжать прерванную загрузку с недостающих страниц
+        # Контрольная точка постраничной загрузки (хранится в папке с вакансиями)
+        self._checkpoint = PageCheckpoint(os.path.join(path_vak, self.file_pages))
+
+    @property
+    def store(self):
+        return self._store
+
     @abstractmethod
-    def __init__(self):
+    def query_params(self) -> dict:
+        """Параметры запроса, от которых зависит его результат: {название: значение}."""
         pass
 
+    def query_key(self) -> str:
+        """
+        Ключ запроса в состоянии инкрементального обновления.
+        :return: Ключ, str.
+        """
+        return RefreshState.key(self.service, **self.query_params())
+
+    def cache_key(self) -> str:
+        """
+        Ключ запроса в кэше результатов поиска.
+        Признак "только с зарплатой" передаётся сервису только вместе с размером зарплаты,
+        поэтому без неё не учитывается.
+        :return: Ключ, str.
+        """
+        params = self.query_params()
+        params['only_with_salary'] = params['only_with_salary'] and params['salary'] != 0
+        return QueryCache.key(self.service, url=self._url, **params, shard=self._planner is not None)
+
+    def load_cached(self) -> bool:
+        """
+        Заполняет хранилище результатом того же запроса из кэша, без обращения к сервису.
+        :return: True - результат найден в кэше, False - его нужно загрузить, bool.
+        """
+        if self.__cache is None:
+            return False
+        records = self.__cache.get(self.cache_key())
+        if records is None:
+            return False
+        self.clear_store()
+        self._store.append(records)
+        self._dedup.seed(self.service, self._store)
+        self.size_dict, self.size_new = len(records), 0
+        return True
+
+    def save_cached(self) -> None:
+        """
+        Сохраняет результат запроса (все вакансии хранилища) в кэше.
+        :return: Ничего не возвращает.
+        """
+        if self.__cache is not None and self.size_dict != 0:
+            self.__cache.put(self.cache_key(), list(self._store))
+
+    def start_refresh(self) -> bool:
+        """
+        Подготовка хранилища к загрузке вакансий.
+        Если включено инкрементальное обновление, запрос уже выполнялся и его вакансии находятся в хранилище,
+        будут запрошены только вакансии, опубликованные после самой свежей из них.
+        Иначе папка с файлами и хранилище очищаются от устаревших данных.
+        :return: True - дозагрузка новых вакансий, False - полная загрузка, bool.
+        """
+        self._date_from, self._newest = None, None
+        self._dedup.forget(self.service)
+        self.size_new = 0
+        if self.__incremental:
+            self._date_from = self.__state.get(self.query_key())
+        if self._date_from is not None and len(self._store):
+            self._newest = self._date_from
+            self._dedup.seed(self.service, self._store)
+            self.size_dict = len(self._store)
+            return True
+        self._date_from = None
+        self.clear_store()
+        self.size_dict = 0
+        return False
+
+    def clear_store(self) -> None:
+        """
+        Удаляет файлы из папки с вакансиями и очищает хранилище.
+        :return: Ничего не возвращает.
+        """
+        Mixin.delete_files_in_folder(self._path_vak)
+        self._store.clear()
+        # Вакансии других запросов удалены из хранилища вместе с ними.
+        self.__state.forget(self.service)
+
+    def finish_refresh(self) -> None:
+        """
+        Запоминает дату публикации самой свежей из загруженных вакансий для следующего запроса.
+        :return: Ничего не возвращает.
+        """
+        if self.__incremental and self._newest is not None:
+            self.__state.set(self.query_key(), self._newest)
+
+    def resume_pages(self):
+        """
+        Восстанавливает состояние прерванной загрузки того же запроса по контрольной точке.
+        Вакансии сохранённых страниц остаются в хранилище, повторно загружаются только недостающие страницы.
+        :return: Номера сохранённых страниц и количество страниц или None, если продолжать нечего, tuple | None.
+        """
+        if not self.__resume:
+            return None
+        data = self._checkpoint.load(self.cache_key())
+        if data is None or not data['saved']:
+            return None
+        self._date_from, self._newest = data['date_from'], data['newest']
+        self._dedup.seed(self.service, self._store)
+        self.size_dict, self.size_new = len(self._store), data['new']
+        return set(data['saved']), data['pages']
+
+    def save_checkpoint(self, page: int, js_obj: dict, saved: set, pages: int) -> None:
+        """
+        Сохраняет страницу в хранилище и отмечает её в контрольной точке.
+        :param page: Индекс страницы, int.
+        :param js_obj: Страница ответа API, dict.
+        :param saved: Номера сохранённых страниц (дополняется), set.
+        :param pages: Количество страниц, int.
+        :return: Ничего не возвращает.
+        """
+        self.save_page(js_obj)
+        saved.add(page)
+        self._checkpoint.save(self.cache_key(), saved=sorted(saved), pages=pages, date_from=self._date_from,
+                              newest=self._newest, new=self.size_new)
+
     @abstractmethod
     def request_to_api(self) -> str:
         pass
 
+    @abstractmethod
+    def save_page(self, js_obj: dict) -> None:
+        """Обработка страницы ответа API и сохранение её вакансий в хранилище."""
+        pass
+
     @abstractmethod
     def vacancies_all(self) -> None:
         pass
@@ -44,96 +255,6 @@ class Mixin:
     Класс примеси содержит статические методы, позволяющие выполнять различные задачи наследникам.
     """
 
-    @staticmethod
-    def one_level(dict_vak: dict, vacancy: dict, key_0: str, key_1: str) -> None:
-        """
-        Проверка и обработка данных из исходного словаря.
-        Два уровня вложенности ключей в словаре.
-        :param dict_vak: Словарь вакансии (анализируемый), dict.
-        :param vacancy: Словарь вакансии (заполняемый), dict.
-        :param key_0: Ключ создаваемого словаря, str.
-        :param key_1: Ключ 1-го уровня вложенности анализируемого словаря, str.
-        :return: Добавляет в словарь пару ключ: значение.
-        """
-        try:
-            if all(dict_vak.get(key_1)):
-                vacancy[key_0] = dict_vak[key_1]
-        except (TypeError, AttributeError):
-            vacancy[key_0] = 'нет данных.'
-
-    @staticmethod
-    def two_levels(dict_vak: dict, vacancy: dict, key_0: str, key_1: str, key_2: str) -> None:
-        """
-        Проверка и обработка данных из исходного словаря.
-        Два уровня вложенности ключей в словаре.
-        :param dict_vak: Словарь вакансии (анализируемый), dict.
-        :param vacancy: Словарь вакансии (заполняемый), dict.
-        :param key_0: Ключ создаваемого словаря, str.
-        :param key_1: Ключ 1-го уровня вложенности анализируемого словаря, str.
-        :param key_2: Ключ 2-го уровня вложенности анализируемого словаря, str.
-        :return: Добавляет в словарь пару ключ: значение.
-        """
-        try:
-            if all(dict_vak.get(key_1).get(key_2)):
-                vacancy[key_0] = dict_vak[key_1][key_2]
-        except (TypeError, AttributeError):
-            vacancy[key_0] = 'нет данных.'
-
-    @staticmethod
-    def three_levels(dict_vak: dict, vacancy: dict, key_0: str, key_1: str, key_2: str, key_3: str) -> None:
-        """
-        Проверка и обработка данных из исходного словаря.
-        Три уровня вложенности ключей в словаре.
-        :param dict_vak: Словарь вакансии (анализируемый), dict.
-        :param vacancy: Словарь вакансии (заполняемый), dict.
-        :param key_0: Ключ создаваемого словаря, str.
-        :param key_1: Ключ 1-го уровня вложенности анализируемого словаря, str.
-        :param key_2: Ключ 2-го уровня вложенности анализируемого словаря, str.
-        :param key_3: Ключ 3-го уровня вложенности анализируемого словаря, str.
-        :return: Добавляет в словарь пару ключ: значение.
-        """
-        try:
-            if all(dict_vak.get(key_1).get(key_2).get(key_3)):
-                vacancy[key_0] = dict_vak[key_1][key_2][key_3]
-        except (TypeError, AttributeError):
-            vacancy[key_0] = 'нет данных.'
-
-    @staticmethod
-    def one_level_salary(dict_vak: dict, key_1: str) -> int:
-        """
-        Проверка и обработка данных по зарплате из исходного словаря.
-        Один уровень вложенности ключей в словаре.
-        :param dict_vak: Словарь вакансии (анализируемый), dict.
-        :param key_1: Ключ 1-го уровня вложенности анализируемого словаря, str.
-        :return: Выводит данные о зарплате, int.
-        """
-        salary = 0
-        try:
-            if dict_vak.get(key_1) != 0:
-                salary = dict_vak[key_1]
-        except (TypeError, AttributeError):
-            pass
-        return salary
-
-    @staticmethod
-    def two_levels_salary(dict_vak: dict, key_1: str, key_2: str) -> int:
-        """
-        Проверка и обработка данных по зарплате из исходного словаря.
-        Два уровня вложенности ключей в словаре.
-        :param dict_vak: Словарь вакансии (анализируемый), dict.
-        :param key_1: Ключ 1-го уровня вложенности анализируемого словаря, str.
-        :param key_2: Ключ 2-го уровня вложенности анализируемого словаря, str.
-        :return: Выводит данные о зарплате, 0.
-        """
-        salary = 0
-        try:
-            if all(str(dict_vak.get(key_1).get(key_2))):
-                if str(dict_vak.get(key_1).get(key_2)) != 'None':
-                    salary = dict_vak[key_1][key_2]
-        except (TypeError, AttributeError):
-            pass
-        return salary
-
     @staticmethod
     def del_space(txt: str) -> str:
         """
@@ -158,59 +279,41 @@ class Mixin:
         return txt
 
     @staticmethod
-    def list_sort_date(list_operations: list, key: str) -> list:
-        """
-        Возвращает список словарей, сортированный по дате и времени
-        в обратном порядке.
-        :param list_operations: Несортированный список словарей, list.
-        :param key: Ключ для сортировки даты, str.
-        :return: Сортированный список словарей, list.
-        """
-        # Сортируем словари в списке по дате в обратном порядке.
-        list_operations = sorted(list_operations,
-                                 key=lambda x: datetime.strptime(x[key], '%Y-%m-%d'),
-                                 reverse=True)
-        return list_operations
-
-    @staticmethod
-    def list_sort_salary(list_operations: list, key_1: str, key_2: str) -> list:
-        """
-        Возвращает список словарей, сортированный по заработной плате
-        от большей к меньшей.
-        :param list_operations: Несортированный список словарей, list.
-        :param key_1: Ключ словаря "зарплата от", str.
-        :param key_2: Ключ словаря "зарплата до", str.
-        :return: Сортированный список словарей, list.
-        """
-        # Сортируем словари в списке по зарплате в обратном порядке.
-        # list_operations = sorted(list_operations, key=lambda x: x[key_1] if x[key_1] != 0 else x[key_2], reverse=True)
-        # Сортировка по усреднённой заработной плате в пределах "вилки" "от и до".
-        list_operations = sorted(list_operations, key=lambda x: (x[key_1] + x[key_2]) // 2, reverse=True)
-        return list_operations
-
-    @staticmethod
-    def save_to_json(data: list, path: str) -> None:
+    def fetch_shards(request_page, save_page, shards: list, counts: list, max_workers: int) -> dict:
         """
-        Сохраняет данные в json-файл.
-        :param path: Полное имя файла, str.
-        :param data: Словарь с данными, dict.
-        :return: Ничего не возвращает.
-        """
-        with open(path, "w", encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-
-    @staticmethod
-    def load_json(path_json: str) -> list:
-        """
-        Чтение данных из файла json и возвращение структуры.
-        :param path_json: Путь к файлу, str.
-        :return: Структура файла (список словарей).
+        Загружает страницы частей запроса параллельно (не более max_workers одновременно)
+        и сохраняет их в порядке частей и страниц. Первые страницы частей уже получены при планировании.
+        :param request_page: Функция запроса страницы: request_page(индекс страницы, часть), callable.
+        :param save_page: Функция сохранения страницы: save_page(страница ответа API), callable.
+        :param shards: Части запроса с первыми страницами, list[tuple[dict, dict]].
+        :param counts: Количество страниц каждой части, list[int].
+        :param max_workers: Количество одновременно загружаемых страниц, int.
+        :return: Незагруженные страницы: {(номер части, индекс страницы): ошибка}, dict.
         """
-        # открываем файл на чтение
-        with open(path_json, 'r', encoding='utf-8') as file:
-            # считываем список словарей из файла
-            content = json.load(file)
-        return content
+        todo = [(num, page) for num, count in enumerate(counts) for page in range(1, count)]
+        # Страницы, полученные раньше предыдущих, ждут своей очереди,
+        # чтобы вакансии в хранилище шли в порядке частей и страниц.
+        order = sorted(todo + [(num, 0) for num in range(len(shards))])
+        received, failed, position = {(num, 0): first for num, (shard, first) in enumerate(shards)}, {}, 0
+
+        def flush() -> None:
+            nonlocal position
+            while position < len(order) and order[position] in received:
+                save_page(received.pop(order[position]))
+                position += 1
+
+        flush()
+        with tqdm(total=len(order), desc='Подождите, пожалуйста. Анализируем страницы', initial=len(shards)) as bar:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(request_page, page, shards[num][0]): (num, page) for num, page in todo}
+                for future in as_completed(futures):
+                    try:
+                        received[futures[future]] = future.result()
+                    except Exception as e:
+                        failed[futures[future]] = e
+                    flush()
+                    bar.update()
+        return failed
 
     @staticmethod
     def delete_files_in_folder(folder_path) -> None:
@@ -273,141 +376,295 @@ class Mixin:
             result_string = value
         return result_string
 
-    @staticmethod
-    def coord_words_num(digit) -> str:
-        """
-        Согласование слова "вакансии" с числительными.
-        :param digit: Числительное для согласования, int.
-        :return: Слово "вакансии", согласованное с числительным, str.
-        """
-        if digit % 10 == 1 and digit != 11:
-            return f'{digit} вакансия'
-        elif digit % 10 in [2, 3, 4] and digit not in [12, 13, 14]:
-            return f'{digit} вакансии'
-        else:
-            return f'{digit} вакансий'
-
 
 class VacHH(Vacancies, Mixin):
     """
     Получение данных по API с hh.ru, их обработка и сохранение.
     """
 
+    service = 'hh'
+    file_pages = FILE_PAGES_HH
+
+    # Извлечение полей вакансии из ответа API.
+    __fields = FieldExtractor(FIELDS_HH)
+
     def __init__(self, position: str, area: int = ID_RUSSIA_HH, only_with_salary: bool = False, salary: int = 0,
-                 per_page: int = 100) -> None:
-        self.__url = 'https://api.hh.ru/vacancies'
+                 per_page: int = 100, max_workers: int = MAX_WORKERS_HH, rate_limiter: RateLimiter = None,
+                 url: str = URL_VAC_HH, path_vak: str = PATH_VAK_HH, session: HttpSession = None,
+                 store=None, incremental: bool = VAK_INCREMENTAL, state: RefreshState = None,
+                 cache: QueryCache = None, retries: int = PAGE_RETRIES, backoff: float = RETRY_BACKOFF,
+                 resume: bool = PAGES_RESUME, shard: bool = VAK_SHARDING, planner: ShardPlannerHH = None,
+                 dedup: DedupIndex = None) -> None:
+        # Планировщик создаётся, только если включено разбиение запроса.
+        planner = (planner or ShardPlannerHH(max_workers=max(1, max_workers))) if shard else None
+        super().__init__(url, path_vak, store, incremental, state, dedup, cache, planner, resume)
         self.__position = str(position)  # Текст фильтра
         self.__area = area  # Поиск по-умолчанию осуществляется по вакансиям России (id=113)
         self.__only_with_salary = only_with_salary  # Показывать вакансии только с указанием зарплаты или все
         self.__salary = salary  # Ожидаемый размер заработной платы
         self.__per_page = per_page  # Кол-во вакансий на 1 странице
-        self.size_dict = 0  # Счётчик количества словарей с вакансиями
-
-    def request_to_api(self, page: int = 0) -> str:
+        self.__max_workers = max(1, max_workers)  # Кол-во одновременно загружаемых страниц
+        # Ограничитель частоты запросов (по умолчанию - общий для всех запросов к сервису).
+        self.__rate_limiter = rate_limiter or get_rate_limiter(url)
+        self.__session = session or get_session()  # Пул HTTP-соединений
+        self.__retries = retries  # Количество повторных попыток загрузки страницы
+        self.__backoff = backoff  # Пауза перед первой повторной попыткой, сек.
+
+    def request_params(self, page: int = 0, shard: dict = None) -> dict:
+        """
+        Формирование параметров запроса по api.
+        :param page: Индекс страницы поиска HH, int.
+        :param shard: Параметры части запроса (регион, окно дат публикации), заменяющие параметры запроса, dict.
+        :return: Параметры запроса, dict.
+        """
+        # Без фильтрации по размеру заработной платы
+        params = {
+            'text': self.__position,
+            'area': self.__area,
+            'page': page,
+            'per_page': self.__per_page
+        }
+        if self.__salary != 0:
+            # С фильтрацией по размеру заработной платы
+            params['salary'] = self.__salary
+            params['only_with_salary'] = self.__only_with_salary
+        # Только вакансии, опубликованные начиная с даты самой свежей из загруженных ранее
+        if self._date_from is not None:
+            params['date_from'] = self._date_from
+        if shard:
+            params.update(shard)
+        return params
+
+    def request_to_api(self, page: int = 0, shard: dict = None) -> str:
         """
         Получение запроса по api
         :page: Индекс страницы поиска HH.
+        :shard: Параметры части запроса, dict.
         :return: ответ запроса, <class 'requests.models.Response'>.
         """
         try:
-            # Без фильтрации по размеру заработной платы
-            params = {
-                'text': self.__position,
-                'area': self.__area,
-                'page': page,
-                'per_page': self.__per_page
-            }
-            if self.__salary != 0:
-                # С фильтрацией по размеру заработной платы
-                params['salary'] = self.__salary
-                params['only_with_salary'] = self.__only_with_salary
-
             # Отправляем запрос к API
-            data_prof = requests.get(url=self.__url, params=params).text
-            return data_prof
+            response = self.__session.get(url=self._url, params=self.request_params(page, shard))
+            # Проверяем код ответа и подстраиваем частоту запросов
+            return check_response(response, self.__rate_limiter).text
+        except ApiError:
+            raise
         except Exception as e:
-            raise Exception(f'Ошибка при получении данных с {self.__url}. {e}')
+            raise Exception(f'Ошибка при получении данных с {self._url}. {e}')
+
+    async def request_to_api_async(self, fetcher: AsyncFetcher, page: int = 0) -> str:
+        """
+        Асинхронное получение запроса по api.
+        :param fetcher: Асинхронный движок запросов, AsyncFetcher.
+        :param page: Индекс страницы поиска HH, int.
+        :return: Текст ответа запроса, str.
+        """
+        try:
+            return await fetcher.get(self._url, params=self.request_params(page))
+        except ApiError:
+            raise
+        except Exception as e:
+            raise Exception(f'Ошибка при получении данных с {self._url}. {e}')
+
+    def request_page(self, page: int, shard: dict = None) -> dict:
+        """
+        Получение одной страницы с учётом ограничения частоты запросов.
+        При ошибке (в т.ч. при ответе, не являющемся JSON) запрос повторяется до retries раз
+        с экспоненциально растущими паузами; ошибки, повтор которых не поможет (например, капча), не повторяются.
+        :param page: Индекс страницы поиска HH, int.
+        :param shard: Параметры части запроса, dict.
+        :return: Ответ запроса, преобразованный в словарь Python, dict.
+        """
+        def attempt() -> dict:
+            self.__rate_limiter.wait()
+            return json.loads(self.request_to_api(page, shard))
+        return call_with_retries(attempt, self.__retries, self.__backoff)
+
+    def parse_page(self, js_obj: dict) -> list:
+        """
+        Формирует собственный список вакансий для сохранения в хранилище,
+        отбирая только нужные данные.
+        :param js_obj: Страница ответа API, dict.
+        :return: Список вакансий, list[Vacancy].
+        """
+        # Заполняем словари вакансий по таблице полей и преобразуем их в записи.
+        return [Vacancy.from_dict(self.__fields.extract(value)) for value in js_obj['items']]
+
+    @staticmethod
+    def published_at(published: str) -> datetime:
+        """
+        Дата и время публикации вакансии hh.ru.
+        :param published: Дата и время в формате API hh.ru (ГГГГ-ММ-ДДTЧЧ:ММ:СС+ЧЧММ), str.
+        :return: Дата и время с часовым поясом, datetime.
+        """
+        return datetime.strptime(published, '%Y-%m-%dT%H:%M:%S%z')
+
+    def query_params(self) -> dict:
+        """
+        Параметры запроса, от которых зависит его результат.
+        :return: {название: значение}, dict.
+        """
+        return {'text': self.__position, 'area': self.__area, 'salary': self.__salary,
+                'only_with_salary': self.__only_with_salary}
+
+    def save_page(self, js_obj: dict) -> None:
+        """
+        Обрабатывает страницу ответа API и дописывает её вакансии в хранилище.
+        :param js_obj: Страница ответа API, dict.
+        :return: Ничего не возвращает.
+        """
+        if js_obj['items']:
+            # Даты публикации hh.ru сравниваются с учётом часового пояса.
+            published = max((value['published_at'] for value in js_obj['items']), key=self.published_at)
+            if self._newest is None or self.published_at(published) > self.published_at(self._newest):
+                self._newest = published
+        # Вакансии, уже находящиеся в хранилище, повторно не сохраняются.
+        vacancies = self._dedup.add('hh', self.parse_page(js_obj))
+        # Получем количество записей
+        self.size_dict += len(vacancies)
+        self.size_new += len(vacancies)
+        self._store.append([vacancy.to_dict() for vacancy in vacancies])
+
+    def load_pages(self, saved: set, pages: int) -> None:
+        """
+        Загружает недостающие страницы запроса параллельно (не более max_workers одновременно)
+        и дописывает их в хранилище в порядке выдачи сервиса, отмечая в контрольной точке.
+        :param saved: Номера уже сохранённых страниц (дополняется), set.
+        :param pages: Количество страниц, int.
+        :return: Ничего не возвращает.
+        """
+        todo = [page for page in range(1, pages) if page not in saved]
+        with tqdm(total=max(pages, 1), desc='Подождите, пожалуйста. Анализируем страницы',
+                  initial=max(pages, 1) - len(todo)) as bar:
+            with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+                futures = {executor.submit(self.request_page, page): page for page in todo}
+                # Страницы, полученные раньше предыдущих, ждут своей очереди,
+                # чтобы вакансии в хранилище шли в порядке выдачи сервиса.
+                received, failed, position = {}, {}, 0
+                for future in as_completed(futures):
+                    try:
+                        received[futures[future]] = future.result()
+                    except Exception as e:
+                        failed[futures[future]] = e
+                    while position < len(todo) and todo[position] in received:
+                        self.save_checkpoint(todo[position], received.pop(todo[position]), saved, pages)
+                        position += 1
+                    bar.update()
+        if failed:
+            # Страницы, следующие за незагруженной, тоже сохраняются,
+            # чтобы при повторном запуске загрузить только недостающие.
+            for page in sorted(received):
+                self.save_checkpoint(page, received[page], saved, pages)
+            page = min(failed)
+            raise Exception(f'Не удалось загрузить страницы {", ".join(map(str, sorted(failed)))} с {self._url}.'
+                            f' При повторном запуске будут загружены только они. {failed[page]}')
+
+    def load_shards(self, js_obj: dict) -> None:
+        """
+        Загружает запрос, по которому найдено больше вакансий, чем сервис отдаёт (MAX_VAK_HH), по частям:
+        по дочерним регионам и/или окнам дат публикации (см. ShardPlannerHH). Страницы всех частей загружаются
+        параллельно, вакансии, попавшие в несколько частей, сохраняются один раз.
+        Прерванная загрузка по частям не продолжается, а начинается заново.
+        :param js_obj: Первая страница ответа API на исходный запрос, dict.
+        :return: Ничего не возвращает.
+        """
+        print(f"По запросу найдено {coord_words_num(js_obj['found'])}, сервис отдаёт не более {MAX_VAK_HH}:"
+              f" разбиваем запрос на части...")
+        shards = self._planner.plan(lambda shard: self.request_page(0, shard), {'area': self.__area}, js_obj,
+                                     self._date_from)
+        # Первые страницы частей получены при планировании, остальные загружаем.
+        counts = [min(first['pages'], MAX_VAK_HH // self.__per_page) for shard, first in shards]
+        failed = self.fetch_shards(self.request_page, self.save_page, shards, counts, self.__max_workers)
+        if failed:
+            raise Exception(f'Не удалось загрузить {len(failed)} страниц(ы) с {self._url}.'
+                            f' {next(iter(failed.values()))}')
+        if self._planner.truncated:
+            print(f'Часть вакансий ({self._planner.truncated}) не удалось получить даже по частям.')
 
     def vacancies_all(self) -> None:
         """
-        Считывает первые 2000 вакансий и постранично (по 100 шт.) сохраняет их в json-файлы.
+        Считывает первые 2000 вакансий и постранично (по 100 шт.) дописывает их в хранилище.
+        Первая страница запрашивается сразу, чтобы узнать общее количество страниц,
+        остальные загружаются параллельно (не более max_workers одновременно).
+        Если включено разбиение запроса (shard), запрос, по которому найдено больше 2000 вакансий,
+        загружается по частям.
         """
         print('Мы собираем для Вас информацию'
               ' о вакансиях в указанном регионе/населённом пункте...')
-        # Очищаем папку с файлами, хранящими устаревшие данные
-        self.delete_files_in_folder(PATH_VAK_HH)
+        # Результат того же запроса, выполненного недавно, берём из кэша.
+        if self.load_cached():
+            print(f'\nРезультат запроса на hh.ru взят из кэша: {coord_words_num(self.size_dict)}.\n')
+            return
         try:
-            for page in trange(20, desc='Подождите, пожалуйста. Анализируем страницы', initial=1):
-                # Преобразуем текст ответа запроса в словарь Python.
-                js_obj = json.loads(self.request_to_api(page))
-
-                # Получем количество записей
-                self.size_dict += len(js_obj['items'])
-
-                # Формируем собственный список словарей для сохранения в json-файл,
-                # отбирая только нужные данные.
-                vak_js = []  # список словарей для записи в файл
-
-                # Ключи с однотипным ('двойным') уровнем вложенности.
-                keys = {
-                    '03 Работодатель': ["employer", "name"],
-                    '04 Населённый пункт': ["area", "name"],
-                    '05 Адрес': ["address", "raw"],
-                    '08 Валюта': ["salary", "currency"],
-                    '09 График работы': ["schedule", "name"],
-                    '10 Занятость': ["employment", "name"],
-                    '11 Опыт работы': ["experience", "name"],
-                    '12 Требования к соискателю': ["snippet", "requirement"],
-                    '13 Обязанности': ["snippet", "responsibility"],
-                }
-                # Обработка данных полученного словаря
-                for value in js_obj['items']:
-                    # словарь вакансии
-                    vacancy = {
-                        '01 Дата публикации': value["published_at"].split('T')[0],
-                        '02 Должность': value["name"] + '.',
-                        '06 Зарплата от': self.two_levels_salary(value, "salary", "from"),
-                        '07 Зарплата до': self.two_levels_salary(value, "salary", "to"),
-                    }
-                    # Заполняем словарь vacancy по ключам 03-05, 08-13
-                    # имеющим "двойной" уровень вложенности.
-                    for key_0, key in keys.items():
-                        self.two_levels(value, vacancy, key_0, key[0], key[1])
-                    # Ссылка на страницу вакансии
-                    self.one_level(value, vacancy, '14 Подробнее здесь (URL)', "alternate_url")
-                    # Добавляем словарь с вакансией в список
-                    vak_js.append(dict(sorted(vacancy.items())))
-
-                # Создаём номер файла для адекватной последовательной сортировки в дальнейшем
-                if page < 10:
-                    page_num = '0' + str(page)
+            # Продолжаем прерванную загрузку того же запроса или начинаем новую.
+            resumed = self.resume_pages()
+            if resumed is not None:
+                saved, pages = resumed
+                print(f'Продолжаем прерванную загрузку: осталось страниц - {pages - len(saved)}.')
+                self.load_pages(saved, pages)
+            else:
+                # Очищаем папку с файлами и хранилище от устаревших данных или готовимся к дозагрузке.
+                self.start_refresh()
+                # Первая страница содержит общее количество страниц по запросу.
+                js_obj = self.request_page(0)
+                if self._planner is not None and js_obj['found'] > MAX_VAK_HH:
+                    self.load_shards(js_obj)
                 else:
-                    page_num = str(page)
-                # Создаём новый документ, записываем в него ответ запроса
-                self.save_to_json(vak_js, os.path.join(PATH_VAK_HH, f'vakhh_{page_num}.json'))
+                    # hh.ru отдаёт не более 2000 вакансий по одному запросу.
+                    pages = min(js_obj['pages'], MAX_VAK_HH // self.__per_page)
+                    saved = set()
+                    self.save_checkpoint(0, js_obj, saved, pages)
+                    self.load_pages(saved, pages)
 
-                # Проверка на последнюю страницу, если вакансий меньше 2000
-                if (js_obj['pages'] - page) <= 1:
-                    break
-
-                # Задержка, чтобы не нагружать сервисы hh.
-                time.sleep(0.03)
+            # Загрузка завершена, продолжать нечего.
+            self._checkpoint.clear()
+            self.finish_refresh()
+            self.save_cached()
 
             # Вывод данных о количестве вакансий
-            if self.size_dict != 0:
-                print(f'\nПо вашему запросу на hh.ru найдено {self.coord_words_num(self.size_dict)} вакансий.\n')
+            if self._date_from is not None:
+                print(f'\nС момента предыдущего запроса на hh.ru опубликовано новых вакансий: {self.size_new}.'
+                      f' Всего {coord_words_num(self.size_dict)}.\n')
+            elif self.size_dict != 0:
+                print(f'\nПо вашему запросу на hh.ru найдено {coord_words_num(self.size_dict)} вакансий.\n')
             else:
                 print('\nИзвините. Мы ничего не нашли по Вашему запросу. Попробуйте его сформулировать по-другому.\n')
                 # Удаляем пустой файл из папки data\hh
-                self.delete_files_in_folder(PATH_VAK_HH)
+                self.delete_files_in_folder(self._path_vak)
+        except KeyError as e:
+            raise KeyError(f'Ошибка обращения к полученным данным. {e}')
+
+    async def vacancies_all_async(self, fetcher: AsyncFetcher) -> None:
+        """
+        Асинхронный вариант vacancies_all: считывает первые 2000 вакансий
+        и постранично (по 100 шт.) дописывает их в хранилище.
+        :param fetcher: Асинхронный движок запросов, AsyncFetcher.
+        """
+        if self.load_cached():
+            return
+        self.start_refresh()
+        try:
+            js_obj = json.loads(await self.request_to_api_async(fetcher, 0))
+            pages = min(js_obj['pages'], MAX_VAK_HH // self.__per_page)
+            self.save_page(js_obj)
+
+            # Остальные страницы запрашиваем одновременно.
+            responses = await asyncio.gather(*(self.request_to_api_async(fetcher, page) for page in range(1, pages)))
+            for response in responses:
+                self.save_page(json.loads(response))
+            self.finish_refresh()
+            self.save_cached()
+
+            if self.size_dict == 0:
+                self.delete_files_in_folder(self._path_vak)
         except KeyError as e:
             raise KeyError(f'Ошибка обращения к полученным данным. {e}')
 
     def __str__(self) -> str:
-        return f'Получение, обработка (включая сортировку) и вывод данных с сервиса hh.ru по API {self.__url}'
+        return f'Получение, обработка (включая сортировку) и вывод данных с сервиса hh.ru по API {self._url}'
 
     def __repr__(self) -> str:
-        return (f"{self.__class__.__name__}({self.__url}, {self.__position},"
+        return (f"{self.__class__.__name__}({self._url}, {self.__position},"
                 f" {self.__area}, {self.__only_with_salary}, {self.__salary},"
                 f" {self.__per_page}, {self.size_dict})")
 
@@ -417,136 +674,297 @@ class VacSJ(Vacancies, Mixin):
     Получение данных по API с superjob.ru, их обработка и сохранение.
     """
 
+    service = 'sj'
+    file_pages = FILE_PAGES_SJ
+
+    # Извлечение полей вакансии из ответа API.
+    __fields = FieldExtractor(FIELDS_SJ)
+
     def __init__(self, position: str, area: int = ID_RUSSIA_SJ, only_with_salary: bool = False, salary: int = 0,
-                 per_page: int = 100) -> None:
-        self.__url = 'https://api.superjob.ru/2.0/vacancies/'
+                 per_page: int = 100, rate_limiter: RateLimiter = None, url: str = URL_VAC_SJ,
+                 path_vak: str = PATH_VAK_SJ, session: HttpSession = None, store=None,
+                 incremental: bool = VAK_INCREMENTAL, state: RefreshState = None,
+                 cache: QueryCache = None, retries: int = PAGE_RETRIES, backoff: float = RETRY_BACKOFF,
+                 resume: bool = PAGES_RESUME, max_workers: int = MAX_WORKERS_SJ, shard: bool = VAK_SHARDING,
+                 planner: ShardPlannerSJ = None, dedup: DedupIndex = None, region: bool = False) -> None:
+        # Планировщик создаётся, только если включено разбиение запроса.
+        planner = (planner or ShardPlannerSJ(max_workers=max(1, max_workers))) if shard else None
+        super().__init__(url, path_vak, store, incremental, state, dedup, cache, planner, resume)
         self.__keyword = str(position)  # Текст фильтра
         self.__area = area  # Поиск по-умолчанию осуществляется по вакансиям России (id=1)
+        # area - id региона (True) или населённого пункта (False): у superjob.ru они могут совпадать.
+        self.__region = region and area != ID_RUSSIA_SJ
         self.__only_with_salary = only_with_salary  # Показывать вакансии только с указанием зарплаты или все
         self.__salary = salary  # Ожидаемый размер заработной платы
         self.__per_page = per_page  # Кол-во вакансий на 1 странице
-        self.size_dict = 0  # Счётчик количества словарей с вакансиями
+        # Ограничитель частоты запросов (по умолчанию - общий для всех запросов к сервису).
+        self.__rate_limiter = rate_limiter or get_rate_limiter(url)
+        self.__session = session or get_session()  # Пул HTTP-соединений
+        self.__retries = retries  # Количество повторных попыток загрузки страницы
+        self.__backoff = backoff  # Пауза перед первой повторной попыткой, сек.
+        self.__max_workers = max(1, max_workers)  # Кол-во одновременно загружаемых страниц (при загрузке по частям)
+
+    def request_params(self, page: int = 0, shard: dict = None) -> dict:
+        """
+        Формирование параметров запроса по api.
+        :param page: Индекс страницы поиска SJ, int.
+        :param shard: Параметры части запроса (регион, город, диапазон зарплат, окно дат публикации),
+                      заменяющие параметры запроса, dict.
+        :return: Параметры запроса, dict.
+        """
+        # Без фильтрации по зарплате, поиск по конкретному городу/региону России.
+        params = {
+            'keyword': self.__keyword,
+            'page': page,
+            'count': self.__per_page,
+        }
+        params.update(self.area_params())
+        # С фильтрацией по размеру заработной платы
+        if self.__salary != 0:
+            params['payment_from'] = self.__salary
+            params['payment_to'] = self.__salary * 5
+            params['no_agreement'] = self.__only_with_salary
+        # Только вакансии, опубликованные начиная с даты самой свежей из загруженных ранее
+        if self._date_from is not None:
+            params['date_published_from'] = self._date_from
+        if shard:
+            params.update(shard)
+        return params
+
+    def area_params(self) -> dict:
+        """
+        Параметр запроса, задающий место поиска: страна (c), регион (o) или населённый пункт (town).
+        :return: Параметр запроса, dict.
+        """
+        # Поиск по России
+        if self.__area == ID_RUSSIA_SJ:
+            return {'c': self.__area}
+        return {'o' if self.__region else 'town': self.__area}
 
-    def request_to_api(self, page: int = 0) -> str:
+    def request_to_api(self, page: int = 0, shard: dict = None) -> str:
         """
         Получение запроса по api
         :page: Индекс страницы поиска HH.
+        :shard: Параметры части запроса, dict.
         :return: ответ запроса, <class 'requests.models.Response'>.
         """
         try:
-            # Без фильтрации по зарплате, поиск по конкретному городу/региону России.
-            params = {
-                'keyword': self.__keyword,
-                'town': self.__area,
-                'page': page,
-                'count': self.__per_page,
-            }
-            # Поиск по России
-            if self.__area == 1:
-                params['c'] = params.pop('town')
-            # С фильтрацией по размеру заработной платы
-            if self.__salary != 0:
-                params['payment_from'] = self.__salary
-                params['payment_to'] = self.__salary * 5
-                params['no_agreement'] = self.__only_with_salary
-
             # Посылаем запрос к API
             headers = {'X-Api-App-Id': SUPERJOB_API_KEY}
-            data_prof = requests.get(url=self.__url, headers=headers, params=params).text
-            return data_prof
+            response = self.__session.get(url=self._url, headers=headers, params=self.request_params(page, shard))
+            # Проверяем код ответа и подстраиваем частоту запросов
+            return check_response(response, self.__rate_limiter).text
+        except ApiError:
+            raise
+        except Exception as e:
+            raise Exception(f'Ошибка при получении данных с {self._url}. {e}')
+
+    async def request_to_api_async(self, fetcher: AsyncFetcher, page: int = 0) -> str:
+        """
+        Асинхронное получение запроса по api.
+        :param fetcher: Асинхронный движок запросов, AsyncFetcher.
+        :param page: Индекс страницы поиска SJ, int.
+        :return: Текст ответа запроса, str.
+        """
+        try:
+            headers = {'X-Api-App-Id': SUPERJOB_API_KEY}
+            return await fetcher.get(self._url, params=self.request_params(page), headers=headers)
+        except ApiError:
+            raise
         except Exception as e:
-            raise Exception(f'Ошибка при получении данных с {self.__url}. {e}')
+            raise Exception(f'Ошибка при получении данных с {self._url}. {e}')
+
+    def request_page(self, page: int, shard: dict = None) -> dict:
+        """
+        Получение одной страницы с учётом ограничения частоты запросов.
+        При ошибке (в т.ч. при ответе, не являющемся JSON) запрос повторяется до retries раз
+        с экспоненциально растущими паузами; ошибки, повтор которых не поможет (например, капча), не повторяются.
+        :param page: Индекс страницы поиска SJ, int.
+        :param shard: Параметры части запроса, dict.
+        :return: Ответ запроса, преобразованный в словарь Python, dict.
+        """
+        def attempt() -> dict:
+            self.__rate_limiter.wait()
+            return json.loads(self.request_to_api(page, shard))
+        return call_with_retries(attempt, self.__retries, self.__backoff)
+
+    def parse_page(self, js_obj: dict) -> list:
+        """
+        Формирует собственный список вакансий для сохранения в хранилище,
+        отбирая только нужные данные.
+        :param js_obj: Страница ответа API, dict.
+        :return: Список вакансий, list[Vacancy].
+        """
+        # Заполняем словари вакансий по таблице полей и преобразуем их в записи.
+        return [Vacancy.from_dict(self.__fields.extract(value)) for value in js_obj['objects']]
+
+    def query_params(self) -> dict:
+        """
+        Параметры запроса, от которых зависит его результат.
+        :return: {название: значение}, dict.
+        """
+        return {'keyword': self.__keyword, 'area': self.__area, 'region': self.__region, 'salary': self.__salary,
+                'only_with_salary': self.__only_with_salary}
+
+    def save_page(self, js_obj: dict) -> None:
+        """
+        Обрабатывает страницу ответа API и дописывает её вакансии в хранилище.
+        :param js_obj: Страница ответа API, dict.
+        :return: Ничего не возвращает.
+        """
+        if js_obj['objects']:
+            # Даты публикации superjob.ru - метки времени Unix.
+            published = max(int(value['date_published']) for value in js_obj['objects'])
+            self._newest = published if self._newest is None else max(self._newest, published)
+        # Вакансии, уже находящиеся в хранилище, повторно не сохраняются.
+        vacancies = self._dedup.add('sj', self.parse_page(js_obj))
+        # Получем количество записей
+        self.size_dict += len(vacancies)
+        self.size_new += len(vacancies)
+        self._store.append([vacancy.to_dict() for vacancy in vacancies])
+
+    def request_page_or_fail(self, page: int) -> dict:
+        """
+        Получение одной страницы с сообщением о том, с какой страницы продолжится загрузка.
+        :param page: Индекс страницы поиска SJ, int.
+        :return: Ответ запроса, преобразованный в словарь Python, dict.
+        """
+        try:
+            return self.request_page(page)
+        except Exception as e:
+            raise Exception(f'Не удалось загрузить страницу {page} с {self._url}.'
+                            f' При повторном запуске загрузка продолжится с неё. {e}')
+
+    def load_pages(self, saved: set, pages: int) -> None:
+        """
+        Загружает недостающие страницы запроса по очереди, пока сервис сообщает, что вакансии ещё есть,
+        и дописывает их в хранилище, отмечая в контрольной точке.
+        :param saved: Номера уже сохранённых страниц (дополняется), set.
+        :param pages: Наибольшее количество страниц, int.
+        :return: Ничего не возвращает.
+        """
+        for page in trange(pages, desc='Подождите, пожалуйста. Анализируем страницы', initial=1):
+            if page in saved:
+                continue
+            # Преобразуем текст ответа запроса в словарь Python.
+            js_obj = self.request_page_or_fail(page)
+            # Обрабатываем и сохраняем страницу.
+            self.save_checkpoint(page, js_obj, saved, pages)
+
+            # Проверка на последнюю страницу, если вакансий меньше 500
+            if not js_obj['more']:
+                break
+
+    def load_shards(self, js_obj: dict) -> None:
+        """
+        Загружает запрос, по которому найдено больше вакансий, чем сервис отдаёт (MAX_VAK_SJ), по частям:
+        по регионам и городам, диапазонам зарплат и/или окнам дат публикации (см. ShardPlannerSJ).
+        Страницы всех частей загружаются параллельно, вакансии, попавшие в несколько частей, сохраняются один раз.
+        Прерванная загрузка по частям не продолжается, а начинается заново.
+        :param js_obj: Первая страница ответа API на исходный запрос, dict.
+        :return: Ничего не возвращает.
+        """
+        print(f"По запросу найдено {coord_words_num(js_obj['total'])}, сервис отдаёт не более {MAX_VAK_SJ}:"
+              f" разбиваем запрос на части...")
+        # Делятся только параметры запроса, которые есть в нём самом.
+        # Регион делится по его городам, поэтому место поиска передаётся так же, как в запросе (o или town).
+        shard = {} if self.__area == ID_RUSSIA_SJ else self.area_params()
+        if self.__salary != 0:
+            shard.update(payment_from=self.__salary, payment_to=self.__salary * 5)
+        shards = self._planner.plan(lambda part: self.request_page(0, part), shard, js_obj, self._date_from)
+        # Первые страницы частей получены при планировании, остальные загружаем.
+        counts = [min(-(-first['total'] // self.__per_page), MAX_VAK_SJ // self.__per_page) if first['more'] else 1
+                  for part, first in shards]
+        failed = self.fetch_shards(self.request_page, self.save_page, shards, counts, self.__max_workers)
+        if failed:
+            raise Exception(f'Не удалось загрузить {len(failed)} страниц(ы) с {self._url}.'
+                            f' {next(iter(failed.values()))}')
+        if self._planner.truncated:
+            print(f'Часть вакансий ({self._planner.truncated}) не удалось получить даже по частям.')
 
     def vacancies_all(self, page: int = 0) -> None:
         """
-        Считывает первые 500 вакансий и постранично (по 100 шт.) сохраняет их в json-файлы.
+        Считывает первые 500 вакансий и постранично (по 100 шт.) дописывает их в хранилище.
+        Если включено разбиение запроса (shard), запрос, по которому найдено больше 500 вакансий,
+        загружается по частям.
         """
         print('Мы собираем для Вас информацию'
               ' о вакансиях в указанном регионе/населённом пункте...')
+        # Результат того же запроса, выполненного недавно, берём из кэша.
+        if self.load_cached():
+            print(f'\nРезультат запроса на superjob.ru взят из кэша: {coord_words_num(self.size_dict)}.\n')
+            return
         try:
-            # Очищаем папку с файлами, хранящими устаревшие данные
-            self.delete_files_in_folder(PATH_VAK_SJ)
-            for page in trange(5, desc='Подождите, пожалуйста. Анализируем страницы', initial=1):
-                # Преобразуем текст ответа запроса в словарь Python.
-                js_obj = json.loads(self.request_to_api(page))
-
-                # Получем количество записей
-                self.size_dict += len(js_obj['objects'])
-
-                # Формируем собственный список словарей для сохранения в json-файл,
-                # отбирая только нужные данные.
-                vak_js = []  # список словарей для записи в файл
-
-                # Ключи с однотипным ('одинарным') уровнем вложенности.
-                keys_1 = {
-                    '05 Адрес': ["address"],
-                    '08 Валюта': ["currency"],
-                    '13 Обязанности': ["vacancyRichText"],
-                    '14 Подробнее здесь (URL)': ["link"]
-                }
-                # Ключи с однотипным ('двойным') уровнем вложенности.
-                keys_2 = {
-                    '03 Работодатель': ["client", "title"],
-                    '09 График работы': ["place_of_work", "title"],
-                    '10 Занятость': ["type_of_work", "title"],
-                    '11 Опыт работы': ["experience", "title"],
-                    '12 Требования к соискателю': ["education", "title"],
-                }
-                # Обработка данных полученного словаря
-                for value in js_obj['objects']:
-                    # словарь вакансии
-                    vacancy = {
-                        '01 Дата публикации': time.strftime("%Y-%m-%d", time.gmtime(float(value["date_published"]))),
-                        '02 Должность': value["profession"] + '.',
-                        '06 Зарплата от': self.one_level_salary(value, "payment_from"),
-                        '07 Зарплата до': self.one_level_salary(value, "payment_to"),
-                    }
-
-                    # Заполняем словарь vacancy
-                    # по ключам 05, 08, 13, 14, имеющим "одинарный" уровень вложенности.
-                    for key_0, key in keys_1.items():
-                        self.one_level(value, vacancy, key_0, key[0])
-
-                    # по ключам 03, 09-12, имеющим "двойной" уровень вложенности.
-                    for key_0, key in keys_2.items():
-                        self.two_levels(value, vacancy, key_0, key[0], key[1])
-                    # по ключу 04, имеющему тройной уровень вложенности
-                    self.three_levels(value, vacancy, '04 Населённый пункт', "client", "town", "title")
-
-                    # Добавляем словарь с вакансией в список
-                    vak_js.append(dict(sorted(vacancy.items())))
-
-                # Создаём номер файла для адекватной последовательной сортировки в дальнейшем
-                if page < 10:
-                    page_num = '0' + str(page)
+            # Продолжаем прерванную загрузку того же запроса или начинаем новую.
+            pages = MAX_VAK_SJ // self.__per_page
+            resumed = self.resume_pages()
+            if resumed is not None:
+                saved, pages = resumed
+                print(f'Продолжаем прерванную загрузку: уже загружено страниц - {len(saved)}.')
+                self.load_pages(saved, pages)
+            else:
+                # Очищаем папку с файлами и хранилище от устаревших данных или готовимся к дозагрузке.
+                self.start_refresh()
+                # Первая страница содержит общее количество найденных вакансий.
+                js_obj = self.request_page_or_fail(0)
+                if self._planner is not None and js_obj['total'] > MAX_VAK_SJ:
+                    self.load_shards(js_obj)
                 else:
-                    page_num = str(page)
-                # Создаём новый документ, записываем в него ответ запроса
-                self.save_to_json(vak_js, os.path.join(PATH_VAK_SJ, f'vaksj_{page_num}.json'))
-
-                # Проверка на последнюю страницу, если вакансий меньше 500
-                if js_obj['total'] < self.__per_page:
-                    break
-
-                # Задержка, чтобы не нагружать сервисы sj.
-                time.sleep(0.03)
+                    saved = set()
+                    self.save_checkpoint(0, js_obj, saved, pages)
+                    if js_obj['more']:
+                        self.load_pages(saved, pages)
+            # Загрузка завершена, продолжать нечего.
+            self._checkpoint.clear()
+            self.finish_refresh()
+            self.save_cached()
 
             # Вывод данных о количестве вакансий
-            if self.size_dict != 0:
+            if self._date_from is not None:
+                print(f'\nС момента предыдущего запроса на superjob.ru опубликовано новых вакансий: {self.size_new}.'
+                      f' Всего {coord_words_num(self.size_dict)}.\n')
+            elif self.size_dict != 0:
                 print(
-                    f'\nПо вашему запросу на superjob.ru найдено {self.coord_words_num(self.size_dict)} вакансий.\n')
+                    f'\nПо вашему запросу на superjob.ru найдено {coord_words_num(self.size_dict)} вакансий.\n')
             else:
                 print('\nИзвините. Мы ничего не нашли по Вашему запросу. Попробуйте его сформулировать по-другому.\n')
                 # Удаляем пустой файл из папки data\sj
-                self.delete_files_in_folder(PATH_VAK_SJ)
+                self.delete_files_in_folder(self._path_vak)
+        except KeyError as e:
+            raise KeyError(f'Ошибка обращения к полученным данным. {e}')
+
+    async def vacancies_all_async(self, fetcher: AsyncFetcher) -> None:
+        """
+        Асинхронный вариант vacancies_all: считывает первые 500 вакансий
+        и постранично (по 100 шт.) дописывает их в хранилище.
+        :param fetcher: Асинхронный движок запросов, AsyncFetcher.
+        """
+        if self.load_cached():
+            return
+        self.start_refresh()
+        try:
+            js_obj = json.loads(await self.request_to_api_async(fetcher, 0))
+            # Количество страниц определяем по общему количеству найденных вакансий.
+            pages = min(-(-js_obj['total'] // self.__per_page), MAX_VAK_SJ // self.__per_page)
+            self.save_page(js_obj)
+
+            # Остальные страницы запрашиваем одновременно.
+            responses = await asyncio.gather(*(self.request_to_api_async(fetcher, page) for page in range(1, pages)))
+            for response in responses:
+                self.save_page(json.loads(response))
+            self.finish_refresh()
+            self.save_cached()
+
+            if self.size_dict == 0:
+                self.delete_files_in_folder(self._path_vak)
         except KeyError as e:
             raise KeyError(f'Ошибка обращения к полученным данным. {e}')
 
     def __str__(self) -> str:
-        return f'Получение, обработка (включая сортировку) и вывод данных с сервиса superjob.ru по API {self.__url}'
+        return f'Получение, обработка (включая сортировку) и вывод данных с сервиса superjob.ru по API {self._url}'
 
     def __repr__(self) -> str:
-        return (f"{self.__class__.__name__}({self.__url}, {self.__keyword},"
+        return (f"{self.__class__.__name__}({self._url}, {self.__keyword},"
                 f" {self.__area}, {self.__only_with_salary}, {self.__salary},"
                 f" {self.__per_page}, {self.size_dict}")
 
@@ -556,84 +974,124 @@ class VacPrint(Mixin):
     Вывод данных на экран
     """
 
-    def __init__(self, sort_method: int = 2):
+    def __init__(self, sort_method: int = 2, backend: str = VAK_STORAGE, path_db: str = PATH_VAK_DB):
         self.__sort_method = sort_method  # Метод сортировки: 1 - по размеру зарплаты, 2 - по датам
+        self.__backend = backend  # Способ хранения вакансий: 'jsonl' или 'sqlite'
+        self.__path_db = path_db  # Полное имя файла базы данных SQLite
+        self.__tables = {}  # Таблицы загруженных вакансий: {указатель ресурса: VacancyTable}
 
     def vacancies_print(self, count_vak, resource: str, one_each: int = 1) -> None:
         """
         Выводит вакансии на экран в количестве, заданном пользователем.
         :param count_vak: Необходимое количество, int.
-        :param resource: Указатель ресурса: 'hh' или 'sj', str.
-        :param one_each: Вывод вакансий: 1 - по одной, другое - все сразу, int.
+        :param resource: Указатель ресурса: 'hh', 'sj' или 'all' (оба ресурса), str.
+        :param one_each: Вывод вакансий: 1 - постранично, другое - все сразу, int.
         :return: Выводит на экран информацию о вакансиях.
         """
-        if resource == 'hh':
-            path = PATH_VAK_HH
-        elif resource == 'sj':
-            path = PATH_VAK_SJ
-        else:
+        if resource not in ('hh', 'sj', 'all'):
             print('Мы не готовы показать вакансии с указанного ресурса.')
             sys.exit('Работа программы завершена.\n')
 
-        # Пустой список
-        data = []
-        # Перемещаемся по файлам в папке, считывая значения, объединяя их в один список словарей.
-        for filename in os.listdir(path):
-            file_path = os.path.join(path, filename)
-            try:
-                if os.path.isfile(file_path):
-                    # Считываем данные из всех файлов в директории, объединяя их в один список.
-                    data += self.load_json(file_path)
-            except Exception as e:
-                print(f'Ошибка при открытии и/или чтении файла {file_path}. {e}')
-        # Сортируем список по датам или зарплате, выводя, заданное пользователем, количество словарей.
-        if self.__sort_method == 1:
-            data = self.list_sort_salary(data, "06 Зарплата от", "07 Зарплата до")[:count_vak]
+        if self.__backend == 'sqlite' and resource != 'all':
+            # Первые count_vak вакансий по зарплате или дате выбираются запросом по индексу.
+            store = SQLiteStore(self.__path_db, resource)
+            data = store.top_by_salary(count_vak) if self.__sort_method == 1 else store.newest(count_vak)
+            data = [Vacancy.from_dict(vacancy) for vacancy in data]
         else:
-            data = self.list_sort_date(data, '01 Дата публикации')[:count_vak]
+            # Отбираем заданное пользователем количество вакансий с наибольшей зарплатой или самых свежих
+            # (вакансии обоих сервисов - без повторов).
+            data = self.table(resource).top(count_vak, 'salary' if self.__sort_method == 1 else 'date')
         # Выводим данные на экран из списка, в котором отсортированы словари.
         self.data_print(data, one_each)
         # Выводим информацию об окончании вывода.
         print('----------------------\n'
               'Выведены все вакансии.')
 
-    def data_print(self, data: list, one_each: int = 1) -> None:
+    def salary_stats(self, resource: str) -> SalaryStats:
         """
-        Формирует словарь вакансий для вывода информации на экран.
-        :param data: Список словарей с данными о вакансиях, list.
-        :param one_each: Вывод вакансий: 1 - по одной, другое - все сразу, int.
-        :return: Выводит на экран вакансии, отсортированные по дате.
+        Статистика зарплат по найденным вакансиям.
+        :param resource: Указатель ресурса: 'hh', 'sj' или 'all' (оба ресурса), str.
+        :return: Статистика зарплат, SalaryStats.
         """
-        # Анализируем список словарей, выводим необходимые данные на экран.
-
-        for c_enum, dict_vak in enumerate(data, start=1):
+        return SalaryStats(self.table(resource))
 
-            # Выводим словарь на экран
-            self.print_display(dict_vak, c_enum)
+    def table(self, resource: str) -> VacancyTable:
+        """
+        Таблица загруженных вакансий. Строится при первом обращении, вакансии считываются из хранилищ потоком.
+        Вакансия, опубликованная на обоих сервисах, попадает в таблицу обоих ресурсов один раз (с hh.ru).
+        :param resource: Указатель ресурса: 'hh', 'sj' или 'all' (оба ресурса), str.
+        :return: Таблица вакансий, VacancyTable.
+        """
+        if resource not in self.__tables:
+            services = ['hh', 'sj'] if resource == 'all' else [resource]
+            if self.__backend == 'sqlite':
+                sources = {service: SQLiteStore(self.__path_db, service) for service in services}
+            else:
+                paths = {'hh': PATH_VAK_HH, 'sj': PATH_VAK_SJ}
+                sources = {service: self.load_vacancies([paths[service]]) for service in services}
+            self.__tables[resource] = VacancyTable.from_vacancies(DedupIndex().unique(sources))
+        return self.__tables[resource]
 
-            if one_each == 1:
-                # Поочерёдный вывод вакансий и завершение работы программы
-                i = input("\n ✅ Нажмите [Enter], чтобы продолжить\n"
-                          " ❌ Введите 'q', чтобы выйти из программы: ").strip().lower()
-                print()
-                if not i:
+    @staticmethod
+    def load_vacancies(paths: list):
+        """
+        Потоковое чтение вакансий из хранилищ (файлов JSON Lines) в указанных папках.
+        :param paths: Список путей к папкам с вакансиями, list.
+        :return: Генератор словарей с вакансиями.
+        """
+        for path in paths:
+            for filename in sorted(os.listdir(path)):
+                file_path = os.path.join(path, filename)
+                if not (filename.endswith('.jsonl') and os.path.isfile(file_path)):
                     continue
-                elif i == 'q':
-                    print(f'\nДо свидания! 👋')
-                    sys.exit('Работа программы завершена.\n')
+                try:
+                    yield from JsonLinesStore(file_path)
+                except Exception as e:
+                    print(f'Ошибка при открытии и/или чтении файла {file_path}. {e}')
+
+    def data_print(self, data: list, one_each: int = 1) -> None:
+        """
+        Выводит вакансии на экран страницами: страница форматируется, когда она понадобится,
+        следующая - в фоне, пока пользователь читает текущую.
+        :param data: Вакансии (список или таблица), list | VacancyTable.
+        :param one_each: Вывод вакансий: 1 - постранично, с командами пользователя, другое - все сразу, int.
+        :return: Выводит на экран вакансии, отсортированные по дате.
+        """
+        with Pager(data, self.format_display) as pager:
+            if one_each != 1:
+                for page in pager.pages():
+                    print(page)
+            elif not pager.run():
+                # Завершение работы программы по команде пользователя.
+                print(f'\nДо свидания! 👋')
+                sys.exit('Работа программы завершена.\n')
 
     def print_display(self, dict_vak: dict, enum: int) -> None:
         """
         Выводит информацию о вакансиях на экран.
-        :param dict_vak: Словарь с вакансией, dict.
+        :param dict_vak: Вакансия (запись или словарь), Vacancy | dict.
         :param enum: Порядковый номер вакансии (словаря), int.
         :return: Вывод информации на экран.
         """
+        print(self.format_display(dict_vak, enum))
 
-        # Выводим словарь на экран, удаляя номера у ключей, лишние символы и выполняя переносы длинных строк.
-        for key, value in sorted(dict_vak.items()):
-            # Формируем и выводим заголовок вакансии
-            if key == "01 Дата публикации":
+    def format_display(self, dict_vak: dict, enum: int) -> str:
+        """
+        Форматирует информацию о вакансии для вывода на экран.
+        :param dict_vak: Вакансия (запись или словарь), Vacancy | dict.
+        :param enum: Порядковый номер вакансии (словаря), int.
+        :return: Текст вакансии, str.
+        """
+        lines = []
+        # Удаляем номера у ключей, лишние символы и выполняем переносы длинных строк.
+        # Поля записи Vacancy уже следуют в порядке вывода, ключи словаря - сортируем.
+        items = dict_vak.items() if isinstance(dict_vak, Vacancy) else sorted(dict_vak.items())
+        for key, value in items:
+            # Служебные поля для сортировки и фильтрации не выводим
+            if key.startswith('_'):
+                continue
+            # Формируем заголовок вакансии
+            elif key == "01 Дата публикации":
                 # Номер, дата публикации вакансии, наименование должности.
                 # Номер.
                 enum = '№ ' + str(enum) + ','  # номер
@@ -642,26 +1100,26 @@ class VacPrint(Mixin):
                 date_publ = ' от ' + date_publ[-2:] + '.' + date_publ[5:7] + '.' + date_publ[:4] + ': '
                 # Должность.
                 name = dict_vak["02 Должность"] + '.'
-                # Вывод строки с данными ('заголовок вакансии').
-                print('-' * (len(enum) + len(date_publ) + len(name)))
-                print(f'{enum}{date_publ}{name}')
-                print('-' * (len(enum) + len(date_publ) + len(name)))
+                # Строка с данными ('заголовок вакансии').
+                lines.append('-' * (len(enum) + len(date_publ) + len(name)))
+                lines.append(f'{enum}{date_publ}{name}')
+                lines.append('-' * (len(enum) + len(date_publ) + len(name)))
             # Если должность, то ничего не делаем (вывели вместе с датой)
             elif key == "02 Должность":
                 pass
-            # Обработка и вывод длинных строк
+            # Обработка длинных строк
             elif key == "12 Требования к соискателю":
                 string_print = self.break_down_lines(self.del_html_tag(self.del_space(value)), 130, 27)
-                print(f"  {key[3:]}: {string_print}")
-            # Обработка и вывод длинных строк
+                lines.append(f"  {key[3:]}: {string_print}")
+            # Обработка длинных строк
             elif key == "13 Обязанности":
                 string_print = value.replace('Обязанности:', '')
                 string_print = self.break_down_lines(self.del_html_tag(self.del_space(string_print)), 140, 15)
-                print(
-                    f"  {key[3:]}: {string_print}")
-            # Вывод данных по остальным ключам
+                lines.append(f"  {key[3:]}: {string_print}")
+            # Данные по остальным ключам
             else:
-                print(f"  {key[3:]}: {self.del_html_tag(self.del_space(str(value)))}")
+                lines.append(f"  {key[3:]}: {self.del_html_tag(self.del_space(str(value)))}")
+        return '\n'.join(lines)
 
     def __str__(self) -> str:
         return f'Вывод данных о вакансиях на экран.'
@@ -0,0 +1,127 @@
+from datetime import date
+
+from src.utils.constants import KEY_DAY, KEY_SALARY_MEAN, KEY_SALARY_RUB, KEY_ID, CURRENCY_RATES
+
+# Поля вакансии и подписи, под которыми они хранятся в файлах и выводятся на экран (в порядке вывода).
+LABELS = {
+    'published': '01 Дата публикации',
+    'name': '02 Должность',
+    'employer': '03 Работодатель',
+    'area': '04 Населённый пункт',
+    'address': '05 Адрес',
+    'salary_from': '06 Зарплата от',
+    'salary_to': '07 Зарплата до',
+    'currency': '08 Валюта',
+    'schedule': '09 График работы',
+    'employment': '10 Занятость',
+    'experience': '11 Опыт работы',
+    'requirement': '12 Требования к соискателю',
+    'responsibility': '13 Обязанности',
+    'url': '14 Подробнее здесь (URL)',
+}
+# Служебные поля для сортировки, фильтрации и поиска повторов (на экран не выводятся).
+SERVICE_KEYS = {
+    'vacancy_id': KEY_ID,
+    'day': KEY_DAY,
+    'salary_mean': KEY_SALARY_MEAN,
+    'salary_rub': KEY_SALARY_RUB,
+}
+# {подпись или ключ служебного поля: поле}
+FIELDS = {label: field for field, label in (LABELS | SERVICE_KEYS).items()}
+
+
+class Vacancy:
+    """
+    Компактная запись нормализованной вакансии.
+    Значения хранятся в слотах, подписи для вывода на экран - отдельно, в словаре LABELS.
+    Для совместимости с кодом, работающим со словарями вакансий, поддерживает обращение по подписи:
+    vacancy['06 Зарплата от'], '_day' in vacancy, vacancy.items().
+    """
+
+    __slots__ = tuple(LABELS) + tuple(SERVICE_KEYS)
+
+    def __init__(self, published: str, name: str, salary_from: int = 0, salary_to: int = 0, currency: str = None,
+                 vacancy_id: str = None, day: int = None, salary_mean: int = None, salary_rub: int = None,
+                 **values) -> None:
+        self.published = published  # Дата публикации в формате ГГГГ-ММ-ДД
+        self.name = name  # Должность
+        self.salary_from = salary_from  # Зарплата от
+        self.salary_to = salary_to  # Зарплата до
+        self.currency = currency  # Валюта
+        # Остальные выводимые поля, отсутствующие в вакансии, не выводятся на экран.
+        for field in ('employer', 'area', 'address', 'schedule', 'employment', 'experience', 'requirement',
+                      'responsibility', 'url'):
+            setattr(self, field, values.pop(field, None))
+        if values:
+            raise TypeError(f'Неизвестные поля вакансии: {", ".join(values)}.')
+        self.vacancy_id = vacancy_id  # id вакансии на сервисе
+        # Служебные поля для сортировки и фильтрации вычисляются, если не переданы готовыми.
+        self.day = self.day_number(published) if day is None else day
+        self.salary_mean = (salary_from + salary_to) // 2 if salary_mean is None else salary_mean
+        if salary_rub is None:
+            # Зарплата в неизвестной валюте остаётся без пересчёта.
+            salary_rub = round(self.salary_mean * CURRENCY_RATES.get(str(currency).lower(), 1))
+        self.salary_rub = salary_rub
+
+    @staticmethod
+    def day_number(published: str) -> int:
+        """
+        Номер дня для даты публикации (порядковый номер по григорианскому календарю).
+        :param published: Дата в формате ГГГГ-ММ-ДД, str.
+        :return: Номер дня, int.
+        """
+        return date(int(published[:4]), int(published[5:7]), int(published[8:10])).toordinal()
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """
+        Создание записи из словаря вакансии с подписями в качестве ключей (формат файлов с вакансиями).
+        :param data: Словарь вакансии, dict.
+        :return: Запись вакансии, Vacancy.
+        """
+        return cls(**{FIELDS[key]: value for key, value in data.items() if key in FIELDS})
+
+    def to_dict(self) -> dict:
+        """
+        Словарь вакансии с подписями в качестве ключей (формат файлов с вакансиями), включая служебные поля.
+        :return: Словарь вакансии, dict.
+        """
+        data = dict(self.items())
+        for field, key in SERVICE_KEYS.items():
+            value = getattr(self, field)
+            if value is not None:
+                data[key] = value
+        return data
+
+    def items(self):
+        """
+        Выводимые на экран поля вакансии в порядке вывода.
+        :return: Генератор кортежей (подпись, значение).
+        """
+        for field, label in LABELS.items():
+            value = getattr(self, field)
+            if value is not None:
+                yield label, value
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, FIELDS[key])
+        except (KeyError, AttributeError):
+            raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in FIELDS and getattr(self, FIELDS[key]) is not None
+
+    def get(self, key: str, default=None):
+        return self[key] if key in self else default
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Vacancy):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    def __str__(self) -> str:
+        return f'{self.published}: {self.name}'
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.published}, {self.name}, {self.salary_from}, {self.salary_to})"
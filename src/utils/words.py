@@ -0,0 +1,12 @@
+def coord_words_num(digit) -> str:
+    """
+    Согласование слова "вакансии" с числительными.
+    :param digit: Числительное для согласования, int.
+    :return: Слово "вакансии", согласованное с числительным, str.
+    """
+    if digit % 10 == 1 and digit != 11:
+        return f'{digit} вакансия'
+    elif digit % 10 in [2, 3, 4] and digit not in [12, 13, 14]:
+        return f'{digit} вакансии'
+    else:
+        return f'{digit} вакансий'
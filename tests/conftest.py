@@ -0,0 +1,15 @@
+# Общие фикстуры для тестирования
+import pytest
+
+from tests.stub_server import start_stub_server
+
+
+@pytest.fixture
+def stub_server():
+    """
+    Тестовый сервер на localhost, имитирующий API сервисов вакансий.
+    """
+    server = start_stub_server()
+    yield server
+    server.shutdown()
+    server.server_close()
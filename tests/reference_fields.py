@@ -0,0 +1,92 @@
+# Прежнее заполнение словарей вакансий, которое заменено таблицами полей (FieldExtractor).
+# Используется в тестах и замерах для сравнения результатов.
+
+
+def one_level(dict_vak: dict, vacancy: dict, key_0: str, key_1: str) -> None:
+    """
+    Проверка и обработка данных из исходного словаря.
+    Два уровня вложенности ключей в словаре.
+    :param dict_vak: Словарь вакансии (анализируемый), dict.
+    :param vacancy: Словарь вакансии (заполняемый), dict.
+    :param key_0: Ключ создаваемого словаря, str.
+    :param key_1: Ключ 1-го уровня вложенности анализируемого словаря, str.
+    :return: Добавляет в словарь пару ключ: значение.
+    """
+    try:
+        if all(dict_vak.get(key_1)):
+            vacancy[key_0] = dict_vak[key_1]
+    except (TypeError, AttributeError):
+        vacancy[key_0] = 'нет данных.'
+
+
+def two_levels(dict_vak: dict, vacancy: dict, key_0: str, key_1: str, key_2: str) -> None:
+    """
+    Проверка и обработка данных из исходного словаря.
+    Два уровня вложенности ключей в словаре.
+    :param dict_vak: Словарь вакансии (анализируемый), dict.
+    :param vacancy: Словарь вакансии (заполняемый), dict.
+    :param key_0: Ключ создаваемого словаря, str.
+    :param key_1: Ключ 1-го уровня вложенности анализируемого словаря, str.
+    :param key_2: Ключ 2-го уровня вложенности анализируемого словаря, str.
+    :return: Добавляет в словарь пару ключ: значение.
+    """
+    try:
+        if all(dict_vak.get(key_1).get(key_2)):
+            vacancy[key_0] = dict_vak[key_1][key_2]
+    except (TypeError, AttributeError):
+        vacancy[key_0] = 'нет данных.'
+
+
+def three_levels(dict_vak: dict, vacancy: dict, key_0: str, key_1: str, key_2: str, key_3: str) -> None:
+    """
+    Проверка и обработка данных из исходного словаря.
+    Три уровня вложенности ключей в словаре.
+    :param dict_vak: Словарь вакансии (анализируемый), dict.
+    :param vacancy: Словарь вакансии (заполняемый), dict.
+    :param key_0: Ключ создаваемого словаря, str.
+    :param key_1: Ключ 1-го уровня вложенности анализируемого словаря, str.
+    :param key_2: Ключ 2-го уровня вложенности анализируемого словаря, str.
+    :param key_3: Ключ 3-го уровня вложенности анализируемого словаря, str.
+    :return: Добавляет в словарь пару ключ: значение.
+    """
+    try:
+        if all(dict_vak.get(key_1).get(key_2).get(key_3)):
+            vacancy[key_0] = dict_vak[key_1][key_2][key_3]
+    except (TypeError, AttributeError):
+        vacancy[key_0] = 'нет данных.'
+
+
+def one_level_salary(dict_vak: dict, key_1: str) -> int:
+    """
+    Проверка и обработка данных по зарплате из исходного словаря.
+    Один уровень вложенности ключей в словаре.
+    :param dict_vak: Словарь вакансии (анализируемый), dict.
+    :param key_1: Ключ 1-го уровня вложенности анализируемого словаря, str.
+    :return: Выводит данные о зарплате, int.
+    """
+    salary = 0
+    try:
+        if dict_vak.get(key_1) != 0:
+            salary = dict_vak[key_1]
+    except (TypeError, AttributeError):
+        pass
+    return salary
+
+
+def two_levels_salary(dict_vak: dict, key_1: str, key_2: str) -> int:
+    """
+    Проверка и обработка данных по зарплате из исходного словаря.
+    Два уровня вложенности ключей в словаре.
+    :param dict_vak: Словарь вакансии (анализируемый), dict.
+    :param key_1: Ключ 1-го уровня вложенности анализируемого словаря, str.
+    :param key_2: Ключ 2-го уровня вложенности анализируемого словаря, str.
+    :return: Выводит данные о зарплате, 0.
+    """
+    salary = 0
+    try:
+        if all(str(dict_vak.get(key_1).get(key_2))):
+            if str(dict_vak.get(key_1).get(key_2)) != 'None':
+                salary = dict_vak[key_1][key_2]
+    except (TypeError, AttributeError):
+        pass
+    return salary
@@ -0,0 +1,165 @@
+# Тестовый сервер на localhost, имитирующий API сервисов hh.ru и superjob.ru
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+def make_vacancy_hh(num: int) -> dict:
+    """
+    Создание вакансии в формате ответа API hh.ru.
+    :param num: Порядковый номер вакансии, int.
+    :return: Словарь вакансии, dict.
+    """
+    return {
+        'id': str(num),
+        'name': f'Водитель {num}',
+        'published_at': f'2023-11-{num % 28 + 1:02d}T10:00:00+0300',
+        'salary': {'from': 1000 * num, 'to': 2000 * num, 'currency': 'RUR'},
+        'employer': {'name': f'Работодатель {num % 7}'},
+        'area': {'name': 'Ростов-на-Дону'},
+        'address': None,
+        'schedule': {'name': 'Полный день'},
+        'employment': {'name': 'Полная занятость'},
+        'experience': {'name': 'Нет опыта'},
+        'snippet': {'requirement': 'Права категории B.', 'responsibility': 'Перевозка грузов.'},
+        'alternate_url': f'https://hh.ru/vacancy/{num}',
+    }
+
+
+def make_vacancy_sj(num: int) -> dict:
+    """
+    Создание вакансии в формате ответа API superjob.ru.
+    :param num: Порядковый номер вакансии, int.
+    :return: Словарь вакансии, dict.
+    """
+    return {
+        'id': num,
+        'profession': f'Водитель {num}',
+        'date_published': 1698818400 + 86400 * (num % 28),
+        'payment_from': 1000 * num,
+        'payment_to': 0,
+        'currency': 'rub',
+        'address': None,
+        'vacancyRichText': '<p>Перевозка грузов.</p>',
+        'link': f'https://www.superjob.ru/vakansii/voditel-{num}.html',
+        'client': {'title': f'Работодатель {num % 7}', 'town': {'title': 'Ростов-на-Дону'}},
+        'place_of_work': {'title': 'Не имеет значения'},
+        'type_of_work': {'title': 'Полный рабочий день'},
+        'experience': {'title': 'Без опыта'},
+        'education': {'title': 'Не имеет значения'},
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Обработчик запросов тестового сервера.
+    Запросы с параметром keyword обрабатываются в формате superjob.ru, остальные - в формате hh.ru.
+    """
+    # Общее количество вакансий, которое "находит" сервер.
+    found = 0
+    # Задержка ответа, имитирующая время доставки по сети, сек.
+    latency = 0.0
+    # Сбои: {индекс страницы: сколько раз подряд ответить на её запрос ошибкой 502}.
+    failures = {}
+    # Ограничение частоты: {индекс страницы: сколько раз подряд ответить на её запрос ошибкой 429}.
+    throttled = {}
+    # Значение заголовка Retry-After в ответе 429.
+    retry_after = '0'
+    # id дочерних регионов (hh.ru) или регионов и городов (superjob.ru):
+    # вакансия с номером num относится к региону areas[num % len(areas)].
+    areas = []
+    # Часть вакансий относится к самому региону, а не к дочерним (num % (len(areas) + 1) == len(areas)).
+    orphans = False
+
+    def do_GET(self) -> None:
+        time.sleep(self.latency)
+        query = parse_qs(urlparse(self.path).query)
+        page = int(query.get('page', ['0'])[0])
+        if self.failures.get(page, 0) > 0:
+            self.failures[page] -= 1
+            self.send_response(502)
+            self.send_header('Content-Length', '11')
+            self.end_headers()
+            self.wfile.write(b'Bad Gateway')
+            return
+        if self.throttled.get(page, 0) > 0:
+            self.throttled[page] -= 1
+            self.send_response(429)
+            self.send_header('Retry-After', self.retry_after)
+            self.send_header('Content-Length', '17')
+            self.end_headers()
+            self.wfile.write(b'Too Many Requests')
+            return
+        if 'keyword' in query:
+            per_page = int(query.get('count', ['100'])[0])
+            vacancies = map(make_vacancy_sj, range(self.found))
+            area = query.get('town', query.get('o', ['']))[0]
+            if area in self.areas:
+                # Вакансии региона или города (при orphans часть вакансий относится только к стране).
+                parts = len(self.areas) + self.orphans
+                vacancies = (vacancy for vacancy in vacancies if vacancy['id'] % parts == self.areas.index(area))
+            # Только вакансии с зарплатой в указанном диапазоне.
+            if 'payment_from' in query:
+                vacancies = (vacancy for vacancy in vacancies
+                             if vacancy['payment_from'] >= int(query['payment_from'][0]))
+            if 'payment_to' in query:
+                vacancies = (vacancy for vacancy in vacancies if vacancy['payment_from'] <= int(query['payment_to'][0]))
+            # Только вакансии, опубликованные в указанном окне дат.
+            if 'date_published_from' in query:
+                date_from = int(query['date_published_from'][0])
+                vacancies = (vacancy for vacancy in vacancies if vacancy['date_published'] >= date_from)
+            if 'date_published_to' in query:
+                date_to = int(query['date_published_to'][0])
+                vacancies = (vacancy for vacancy in vacancies if vacancy['date_published'] <= date_to)
+            vacancies = list(vacancies)
+            # Сервис находит все вакансии, но отдаёт не более 500.
+            found = min(len(vacancies), 500)
+            objects = vacancies[page * per_page:min((page + 1) * per_page, found)]
+            data = {'objects': objects, 'total': len(vacancies), 'more': (page + 1) * per_page < found}
+        else:
+            per_page = int(query.get('per_page', ['100'])[0])
+            vacancies = map(make_vacancy_hh, range(self.found))
+            area = query.get('area', [''])[0]
+            if area in self.areas:
+                # Вакансии дочернего региона (при orphans часть вакансий привязана только к самому региону).
+                parts = len(self.areas) + self.orphans
+                vacancies = (vacancy for vacancy in vacancies
+                             if int(vacancy['id']) % parts == self.areas.index(area))
+            # Только вакансии, опубликованные в указанном окне дат (все в одном часовом поясе).
+            if 'date_from' in query:
+                vacancies = (vacancy for vacancy in vacancies if vacancy['published_at'] >= query['date_from'][0])
+            if 'date_to' in query:
+                vacancies = (vacancy for vacancy in vacancies if vacancy['published_at'] <= query['date_to'][0])
+            vacancies = list(vacancies)
+            # Сервис находит все вакансии, но отдаёт не более 2000.
+            found = min(len(vacancies), 2000)
+            items = vacancies[page * per_page:min((page + 1) * per_page, found)]
+            data = {'items': items, 'found': len(vacancies), 'page': page, 'pages': -(-found // per_page)}
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        # Не засоряем вывод журналом запросов.
+        pass
+
+
+def start_stub_server(found: int = 250, latency: float = 0.0) -> ThreadingHTTPServer:
+    """
+    Запуск тестового сервера в отдельном потоке.
+    :param found: Общее количество вакансий, которое "находит" сервер, int.
+    :param latency: Задержка ответа, сек., float.
+    :return: Экземпляр сервера с атрибутами url (адрес API) и handler (класс обработчика).
+    """
+    handler = type('Handler', (StubHandler,), {'found': found, 'latency': latency, 'failures': {}, 'throttled': {},
+                                               'areas': []})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server.url = f'http://127.0.0.1:{server.server_address[1]}/vacancies'
+    server.handler = handler
+    return server
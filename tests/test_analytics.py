@@ -0,0 +1,83 @@
+# Тестирование модуля analytics.py
+import statistics
+
+import pytest
+
+from src.utils.analytics import SalaryStats
+from src.utils.vacancies import VacPrint
+from src.utils.vacancy import Vacancy
+
+
+def make_vacancies() -> list:
+    """
+    Набор вакансий: зарплаты в рублях и долларах, без зарплаты, в трёх населённых пунктах.
+    """
+    vacancies = []
+    for num in range(60):
+        vacancies.append(Vacancy.from_dict({
+            '01 Дата публикации': '2023-11-05', '02 Должность': 'Водитель.',
+            '03 Работодатель': f'Работодатель {num % 4}', '04 Населённый пункт': ['Москва', 'Тула', 'Орёл'][num % 3],
+            '06 Зарплата от': 1000 * num, '07 Зарплата до': 3000 * num if num % 2 else 0,
+            '08 Валюта': 'USD' if num == 59 else 'RUR', '09 График работы': 'Полный день',
+        }))
+    return vacancies
+
+
+def test_summary():
+    """
+    Тестирование сводной статистики: вакансии без зарплаты не учитываются, зарплаты пересчитаны в рубли.
+    """
+    vacancies = make_vacancies()
+    salaries = sorted(vacancy.salary_rub for vacancy in vacancies if vacancy.salary_rub > 0)
+    stats = SalaryStats(vacancies)
+    summary = stats.summary()
+
+    assert len(stats) == len(salaries) == 59
+    assert summary['count'] == 59 and summary['min'] == salaries[0] and summary['max'] == salaries[-1]
+    assert summary['median'] == round(statistics.median(salaries))
+    # Процентили совпадают с методом 'inclusive' модуля statistics (линейная интерполяция).
+    quartiles = statistics.quantiles(salaries, n=4, method='inclusive')
+    assert [summary['percentiles'][percent] for percent in (25, 50, 75)] == [round(value) for value in quartiles]
+
+
+def test_group_by():
+    """
+    Тестирование статистики по группам.
+    """
+    vacancies = make_vacancies()
+    groups = SalaryStats(vacancies).group_by('region')
+
+    assert list(groups) == ['Тула', 'Орёл', 'Москва']
+    for region, stats in groups.items():
+        salaries = sorted(vacancy.salary_rub for vacancy in vacancies
+                          if vacancy.area == region and vacancy.salary_rub > 0)
+        assert stats['count'] == len(salaries) and stats['median'] == round(statistics.median(salaries))
+    assert SalaryStats(vacancies).group_by('schedule', min_count=100) == {}
+    with pytest.raises(ValueError):
+        SalaryStats(vacancies).group_by('currency')
+
+
+def test_histogram_and_report():
+    """
+    Тестирование гистограммы и текста статистики.
+    """
+    stats = SalaryStats(make_vacancies())
+    histogram = stats.histogram(bins=5)
+
+    assert len(histogram) == 5 and sum(count for _, _, count in histogram) == len(stats)
+    assert histogram[0][0] == stats.summary()['min'] and histogram[-1][1] == stats.summary()['max']
+    assert 'Тула' in stats.report(group='region')
+    # Слово "вакансия" согласуется с количеством.
+    assert SalaryStats.format_stats('Тула', {'count': 21, 'median': 1, 'min': 1, 'max': 1, 'mean': 1}) == \
+        'Тула: 21 вакансия с зарплатой, медиана 1, от 1 до 1, в среднем 1.'
+    assert SalaryStats([]).histogram() == [] and SalaryStats([]).summary() == {'count': 0}
+    assert SalaryStats([]).report() == 'Зарплата не указана ни в одной из найденных вакансий.'
+
+
+def test_salary_stats_from_files():
+    """
+    Тестирование статистики по вакансиям из файлов (без служебных полей).
+    """
+    stats = VacPrint().salary_stats('all')
+    assert 0 < len(stats) <= 148
+    assert stats.summary()['min'] > 0
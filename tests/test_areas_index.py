@@ -0,0 +1,112 @@
+# Тестирование модулей areas_index.py, areas_search.py и areas_mapping.py
+import os
+
+import pytest
+
+from src.utils.areas_index import AreasIndex
+from src.utils.areas_mapping import AreasMapping
+from src.utils.areas_search import AreasSearch
+from src.utils.vacancies import VacSJ
+
+AREAS_HH = {'areas': [
+    {'id': '1530', 'name': 'Ростовская область', 'areas': [
+        {'id': '76', 'name': 'Ростов-на-Дону', 'areas': []},
+        {'id': '1531', 'name': 'Ростовская область', 'areas': []},
+    ]},
+    {'id': '1', 'name': 'Москва', 'areas': []},
+]}
+
+AREAS_SJ = {
+    'towns': [{'id': 4, 'title': 'Москва'}],
+    'regions': [{'id': 73, 'title': 'Ростовская область', 'towns': [{'id': 73, 'title': 'Ростов-на-Дону'}]}],
+}
+
+
+@pytest.mark.parametrize("build, areas, name, result", [
+    (AreasIndex.from_hh, AREAS_HH, 'ростов-на-дону', 76),
+    (AreasIndex.from_hh, AREAS_HH, ' Ростовская область ', 1530),
+    (AreasIndex.from_hh, AREAS_HH, 'москва', 1),
+    (AreasIndex.from_hh, AREAS_HH, 'error', None),
+    (AreasIndex.from_sj, AREAS_SJ, 'москва', 4),
+    (AreasIndex.from_sj, AREAS_SJ, 'ростов-на-дону', 73),
+])
+def test_find(build, areas, name, result):
+    """
+    Тестирование поиска id по названию региона/населённого пункта.
+    """
+    assert build(areas).find(name) == result
+
+
+def test_for_directory(tmp_path):
+    """
+    Тестирование построения, сохранения и повторного использования индекса.
+    """
+    path_are = tmp_path / 'areas.json'
+    path_are.write_text('{"areas": [{"id": "1", "name": "Москва", "areas": []}]}', encoding='utf-8')
+
+    index = AreasIndex.for_directory(str(path_are), AreasIndex.from_hh)
+    assert os.path.isfile(AreasIndex.index_path(str(path_are)))
+    assert index.find('москва') == 1
+    assert index.regions == {1: []}
+    # Повторно индекс не строится.
+    assert AreasIndex.for_directory(str(path_are), AreasIndex.from_hh) is index
+
+
+@pytest.mark.parametrize("query, result", [
+    ('ростов на дону', [('Ростов-на-Дону', 76, 1.0)]),
+    ('ростов-на-дон', [('Ростов-на-Дону', 76, 0.929)]),
+    ('ростовская', [('Ростовская область', 1530, 0.75)]),
+    ('масква', [('Москва', 1, 0.833)]),
+    ('', []),
+])
+def test_areas_search(query, result):
+    """
+    Тестирование нечёткого поиска по названиям регионов/населённых пунктов.
+    """
+    assert AreasSearch(AreasIndex.from_hh(AREAS_HH)).search(query, limit=1) == result
+
+
+def test_areas_mapping(tmp_path):
+    """
+    Тестирование таблицы соответствия регионов hh.ru и superjob.ru.
+    """
+    areas_hh = {'areas': AREAS_HH['areas'] + [
+        {'id': '1174', 'name': 'Ханты-Мансийский АО - Югра', 'areas': [{'id': '147', 'name': 'Сургут', 'areas': []}]},
+    ]}
+    areas_sj = {'towns': AREAS_SJ['towns'], 'regions': AREAS_SJ['regions'] + [
+        {'id': 71, 'title': 'Тюменская область, включая Ханты-Мансийский АО и Ямало-Ненецкий АО',
+         'towns': [{'id': 45, 'title': 'Сургут'}]},
+    ]}
+    mapping = AreasMapping.build(AreasIndex.from_hh(areas_hh), AreasIndex.from_sj(areas_sj))
+
+    assert mapping.to_sj(113) == (1, True)
+    assert mapping.to_sj(76) == (73, False)
+    assert mapping.to_sj(1) == (4, False)
+    assert mapping.to_sj(1530) == (73, True)
+    assert mapping.to_sj(147) == (45, False)
+    assert mapping.to_sj(1174) == (71, True)
+    assert mapping.to_sj(999) is None
+    assert mapping.to_hh(73) == 76
+    assert mapping.to_hh(73, sj_region=True) == 1530
+    assert mapping.to_hh(999) is None
+
+    # Таблица сохраняется на диске без потерь.
+    mapping.save(str(tmp_path / 'areas_map.json'))
+    loaded = AreasMapping.load(str(tmp_path / 'areas_map.json'))
+    assert (loaded.hh_to_sj, loaded.sj_to_hh, loaded.sj_regions_to_hh) == \
+           (mapping.hh_to_sj, mapping.sj_to_hh, mapping.sj_regions_to_hh)
+
+
+@pytest.mark.parametrize("area_id_hh, params", [
+    (113, {'c': 1}),
+    (1530, {'o': 73}),
+    (76, {'town': 73}),
+])
+def test_areas_mapping_params(area_id_hh, params):
+    """
+    Тестирование поиска на superjob.ru по региону hh.ru: регион ищется как регион (o), а не как город с тем же id.
+    """
+    mapping = AreasMapping.build(AreasIndex.from_hh(AREAS_HH), AreasIndex.from_sj(AREAS_SJ))
+    area_id, region = mapping.to_sj(area_id_hh)
+    request = VacSJ('водитель', area=area_id, region=region).request_params()
+    assert {key: request[key] for key in ('c', 'o', 'town') if key in request} == params
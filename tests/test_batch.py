@@ -0,0 +1,111 @@
+# Тестирование модуля batch.py
+import csv
+import json
+
+import pytest
+
+from src.utils.batch import BatchRunner
+from src.utils.constants import MAX_VAK_HH, MAX_VAK_SJ
+from src.utils.network import HttpSession
+from src.utils.refresh import RefreshState
+
+QUERIES = """service,keyword,region,salary,only_with_salary,sort,count
+# Комментарии и пустые строки пропускаются.
+hh,Водитель,ростов на дону,,,salary,10
+
+sj,водитель,,,,date,
+all,водитель,Москва,,,,
+"""
+
+
+def test_read_queries(tmp_path):
+    """
+    Тестирование чтения и проверки запросов из файла.
+    """
+    path = tmp_path / 'queries.csv'
+    path.write_text(QUERIES, encoding='utf-8')
+    queries = BatchRunner.read_queries(str(path))
+    assert len(queries) == 3
+    assert queries[0] == {'service': 'hh', 'keyword': 'Водитель', 'region': 'ростов на дону', 'salary': 0,
+                          'only_with_salary': False, 'sort': 'salary', 'count': 10}
+    assert queries[2]['sort'] == 'date' and queries[2]['count'] == 0
+
+    for row in ({'service': 'zz', 'keyword': 'водитель'}, {'service': 'hh', 'keyword': ''},
+                {'service': 'hh', 'keyword': 'водитель', 'salary': 'много'},
+                {'service': 'hh', 'keyword': 'водитель', 'sort': 'name'}):
+        with pytest.raises(ValueError):
+            BatchRunner.parse_query(row, 1)
+
+
+def test_area_ids(tmp_path):
+    """
+    Тестирование регионов запроса: регион hh.ru ищется на superjob.ru как регион,
+    а поиск по всей России вместо ненайденного региона отмечается в примечании.
+    """
+    runner = BatchRunner(str(tmp_path), session=HttpSession())
+    query = {'service': 'all', 'keyword': 'водитель', 'region': 'Ростовская область', 'salary': 0,
+             'only_with_salary': False}
+    areas, note = runner.area_ids(query)
+    assert areas == {'hh': (1530, False), 'sj': (60, True)} and note == ''
+    searches = runner.make_searches(query, areas, str(tmp_path / 'work'))
+    assert searches[1].request_params()['o'] == 60 and 'town' not in searches[1].request_params()
+
+    areas, note = runner.area_ids({'service': 'sj', 'region': 'zzzzzz'})
+    assert areas == {'sj': (1, False)} and 'по всей России' in note
+    assert runner.area_ids({'service': 'all', 'region': ''}) == ({'hh': (113, False), 'sj': (1, True)}, '')
+
+
+def test_run(stub_server, tmp_path):
+    """
+    Тестирование пакетного выполнения запросов: файл с результатом на каждый запрос и сводка.
+    """
+    path = tmp_path / 'queries.csv'
+    path.write_text(QUERIES, encoding='utf-8')
+    output = tmp_path / 'out'
+    runner = BatchRunner(str(output), workers=3, session=HttpSession(),
+                         urls={'hh': stub_server.url, 'sj': stub_server.url})
+    rows = runner.run(BatchRunner.read_queries(str(path)), progress=False)
+
+    assert [row['error'] for row in rows] == ['', '', '']
+    # Вакансия 0 тестового сервера (без зарплаты) на обоих сервисах одинакова и учитывается один раз.
+    assert [row['found'] for row in rows] == [250, 250, 499]
+    # Регион найден по похожему названию, для поиска на обоих сервисах - по справочнику hh.ru.
+    assert rows[0]['area_id'] == '76' and rows[1]['area_id'] == '1' and rows[2]['area_id'] == '1 4'
+
+    with open(output / rows[0]['file'], encoding='utf-8') as f:
+        vacancies = [json.loads(line) for line in f]
+    assert [vacancy['_id'] for vacancy in vacancies] == [str(num) for num in range(249, 239, -1)]
+    with open(output / rows[2]['file'], encoding='utf-8') as f:
+        assert sum(1 for _ in f) == 499
+
+    with open(output / 'summary.csv', encoding='utf-8', newline='') as f:
+        summary = list(csv.DictReader(f))
+    assert [row['file'] for row in summary] == ['001_hh_водитель.jsonl', '002_sj_водитель.jsonl',
+                                                '003_all_водитель.jsonl']
+    assert summary[0]['with_salary'] == '249'
+    assert sorted(path.name for path in output.iterdir()) == sorted([row['file'] for row in rows] + ['summary.csv'])
+
+
+def test_run_same_as_search(stub_server, tmp_path, monkeypatch):
+    """
+    Тестирование пакетного выполнения так же, как в диалоговом режиме: сервисы отдают не больше своего предела,
+    а состояние инкрементального обновления приложения не изменяется.
+    """
+    paths = []
+    forget = RefreshState.forget
+    monkeypatch.setattr(RefreshState, 'forget', lambda self, service: paths.append(self.path) or forget(self, service))
+    stub_server.handler.found = 2500
+    path = tmp_path / 'queries.csv'
+    path.write_text('service,keyword\nhh,водитель\nsj,водитель\n', encoding='utf-8')
+    runner = BatchRunner(str(tmp_path / 'out'), workers=2, session=HttpSession(),
+                         urls={'hh': stub_server.url, 'sj': stub_server.url})
+    rows = runner.run(BatchRunner.read_queries(str(path)), progress=False)
+    assert [row['error'] for row in rows] == ['', '']
+    assert [row['found'] for row in rows] == [MAX_VAK_HH, MAX_VAK_SJ]
+    # Счётчики запросов относятся только к последнему запуску.
+    host = stub_server.url.split('/')[2]
+    count = runner.session.stats[host]['count']
+    runner.run(BatchRunner.read_queries(str(path)), progress=False)
+    assert runner.session.stats[host]['count'] == count
+    # У каждого запроса - своё состояние в его рабочей папке.
+    assert len(set(paths)) == 2 and all(path.startswith(str(tmp_path / 'out' / 'work')) for path in paths)
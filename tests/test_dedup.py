@@ -0,0 +1,85 @@
+# Тестирование модуля dedup.py
+from src.utils.dedup import DedupIndex
+from src.utils.network import HttpSession, RateLimiter
+from src.utils.storage import JsonLinesStore
+from src.utils.vacancies import VacHH, VacSJ
+from src.utils.vacancy import Vacancy
+
+
+def make_vacancy(vacancy_id: str, name: str = 'Водитель', employer: str = 'ООО «Ромашка»',
+                 area: str = 'Ростов-на-Дону', salary: int = 50000) -> Vacancy:
+    """
+    Создание вакансии для тестов.
+    """
+    return Vacancy('2023-11-01', name, salary, salary, 'RUR', vacancy_id=vacancy_id, employer=employer, area=area)
+
+
+def test_fingerprint():
+    """
+    Тестирование отпечатка: различия в записи не важны, различия в сути - важны.
+    """
+    index = DedupIndex()
+    base = index.fingerprint(make_vacancy('1'))
+    assert index.fingerprint(make_vacancy('2', name='водитель!', employer='Ромашка, ООО', area='Ростов на Дону',
+                                          salary=50200)) == base
+    assert index.fingerprint(make_vacancy('1').to_dict()) == base
+    assert index.fingerprint(make_vacancy('1', name='Водитель погрузчика')) != base
+    assert index.fingerprint(make_vacancy('1', area='Москва')) != base
+    assert index.fingerprint(make_vacancy('1', salary=80000)) != base
+
+
+def test_add_and_unique():
+    """
+    Тестирование отбрасывания точных повторов и подсчёта почти-повторов на разных сервисах.
+    """
+    index = DedupIndex()
+    # Страницы sj приходят раньше, чем hh: подсчёт от порядка не зависит.
+    assert [vacancy.vacancy_id for vacancy in index.add('sj', [make_vacancy('1'), make_vacancy('2', 'Повар')])] == \
+        ['1', '2']
+    assert [vacancy.vacancy_id for vacancy in index.add('hh', [make_vacancy('7'), make_vacancy('8', 'Курьер')])] == \
+        ['7', '8']
+    # Перекрывающиеся страницы одного сервиса.
+    assert [vacancy.vacancy_id for vacancy in index.add('hh', [make_vacancy('8', 'Курьер'), make_vacancy('9')])] == \
+        ['9']
+    assert index.stats == {'exact': 1, 'near': 1} and len(index) == 5
+
+    # При объединении почти-повтор остаётся с hh.ru, точные повторы отбрасываются.
+    sources = {'sj': [make_vacancy('1').to_dict(), make_vacancy('2', 'Повар').to_dict()],
+               'hh': [make_vacancy('7').to_dict(), make_vacancy('7').to_dict()]}
+    assert [record['_id'] for record in DedupIndex().unique(sources)] == ['7', '2']
+
+    index.forget('hh')
+    assert index.stats['near'] == 0 and len(index) == 2
+
+
+def test_seed(tmp_path):
+    """
+    Тестирование заполнения индекса вакансиями из хранилища.
+    """
+    store = JsonLinesStore(str(tmp_path / 'vakhh.jsonl'))
+    store.append([make_vacancy('1').to_dict(), make_vacancy('2', 'Повар').to_dict()])
+    index = DedupIndex()
+    index.seed('hh', store)
+    assert index.add('hh', [make_vacancy('1'), make_vacancy('3')])[0].vacancy_id == '3'
+    index.add('sj', [make_vacancy('5', 'Повар')])
+    assert index.stats == {'exact': 1, 'near': 1}
+
+
+def test_shared_index(stub_server, tmp_path):
+    """
+    Тестирование общего индекса при поиске на обоих сервисах: одинаковая вакансия учитывается один раз.
+    """
+    for folder in ('hh', 'sj'):
+        (tmp_path / folder).mkdir()
+    index = DedupIndex()
+    searches = [VacHH('водитель', url=stub_server.url, path_vak=str(tmp_path / 'hh'), session=HttpSession(),
+                      rate_limiter=RateLimiter(rate=0), dedup=index),
+                VacSJ('водитель', url=stub_server.url, path_vak=str(tmp_path / 'sj'), session=HttpSession(),
+                      rate_limiter=RateLimiter(rate=0), dedup=index)]
+    for search in searches:
+        search.vacancies_all()
+    # Вакансия 0 тестового сервера (без зарплаты) на обоих сервисах одинакова.
+    assert [search.size_dict for search in searches] == [250, 250]
+    assert index.near_duplicates == 1
+    merged = list(index.unique({'hh': searches[0].store, 'sj': searches[1].store}))
+    assert len(merged) == 499
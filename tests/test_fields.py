@@ -0,0 +1,59 @@
+# Тестирование модуля fields.py
+import pytest
+
+from src.utils.fields import FieldExtractor, Salary, NO_DATA
+from tests import reference_fields as reference
+from tests.stub_server import make_vacancy_hh, make_vacancy_sj
+
+# Вакансии с отсутствующими, пустыми и нестроковыми значениями.
+SOURCES = [
+    {'a': 'текст', 'b': {'c': 'значение', 'd': {'e': 'глубоко'}}, 's': {'from': 1000, 'to': None}, 'p': 500},
+    {'a': '', 'b': {'c': '', 'd': {'e': ''}}, 's': None, 'p': 0},
+    {'a': None, 'b': None, 's': {}, 'p': None},
+    {'a': 15, 'b': {'c': None, 'd': 'не словарь'}, 's': [], 'p': 100},
+    {'a': ['x', 'y'], 'b': {'c': ['x', ''], 'd': {'e': []}}, 's': {'from': 0, 'to': 0}, 'p': 0},
+    {'b': {'c': True, 'd': {'e': {'ключ': 1}}}, 's': 'не словарь', 'p': 3},
+]
+
+
+@pytest.mark.parametrize("source", SOURCES)
+def test_extractor_matches_reference(source):
+    """
+    Тестирование совпадения результатов с прежним заполнением словаря вакансии.
+    """
+    extractor = FieldExtractor({'01': ('a',), '02': ('b', 'c'), '03': ('b', 'd', 'e'),
+                                '04': Salary('s', 'from'), '05': Salary('s', 'to'), '06': Salary('p')})
+    expected = {}
+    reference.one_level(source, expected, '01', 'a')
+    reference.two_levels(source, expected, '02', 'b', 'c')
+    reference.three_levels(source, expected, '03', 'b', 'd', 'e')
+    expected['04'] = reference.two_levels_salary(source, 's', 'from')
+    expected['05'] = reference.two_levels_salary(source, 's', 'to')
+    # Зарплата None заменяется нулём (one_level_salary возвращает None).
+    expected['06'] = reference.one_level_salary(source, 'p') or 0
+
+    assert extractor.extract(source) == expected
+
+
+def test_extractor_paths():
+    """
+    Тестирование путей произвольной длины, вычисляемых полей и некорректных описаний.
+    """
+    extractor = FieldExtractor({'путь': ('a', 'b', 'c', 'd'), 'функция': lambda source: len(source)})
+    assert extractor.extract({'a': {'b': {'c': {'d': 'да'}}}}) == {'путь': 'да', 'функция': 1}
+    assert extractor.extract({'a': {'b': 'нет'}}) == {'путь': NO_DATA, 'функция': 1}
+    # Отсутствующая зарплата заменяется нулём.
+    assert FieldExtractor({'зарплата': Salary('p')}).extract({}) == {'зарплата': 0}
+    assert len(extractor) == 2
+
+    with pytest.raises(TypeError):
+        FieldExtractor({'поле': 'строка вместо пути'})
+
+
+@pytest.mark.parametrize("make_vacancy", [make_vacancy_hh, make_vacancy_sj])
+def test_extractor_api_format(make_vacancy):
+    """
+    Тестирование извлечения полей из вакансий в формате API: отсутствующий адрес - "нет данных.".
+    """
+    extractor = FieldExtractor({'адрес': ('address',), 'адрес hh': ('address', 'raw')})
+    assert extractor.extract(make_vacancy(1)) == {'адрес': NO_DATA, 'адрес hh': NO_DATA}
@@ -0,0 +1,144 @@
+# Тестирование модуля network.py
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+from src.utils.async_fetch import AsyncFetcher, run_searches
+from src.utils.network import RateLimiter, ApiError, RateLimitError, HttpSession, check_response, \
+    parse_retry_after, call_with_retries, get_rate_limiter
+from src.utils.vacancies import VacHH, VacSJ
+
+
+def make_response(status: int, text: str = '', headers: dict = None) -> requests.Response:
+    """
+    Создание ответа сервиса без обращения к сети.
+    :param status: Код ответа, int.
+    :param text: Текст ответа, str.
+    :param headers: Заголовки ответа, dict.
+    :return: Ответ, requests.Response.
+    """
+    response = requests.Response()
+    response.status_code = status
+    response._content = text.encode('utf-8')
+    response.headers.update(headers or {})
+    response.url = 'http://127.0.0.1/vacancies'
+    return response
+
+
+def test_token_bucket():
+    """
+    Тестирование "ведра с токенами": burst запросов сразу, дальше - с интервалом 1 / rate.
+    """
+    limiter = RateLimiter(rate=10, burst=3)
+    delays = [limiter.reserve() for _ in range(5)]
+    assert delays[:3] == [0.0, 0.0, 0.0]
+    assert delays[3] == pytest.approx(0.1, abs=0.01)
+    assert delays[4] == pytest.approx(0.2, abs=0.01)
+    # Без ограничения частоты запросы не ждут.
+    assert [RateLimiter(rate=0).reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+
+def test_penalize_and_reward():
+    """
+    Тестирование подстройки частоты: снижение вдвое с паузой по Retry-After и постепенное восстановление.
+    """
+    limiter = RateLimiter(rate=8, burst=2, min_rate=1, step=0.5)
+    limiter.penalize(retry_after=0.5)
+    assert limiter.rate == 4
+    # Во время паузы запросы ждут её окончания, затем идут с новой частотой.
+    assert limiter.reserve() == pytest.approx(0.5, abs=0.01)
+    assert limiter.reserve() == pytest.approx(0.75, abs=0.01)
+    for _ in range(5):
+        limiter.penalize(retry_after=0)
+    assert limiter.rate == 1
+    for _ in range(20):
+        limiter.reward()
+    assert limiter.rate == 8
+
+
+def test_parse_retry_after():
+    """
+    Тестирование разбора заголовка Retry-After: секунды или дата HTTP.
+    """
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('3') == 3
+    assert parse_retry_after('100000') == 60
+    assert parse_retry_after('завтра') is None
+    moment = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=10), usegmt=True)
+    assert parse_retry_after(moment) == pytest.approx(10, abs=1.5)
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0
+
+
+def test_check_response():
+    """
+    Тестирование проверки кода ответа: какие ошибки повторяются, а какие - нет.
+    """
+    limiter = RateLimiter(rate=10)
+    assert check_response(make_response(200, '{}'), limiter).text == '{}'
+
+    with pytest.raises(RateLimitError) as error:
+        check_response(make_response(429, headers={'Retry-After': '2'}), limiter)
+    assert error.value.retryable and error.value.retry_after == 2 and limiter.rate == 5
+
+    with pytest.raises(ApiError) as error:
+        check_response(make_response(502), limiter)
+    assert error.value.retryable
+
+    # Капча и ошибки запроса не повторяются.
+    calls = []
+
+    def captcha():
+        calls.append(1)
+        check_response(make_response(403, '{"errors": [{"type": "captcha_required"}]}'), limiter)
+
+    with pytest.raises(ApiError) as error:
+        call_with_retries(captcha, retries=3, backoff=0)
+    assert not error.value.retryable and len(calls) == 1
+    with pytest.raises(ApiError) as error:
+        check_response(make_response(400), limiter)
+    assert error.value.status == 400 and not error.value.retryable
+
+
+def test_shared_limiter():
+    """
+    Тестирование общего ограничителя частоты запросов к одному хосту.
+    """
+    assert get_rate_limiter('https://api.hh.ru/vacancies') is get_rate_limiter('https://api.hh.ru/areas')
+    assert get_rate_limiter('https://api.hh.ru/vacancies') is not get_rate_limiter('https://api.superjob.ru/2.0/')
+
+
+def test_throttled_pages(stub_server, tmp_path):
+    """
+    Тестирование загрузки при ответах 429: страницы загружаются повторно, частота запросов снижается.
+    """
+    stub_server.handler.throttled = {1: 2}
+    (tmp_path / 'hh').mkdir()
+    (tmp_path / 'sj').mkdir()
+    limiter = RateLimiter(rate=100)
+    prof_hh = VacHH('водитель', url=stub_server.url, path_vak=str(tmp_path / 'hh'), rate_limiter=limiter,
+                    session=HttpSession(), backoff=0)
+    prof_hh.vacancies_all()
+    assert prof_hh.size_dict == 250
+    assert limiter.rate < 100
+
+    # Асинхронная загрузка повторяет запросы так же.
+    stub_server.handler.throttled = {0: 1, 2: 1}
+    limiter = RateLimiter(rate=100)
+    prof_sj = VacSJ('водитель', url=stub_server.url, path_vak=str(tmp_path / 'sj'), session=HttpSession())
+    with AsyncFetcher(rate_limiter=limiter, backoff=0) as fetcher:
+        assert run_searches([prof_sj], fetcher) == [250]
+    assert limiter.rate < 100
+
+
+def test_fetcher_reuse(stub_server, tmp_path):
+    """
+    Тестирование повторного использования асинхронного движка в нескольких циклах событий.
+    """
+    (tmp_path / 'hh').mkdir()
+    # Без повторов: ошибка семафора, привязанного к прошлому циклу, не маскируется повторным запросом.
+    with AsyncFetcher(max_per_host=1, rate_limiter=RateLimiter(rate=0), retries=0) as fetcher:
+        for _ in range(2):
+            prof_hh = VacHH('водитель', url=stub_server.url, path_vak=str(tmp_path / 'hh'), session=HttpSession())
+            assert run_searches([prof_hh], fetcher) == [250]
@@ -0,0 +1,68 @@
+# Тестирование модуля pager.py
+import pytest
+
+from src.utils.pager import Pager
+from src.utils.vacancies import VacPrint
+from src.utils.vacancy import Vacancy
+
+
+def render(item, number: int) -> str:
+    """
+    Форматирование вакансии для тестов.
+    """
+    return f'{number}:{item}'
+
+
+def test_pages():
+    """
+    Тестирование форматирования страниц и фонового форматирования следующей страницы.
+    """
+    calls = []
+
+    def tracked(item, number):
+        calls.append(number)
+        return render(item, number)
+
+    with Pager(list('abcdefg'), tracked, page_size=3) as pager:
+        assert pager.page(0) == '1:a\n2:b\n3:c'
+        # Следующая страница уже форматируется в фоне и не форматируется повторно.
+        pager.prefetch(3).result()
+        assert sorted(calls) == [1, 2, 3, 4, 5, 6]
+        assert pager.page(3) == '4:d\n5:e\n6:f'
+        assert pager.prefetch(6).result() == '7:g' and pager.prefetch(9) is None
+        assert sorted(calls) == [1, 2, 3, 4, 5, 6, 7]
+    assert list(Pager(list('abcdefg'), render, page_size=3, prefetch=False).pages()) == \
+        ['1:a\n2:b\n3:c', '4:d\n5:e\n6:f', '7:g']
+
+
+@pytest.mark.parametrize("commands, expected, result", [
+    (['', '', ''], ['1', '4', '7', '10'], True),
+    (['9'], ['1', '9'], True),
+    (['+3', ''], ['1', '7', '10'], True),
+    (['7', '2', 'q'], ['1', '7', '2'], False),
+    (['x', '99', '+20'], ['1'], True),
+])
+def test_run(commands, expected, result):
+    """
+    Тестирование команд: следующая страница, пропуск N вакансий, переход к вакансии, выход.
+    """
+    answers, shown = iter(commands), []
+    with Pager([str(number) for number in range(1, 11)], lambda item, number: item, page_size=3) as pager:
+        assert pager.run(lambda prompt: next(answers), lambda text='': shown.append(text)) is result
+    assert [text.split('\n')[0] for text in shown if text and not text.startswith('Введите')] == expected
+    assert sum(text.startswith('Введите') for text in shown) == (2 if commands[0] == 'x' else 0)
+
+
+def test_data_print(monkeypatch, capsys):
+    """
+    Тестирование постраничного вывода вакансий и выхода из программы по команде пользователя.
+    """
+    data = [Vacancy('2023-11-0' + str(day), 'Водитель', vacancy_id=str(day)) for day in range(1, 8)]
+    VacPrint().data_print(data, one_each=2)
+    assert capsys.readouterr().out.count('№ ') == 7
+
+    monkeypatch.setattr('builtins.input', lambda prompt: 'q')
+    with pytest.raises(SystemExit):
+        VacPrint().data_print(data, one_each=1)
+    out = capsys.readouterr().out
+    assert out.count('№ ') == 5 and 'До свидания' in out
@@ -0,0 +1,81 @@
+# Тестирование модуля query_cache.py
+import os
+import time
+
+from src.utils.network import HttpSession
+from src.utils.query_cache import QueryCache
+from src.utils.vacancies import VacHH, VacSJ
+
+
+def test_key():
+    """
+    Тестирование ключа запроса: регистр и лишние пробелы в тексте запроса не учитываются.
+    """
+    assert QueryCache.key('hh', text='  Водитель   такси', area=1) == QueryCache.key('hh', area=1, text='водитель такси')
+    assert QueryCache.key('hh', text='водитель', area=1) != QueryCache.key('sj', text='водитель', area=1)
+    assert QueryCache.key('hh', text='водитель', area=1) != QueryCache.key('hh', text='водитель', area=2)
+
+
+def test_lru_and_disk(tmp_path):
+    """
+    Тестирование вытеснения давно не использовавшихся запросов из памяти и чтения результатов с диска.
+    """
+    cache = QueryCache(str(tmp_path), ttl=60, max_size=2, max_files=3)
+    for num in range(4):
+        cache.put(f'hh:{num}', [{'num': num}])
+    # В памяти - два последних запроса, на диске - три самых свежих.
+    assert len(cache) == 2 and cache.stats['evicted'] == 3
+    assert len(os.listdir(tmp_path)) == 3
+
+    assert cache.get('hh:3') == [{'num': 3}]
+    assert cache.get('hh:1') == [{'num': 1}]
+    assert cache.get('hh:0') is None
+    stats = cache.stats
+    assert (stats['memory'], stats['disk'], stats['miss']) == (1, 1, 1)
+    assert stats['hit_rate'] == 2 / 3
+
+    # Другой экземпляр кэша читает результаты с диска.
+    other = QueryCache(str(tmp_path), ttl=60)
+    assert other.get('hh:2') == [{'num': 2}] and other.stats['disk'] == 1
+
+    cache.clear()
+    assert len(cache) == 0 and os.listdir(tmp_path) == []
+
+
+def test_ttl(tmp_path):
+    """
+    Тестирование удаления устаревших результатов.
+    """
+    cache = QueryCache(str(tmp_path), ttl=0.05)
+    cache.put('hh:1', [])
+    assert cache.get('hh:1') == []
+    time.sleep(0.1)
+    assert cache.get('hh:1') is None
+    assert cache.stats['expired'] == 1 and os.listdir(tmp_path) == []
+
+
+def test_cached_search(stub_server, tmp_path):
+    """
+    Тестирование поиска вакансий с кэшем: повторный запрос не обращается к сервису.
+    """
+    for folder in ('hh', 'sj', 'cache'):
+        os.makedirs(tmp_path / folder)
+    cache = QueryCache(str(tmp_path / 'cache'))
+    session = HttpSession()
+    host = stub_server.url.split('/')[2]
+    prof_hh = VacHH('Водитель', url=stub_server.url, path_vak=str(tmp_path / 'hh'), session=session, cache=cache)
+    prof_hh.vacancies_all()
+    vacancies = list(prof_hh.store)
+    assert session.stats[host]['count'] == 3
+
+    session.reset_stats()
+    again = VacHH(' водитель ', url=stub_server.url, path_vak=str(tmp_path / 'hh'), session=session, cache=cache)
+    again.vacancies_all()
+    assert session.stats == {}
+    assert again.size_dict == 250 and list(again.store) == vacancies
+
+    # Запрос с другими параметрами выполняется.
+    VacSJ('водитель', url=stub_server.url, path_vak=str(tmp_path / 'sj'), session=session, cache=cache).vacancies_all()
+    # Загрузка останавливается на последней странице (more=False).
+    assert session.stats[host]['count'] == 3
+    assert cache.stats['memory'] == 1 and cache.stats['miss'] == 2
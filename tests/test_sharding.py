@@ -0,0 +1,178 @@
+# Тестирование модуля sharding.py
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.utils.network import HttpSession, RateLimiter
+from src.utils.sharding import ShardPlannerHH, ShardPlannerSJ
+from src.utils.vacancies import VacHH, VacSJ
+
+# Диапазон дат публикации вакансий тестового сервера.
+PERIOD = (datetime(2023, 11, 1, tzinfo=timezone(timedelta(hours=3))),
+          datetime(2023, 11, 29, tzinfo=timezone(timedelta(hours=3))))
+
+
+@pytest.fixture
+def path_are(tmp_path):
+    """
+    Справочник регионов: страна с тремя регионами, у первого - два населённых пункта.
+    """
+    tree = {'id': '113', 'name': 'Россия', 'areas': [
+        {'id': '1', 'name': 'Регион 1', 'areas': [{'id': '11', 'name': 'Город 11', 'areas': []},
+                                                 {'id': '12', 'name': 'Город 12', 'areas': []}]},
+        {'id': '2', 'name': 'Регион 2', 'areas': []},
+        {'id': '3', 'name': 'Регион 3', 'areas': []},
+    ]}
+    path = tmp_path / 'areas.json'
+    path.write_text(json.dumps(tree, ensure_ascii=False), encoding='utf-8')
+    return str(path)
+
+
+def test_split(path_are):
+    """
+    Тестирование деления шарда по дочерним регионам и пополам по датам публикации.
+    """
+    planner = ShardPlannerHH(path_are, period=PERIOD, min_window=3600)
+    assert planner.children(113) == [1, 2, 3]
+    assert planner.children('1') == [11, 12]
+    assert planner.children(2) == [] and planner.children(999) == []
+    assert planner.split_area({'area': 1}) == [{'area': 11}, {'area': 12}]
+
+    first, second = planner.split_dates({'area': 2})
+    assert first == {'area': 2, 'date_from': '2023-11-01T00:00:00+0300', 'date_to': '2023-11-15T00:00:00+0300'}
+    assert second['date_from'] == first['date_to'] and second['date_to'] == '2023-11-29T00:00:00+0300'
+    # При инкрементальном обновлении диапазон начинается с даты предыдущего запроса.
+    assert planner.split_dates({'area': 2}, '2023-11-27T00:00:00+0300')[0]['date_from'] == '2023-11-27T00:00:00+0300'
+    assert planner.split_dates({'area': 2, 'date_from': '2023-11-01T00:00:00+0300',
+                                'date_to': '2023-11-01T01:00:00+0300'}) == []
+
+
+def test_plan(path_are):
+    """
+    Тестирование планирования: шарды укладываются в предел, непокрытые вакансии региона делятся по датам.
+    """
+    counts = {1: 1500, 11: 900, 12: 600, 2: 2500, 3: 400}
+    planner = ShardPlannerHH(path_are, period=PERIOD)
+
+    def probe(shard: dict) -> dict:
+        if 'date_from' in shard:
+            return {'found': 1250}
+        return {'found': counts[shard['area']]}
+
+    shards = [shard for shard, page in planner.plan(probe, {'area': 113}, {'found': 4400})]
+    assert shards[:2] == [{'area': 1}, {'area': 3}]
+    assert [shard['area'] for shard in shards[2:]] == [2, 2] and planner.truncated == 0
+
+    # Дочерние регионы покрывают не все вакансии страны: делим её по датам.
+    shards = planner.plan(probe, {'area': 113}, {'found': 5000})
+    assert [shard['area'] for shard, page in shards] == [113] * 2
+    assert all('date_from' in shard for shard, page in shards)
+
+    # Количество частей ограничено: запрос не делится, лишние вакансии не загружаются.
+    planner = ShardPlannerHH(path_are, period=PERIOD, max_shards=2)
+    assert planner.plan(probe, {'area': 113}, {'found': 4400}) == [({'area': 113}, {'found': 4400})]
+    assert planner.truncated == 2400
+
+
+@pytest.mark.parametrize("areas, orphans", [
+    (['1', '2', '3'], False),
+    (['1', '2'], False),
+    (['1', '2', '3'], True),
+])
+def test_sharded_search(areas, orphans, stub_server, path_are, tmp_path):
+    """
+    Тестирование загрузки запроса сверх предела выдачи сервиса по частям: все вакансии без повторов.
+    """
+    stub_server.handler.found = 5000
+    stub_server.handler.areas = areas
+    stub_server.handler.orphans = orphans
+    path_vak = tmp_path / 'hh'
+    path_vak.mkdir()
+    prof_hh = VacHH('водитель', url=stub_server.url, path_vak=str(path_vak), session=HttpSession(),
+                    rate_limiter=RateLimiter(rate=0), shard=True, planner=ShardPlannerHH(path_are, period=PERIOD))
+    prof_hh.vacancies_all()
+    ids = [vacancy['_id'] for vacancy in prof_hh.store]
+    assert prof_hh.size_dict == len(ids) == len(set(ids)) == 5000
+
+    # Без разбиения сервис отдаёт только первые 2000 вакансий.
+    prof_hh = VacHH('водитель', url=stub_server.url, path_vak=str(path_vak), session=HttpSession(),
+                    rate_limiter=RateLimiter(rate=0))
+    prof_hh.vacancies_all()
+    assert prof_hh.size_dict == 2000
+
+
+@pytest.fixture
+def path_are_sj(tmp_path):
+    """
+    Справочник регионов superjob.ru: страна с городом вне регионов и двумя регионами.
+    """
+    tree = {'id': 1, 'title': 'Россия', 'towns': [{'id': 4, 'title': 'Москва', 'id_region': 0}], 'regions': [
+        {'id': 46, 'title': 'Регион 46', 'towns': [{'id': 2176, 'title': 'Город 2176', 'id_region': 46}]},
+        {'id': 47, 'title': 'Регион 47', 'towns': []},
+    ]}
+    path = tmp_path / 'areas_sj.json'
+    path.write_text(json.dumps(tree, ensure_ascii=False), encoding='utf-8')
+    return str(path)
+
+
+def test_split_sj(path_are_sj):
+    """
+    Тестирование деления запроса к superjob.ru по регионам и городам, зарплатам и датам публикации.
+    """
+    planner = ShardPlannerSJ(path_are_sj, period=PERIOD)
+    assert planner.split_area({}) == [{'o': 46}, {'o': 47}, {'town': 4}]
+    assert planner.split_area({'o': 46}) == [{'o': 46, 'town': 2176}]
+    assert planner.split_area({'town': 4}) == []
+
+    assert planner.split_payment({}) == []
+    assert planner.split_payment({'payment_from': 1000, 'payment_to': 5000}) == [
+        {'payment_from': 1000, 'payment_to': 3000}, {'payment_from': 3000, 'payment_to': 5000}]
+    assert planner.split_payment({'payment_from': 1000, 'payment_to': 1500}) == []
+
+    first, second = planner.split_dates({'town': 4})
+    assert first['date_published_from'] == int(PERIOD[0].timestamp())
+    assert second['date_published_to'] == int(PERIOD[1].timestamp())
+
+
+@pytest.mark.parametrize("areas, orphans, salary, found, expected", [
+    (['4', '46', '47'], False, 0, 1000, 1000),
+    (['4', '46', '47'], True, 0, 1000, 1000),
+    ([], False, 200000, 2000, 801),
+])
+def test_sharded_search_sj(areas, orphans, salary, found, expected, stub_server, path_are_sj, tmp_path):
+    """
+    Тестирование загрузки запроса к superjob.ru сверх предела выдачи сервиса по частям.
+    """
+    stub_server.handler.found = found
+    stub_server.handler.areas = areas
+    stub_server.handler.orphans = orphans
+    path_vak = tmp_path / 'sj'
+    path_vak.mkdir()
+    prof_sj = VacSJ('водитель', area=1 if areas else 4, salary=salary, url=stub_server.url, path_vak=str(path_vak),
+                    session=HttpSession(), rate_limiter=RateLimiter(rate=0), shard=True,
+                    planner=ShardPlannerSJ(path_are_sj, period=PERIOD))
+    prof_sj.vacancies_all()
+    ids = [vacancy['_id'] for vacancy in prof_sj.store]
+    assert prof_sj.size_dict == len(ids) == len(set(ids)) == expected
+
+
+def test_sharded_search_sj_region(stub_server, path_are_sj, tmp_path, monkeypatch):
+    """
+    Тестирование загрузки по частям запроса к superjob.ru по региону: регион делится по его городам.
+    """
+    shards = []
+    split_area = ShardPlannerSJ.split_area
+    monkeypatch.setattr(ShardPlannerSJ, 'split_area',
+                        lambda self, shard, date_from=None: shards.append(shard) or split_area(self, shard, date_from))
+    stub_server.handler.found = 1000
+    stub_server.handler.areas = ['2176']
+    stub_server.handler.orphans = True
+    path_vak = tmp_path / 'sj'
+    path_vak.mkdir()
+    prof_sj = VacSJ('водитель', area=46, region=True, url=stub_server.url, path_vak=str(path_vak),
+                    session=HttpSession(), rate_limiter=RateLimiter(rate=0), shard=True,
+                    planner=ShardPlannerSJ(path_are_sj, period=PERIOD))
+    prof_sj.vacancies_all()
+    assert shards[0] == {'o': 46}
+    assert prof_sj.size_dict == 1000
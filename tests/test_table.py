@@ -0,0 +1,72 @@
+# Тестирование модуля table.py
+import pytest
+
+from src.utils.constants import KEY_DAY, KEY_SALARY_MEAN
+from src.utils.table import VacancyTable
+from src.utils.vacancies import VacHH, VacSJ
+from tests.stub_server import make_vacancy_hh, make_vacancy_sj
+
+
+@pytest.fixture
+def vacancies() -> list:
+    """
+    Вакансии обоих сервисов в том виде, в котором они получаются при обработке ответов API.
+    """
+    items_hh = [make_vacancy_hh(num) for num in range(120)]
+    items_sj = [make_vacancy_sj(num) for num in range(60)]
+    for num, item in enumerate(items_hh):
+        item['schedule']['name'] = ['Полный день', 'Сменный график', 'Гибкий график'][num % 3]
+    return (VacHH('водитель').parse_page({'items': items_hh}) +
+            VacSJ('водитель').parse_page({'objects': items_sj}))
+
+
+def test_rows(vacancies):
+    """
+    Тестирование построения таблицы: строки восстанавливаются без потерь.
+    """
+    table = VacancyTable.from_vacancies(vacancies)
+    assert len(table) == 180
+    assert list(table) == vacancies
+    assert table[5] == vacancies[5] and list(table[10:13]) == vacancies[10:13]
+    # Таблица строится и по словарям в формате хранилищ.
+    assert list(VacancyTable.from_vacancies(vacancy.to_dict() for vacancy in vacancies)) == vacancies
+
+
+@pytest.mark.parametrize("count", [0, 5, 180, 500])
+def test_sort_top(vacancies, count):
+    """
+    Тестирование сортировки и отбора первых N: порядок совпадает с сортировкой словарей.
+    """
+    table = VacancyTable.from_vacancies(vacancies)
+    by_date = sorted(vacancies, key=lambda vacancy: vacancy[KEY_DAY], reverse=True)
+    by_salary = sorted(vacancies, key=lambda vacancy: vacancy[KEY_SALARY_MEAN], reverse=True)
+
+    assert list(table.sort('date')) == by_date
+    assert list(table.top(count, 'date')) == by_date[:count]
+    assert list(table.top(count, 'salary')) == by_salary[:count]
+    with pytest.raises(ValueError):
+        table.sort('name')
+
+
+def test_filter(vacancies):
+    """
+    Тестирование отбора строк по зарплате, дате и кодируемым полям.
+    """
+    table = VacancyTable.from_vacancies(vacancies)
+
+    selected = table.filter(salary_min=50000, schedule=['Полный день', 'Гибкий график'])
+    expected = [vacancy for vacancy in vacancies
+                if vacancy.salary_rub >= 50000 and vacancy.schedule in ('Полный день', 'Гибкий график')]
+    assert list(selected) == expected
+    # Отбор применяется к представлению, а не ко всей таблице.
+    assert list(selected.filter(schedule='Гибкий график').top(3, 'salary')) == \
+           sorted([vacancy for vacancy in expected if vacancy.schedule == 'Гибкий график'],
+                  key=lambda vacancy: vacancy[KEY_SALARY_MEAN], reverse=True)[:3]
+
+    day = vacancies[0].day
+    assert len(table.filter(day_from=day, with_salary=True, salary_max=10 ** 9)) == \
+           len([vacancy for vacancy in vacancies if vacancy.day >= day and vacancy.salary_rub > 0])
+    assert table.filter(area='Москва').column('area') == []
+    assert set(table.filter(currency='rub').column('currency')) == {'rub'}
+    with pytest.raises(ValueError):
+        table.filter(name='Водитель.')
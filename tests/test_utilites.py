@@ -5,7 +5,7 @@ import pytest
 
 from src.utils.areas import AreasHH, AreasSJ
 from src.utils.utilities import loading_regions_hh, loading_regions_sj, user_name, exit_program, service_selection, \
-    search_area_id, selection_menu_sections_id, all_ok_salary, all_ok_salary_input, sort_method_int, get_job_info, \
+    search_area_id, convert_area_id, selection_menu_sections_id, all_ok_salary, all_ok_salary_input, sort_method_int, get_job_info, \
     print_vacancies
 from src.utils.vacancies import VacPrint, VacHH, VacSJ
 
@@ -33,7 +33,7 @@ def test_loading_regions_hh():
     # Ошибка при получении данных
     with pytest.raises(Exception) as exif:
         url = ''
-        loading_regions_hh(url=url, path_vak_dir_hh=path_vak_dir_hh, path_are_hh=path_are_hh)
+        loading_regions_hh(url=url, path_vak_dir_hh=path_vak_dir_hh, path_are_hh=path_are_hh, ttl=0)
     assert f'Ошибка при получении данных с {url}.' in str(exif.value)
 
     # # Ошибка при удалении файлов
@@ -66,7 +66,7 @@ def test_loading_regions_sj():
     # Ошибка при получении данных
     with pytest.raises(Exception) as exif:
         url = ''
-        loading_regions_sj(url=url, path_vak_dir_sj=path_vak_dir_sj, path_are_sj=path_are_sj)
+        loading_regions_sj(url=url, path_vak_dir_sj=path_vak_dir_sj, path_are_sj=path_are_sj, ttl=0)
     assert f'Ошибка при получении данных с {url}.' in str(exif.value)
 
     # # Ошибка при удалении файлов
@@ -76,6 +76,28 @@ def test_loading_regions_sj():
     # assert f'Системе не удается найти указанный путь' in str(exif.value)
 
 
+@pytest.mark.parametrize("loading_regions, path_dir, path_are", [
+    (loading_regions_hh, 'path_vak_dir_hh', 'path_are_hh'),
+    (loading_regions_sj, 'path_vak_dir_sj', 'path_are_sj'),
+])
+def test_loading_regions_cache(loading_regions, path_dir, path_are, tmp_path):
+    """
+    Тестирование повторного использования ранее загруженного справочника регионов.
+    """
+    path_file = tmp_path / 'test_areas.json'
+    path_file.write_text('{}', encoding='utf-8')
+    paths = {path_dir: str(tmp_path), path_are: str(path_file)}
+
+    # Справочник актуален: запрос к сервису не выполняется, ошибки нет.
+    loading_regions(url='', **paths)
+    assert path_file.read_text(encoding='utf-8') == '{}'
+
+    # Срок актуальности истёк: справочник запрашивается заново.
+    with pytest.raises(Exception) as exif:
+        loading_regions(url='', ttl=0, **paths)
+    assert 'Ошибка при получении данных с .' in str(exif.value)
+
+
 @pytest.mark.parametrize("name, result", [
     ('Василий', 'Василий'),
     ('Mary', 'Mary'),
@@ -119,6 +141,7 @@ def test_exit_program(name, capsys):
 @pytest.mark.parametrize("name, num_vak, result", [
     ('Василий', '1', 1),
     ('Василий', '2', 2),
+    ('Василий', '3', 3),
     ('Василий', '0', "Работа программы завершена."),
 ])
 def test_service_selection_1(name, num_vak, result, capsys):
@@ -126,7 +149,7 @@ def test_service_selection_1(name, num_vak, result, capsys):
     Тестирование функции выбора номера сервиса для вывода вакансий.
     Пользователь вводит: 1, 2 или 0.
     """
-    if num_vak == '1' or num_vak == '2':
+    if num_vak in ('1', '2', '3'):
         num_vak = service_selection(name, num_vak)
         assert num_vak == result
     elif num_vak == '0':
@@ -159,7 +182,10 @@ def test_service_selection_2(capsys, monkeypatch):
     ('hh', 'Василий', 'Ростовская область', 1530),
     ('hh', 'Василий', 'Ростов-на-Дону', 76),
     ('hh', 'Василий', 'error', 113),
+    ('hh', 'Василий', 'ростов на дону', 76),
+    ('hh', 'Василий', 'нижний новгрод', 66),
     ('sj', 'Василий', 'Ростов-на-Дону', 73),
+    ('sj', 'Василий', 'санкт петербург', 14),
     ('sj', 'Василий', 'Санкт-Петербург', 14),
     ('sj', 'Василий', 'error', 1),
 ])
@@ -173,6 +199,23 @@ def test_search_area_id(service, name, area_vak, result, capsys, monkeypatch):
     assert test_id == result
 
 
+@pytest.mark.parametrize("area_id, service, region, result", [
+    (76, 'hh', False, (73, False)),
+    (1530, 'hh', False, (60, True)),
+    (113, 'hh', False, (1, True)),
+    (-1, 'hh', False, (1, False)),
+    (73, 'sj', False, (76, False)),
+    (60, 'sj', True, (1530, False)),
+    (-1, 'sj', False, (113, False)),
+])
+def test_convert_area_id(area_id, service, region, result):
+    """
+    Тестирование перевода id региона/населённого пункта между сервисами:
+    регион hh.ru переводится в регион superjob.ru, а не в населённый пункт с тем же id.
+    """
+    assert convert_area_id(area_id, service, region) == result
+
+
 @pytest.mark.parametrize("num_area, name, result", [
     ('1', 'Василий', (True, False)),
     ('2', 'Василий', (True, True)),
@@ -323,6 +366,8 @@ def test_get_job_info(service, name, name_vak, area_id, only_with_salary, salary
     ('hh', '30', 6, 2, 2, True),
     ('sj', '5', 6, 2, 1, True),
     ('sj', '30', 6, 2, 2, True),
+    ('all', '5', 6, 2, 1, True),
+    ('all', '30', 6, 2, 2, True),
 ])
 def test_print_vacancies(service, count_vak, size_dict_vak, one_each, result, sort_method):
     """
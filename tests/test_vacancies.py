@@ -0,0 +1,291 @@
+# Тестирование модуля vacancies.py
+import os
+from datetime import date
+
+import pytest
+
+from src.utils.async_fetch import run_searches
+from src.utils.constants import CURRENCY_RATES, KEY_DAY, KEY_SALARY_MEAN
+from src.utils.network import HttpSession
+from src.utils.refresh import RefreshState
+from src.utils.storage import JsonLinesStore, SQLiteStore, make_store
+from src.utils.vacancies import VacHH, VacSJ, VacPrint
+from src.utils.vacancy import Vacancy
+
+
+@pytest.mark.parametrize("found, max_workers, pages", [
+    (250, 1, 3),
+    (250, 4, 3),
+    (5000, 8, 20),
+    (0, 4, 0),
+])
+def test_vac_hh_vacancies_all(found, max_workers, pages, stub_server, tmp_path):
+    """
+    Тестирование постраничной (в т.ч. параллельной) загрузки вакансий с hh.ru.
+    """
+    stub_server.handler.found = found
+    prof_hh = VacHH('водитель', max_workers=max_workers, url=stub_server.url, path_vak=str(tmp_path))
+    prof_hh.vacancies_all()
+
+    # Все страницы дописываются в одно хранилище в порядке выдачи сервиса.
+    assert os.listdir(tmp_path) == (['vakhh.jsonl'] if pages else [])
+    assert prof_hh.size_dict == min(found, 2000)
+    urls = [vacancy['14 Подробнее здесь (URL)'] for vacancy in prof_hh.store]
+    assert urls == [f'https://hh.ru/vacancy/{num}' for num in range(min(found, 2000))]
+
+
+def test_run_searches(stub_server, tmp_path):
+    """
+    Тестирование одновременного выполнения нескольких поисков в асинхронном режиме.
+    """
+    for folder in ('hh_1', 'hh_2', 'sj'):
+        os.makedirs(tmp_path / folder)
+    searches = [
+        VacHH('водитель', url=stub_server.url, path_vak=str(tmp_path / 'hh_1')),
+        VacHH('водитель', area=76, url=stub_server.url, path_vak=str(tmp_path / 'hh_2')),
+        VacSJ('водитель', url=stub_server.url, path_vak=str(tmp_path / 'sj')),
+    ]
+
+    assert run_searches(searches) == [250, 250, 250]
+    assert os.listdir(tmp_path / 'hh_1') == ['vakhh.jsonl']
+    assert os.listdir(tmp_path / 'sj') == ['vaksj.jsonl']
+    assert len(searches[0].store) == 250
+    vacancies = list(searches[2].store)
+    assert vacancies[-1]['14 Подробнее здесь (URL)'] == 'https://www.superjob.ru/vakansii/voditel-249.html'
+
+
+def test_sort_fields(stub_server, tmp_path, capsys):
+    """
+    Тестирование служебных полей для сортировки и фильтрации в нормализованных вакансиях.
+    """
+    for folder in ('hh', 'sj'):
+        os.makedirs(tmp_path / folder)
+    prof_hh = VacHH('водитель', url=stub_server.url, path_vak=str(tmp_path / 'hh'))
+    prof_sj = VacSJ('водитель', url=stub_server.url, path_vak=str(tmp_path / 'sj'))
+    prof_hh.vacancies_all()
+    prof_sj.vacancies_all()
+
+    for vacancy in list(prof_hh.store) + list(prof_sj.store):
+        assert vacancy['_day'] == date.fromisoformat(vacancy['01 Дата публикации']).toordinal()
+        assert vacancy['_salary_mean'] == (vacancy['06 Зарплата от'] + vacancy['07 Зарплата до']) // 2
+        assert vacancy['_salary_rub'] == vacancy['_salary_mean']
+        assert vacancy['_id'] in vacancy['14 Подробнее здесь (URL)']
+
+    # Зарплата в валюте пересчитывается в рубли.
+    vacancy = Vacancy.from_dict({'01 Дата публикации': '2023-11-05', '02 Должность': 'Водитель.',
+                                 '06 Зарплата от': 1000, '07 Зарплата до': 3000, '08 Валюта': 'USD'})
+    assert vacancy['_salary_mean'] == 2000 and vacancy.salary_rub == 2000 * CURRENCY_RATES['usd']
+
+    # Служебные поля на экран не выводятся.
+    capsys.readouterr()
+    VacPrint().print_display(vacancy, 1)
+    assert '_' not in capsys.readouterr().out
+
+
+def test_vacancy_record():
+    """
+    Тестирование компактной записи вакансии.
+    """
+    data = {'01 Дата публикации': '2023-11-05', '02 Должность': 'Водитель.', '04 Населённый пункт': 'Москва',
+            '06 Зарплата от': 1000, '07 Зарплата до': 0, '08 Валюта': 'rub', '_id': '7'}
+    vacancy = Vacancy.from_dict(data)
+
+    assert not hasattr(vacancy, '__dict__')
+    assert vacancy.area == 'Москва' and vacancy.vacancy_id == '7' and vacancy.salary_mean == 500
+    # Отсутствующие поля не выводятся, подписи следуют в порядке вывода.
+    assert [label for label, _ in vacancy.items()] == sorted(key for key in data if not key.startswith('_'))
+    assert '05 Адрес' not in vacancy and vacancy.get('05 Адрес', 'нет') == 'нет'
+    with pytest.raises(KeyError):
+        _ = vacancy['15 Неизвестное поле']
+    # Запись сохраняется в словарь и восстанавливается без потерь.
+    assert Vacancy.from_dict(vacancy.to_dict()) == vacancy
+    assert vacancy.to_dict()['_day'] == date(2023, 11, 5).toordinal()
+
+
+def test_json_lines_store(tmp_path):
+    """
+    Тестирование хранилища вакансий в формате JSON Lines.
+    """
+    store = JsonLinesStore(str(tmp_path / 'vak.jsonl'))
+    assert list(store) == [] and len(store) == 0
+
+    store.append([{'02 Должность': 'Водитель.', '06 Зарплата от': 50000}])
+    store.append([{'02 Должность': 'Сварщик.'}, {'02 Должность': 'Повар.'}])
+    # Одна вакансия - одна строка файла, порядок добавления сохраняется.
+    assert len((tmp_path / 'vak.jsonl').read_text(encoding='utf-8').splitlines()) == 3
+    assert [vacancy['02 Должность'] for vacancy in store] == ['Водитель.', 'Сварщик.', 'Повар.']
+    assert list(VacPrint.load_vacancies([str(tmp_path)]))[0]['06 Зарплата от'] == 50000
+
+    store.clear()
+    assert not os.path.exists(store.path)
+
+
+def test_sqlite_store(stub_server, tmp_path):
+    """
+    Тестирование хранилища вакансий SQLite: выборки по индексам совпадают с сортировкой в памяти.
+    """
+    # База данных хранится вне папок сервисов, которые очищаются перед каждым поиском.
+    os.makedirs(tmp_path / 'vak')
+    path_vak, path_db = str(tmp_path / 'vak'), str(tmp_path / 'vacancies.db')
+    prof_hh = VacHH('водитель', url=stub_server.url, path_vak=path_vak, store=make_store('hh', '', 'sqlite', path_db))
+    prof_sj = VacSJ('водитель', url=stub_server.url, path_vak=path_vak, store=SQLiteStore(path_db, 'sj'))
+    prof_hh.vacancies_all()
+    prof_sj.vacancies_all()
+
+    store_all = SQLiteStore(path_db)
+    assert len(prof_hh.store) == len(prof_sj.store) == 250 and len(store_all) == 500
+    data = list(store_all)
+    assert store_all.top_by_salary(30) == sorted(data, key=lambda vacancy: vacancy[KEY_SALARY_MEAN], reverse=True)[:30]
+    assert store_all.newest(30) == sorted(data, key=lambda vacancy: vacancy[KEY_DAY], reverse=True)[:30]
+    assert prof_sj.store.newest() == sorted(prof_sj.store, key=lambda vacancy: vacancy[KEY_DAY], reverse=True)
+
+    # Повторный поиск заменяет вакансии только своего сервиса.
+    stub_server.handler.found = 120
+    prof_hh.vacancies_all()
+    assert len(prof_hh.store) == 120 and len(prof_sj.store) == 250
+
+    with pytest.raises(ValueError):
+        store_all.append(data[:1])
+    with pytest.raises(ValueError):
+        make_store('hh', str(tmp_path), 'csv')
+
+
+def test_vacancies_print_sqlite(stub_server, tmp_path, capsys):
+    """
+    Тестирование вывода вакансий из хранилища SQLite.
+    """
+    os.makedirs(tmp_path / 'vak')
+    path_db = str(tmp_path / 'vacancies.db')
+    VacHH('водитель', url=stub_server.url, path_vak=str(tmp_path / 'vak'),
+          store=SQLiteStore(path_db, 'hh')).vacancies_all()
+    capsys.readouterr()
+
+    VacPrint(sort_method=1, backend='sqlite', path_db=path_db).vacancies_print(3, 'hh', one_each=2)
+    out = capsys.readouterr().out
+    assert out.count('№ ') == 3 and 'Выведены все вакансии.' in out
+
+
+def test_incremental_refresh(stub_server, tmp_path):
+    """
+    Тестирование инкрементального обновления: повторный запрос загружает только новые вакансии.
+    """
+    for folder in ('hh', 'sj'):
+        os.makedirs(tmp_path / folder)
+    state = RefreshState(str(tmp_path / 'refresh.json'))
+    session = HttpSession()
+    host = stub_server.url.split('/')[2]
+    prof_hh = VacHH('водитель', url=stub_server.url, path_vak=str(tmp_path / 'hh'), session=session,
+                    incremental=True, state=state)
+    prof_hh.vacancies_all()
+    assert prof_hh.size_dict == 250
+    assert state.get(prof_hh.query_key()) == '2023-11-28T10:00:00+0300'
+
+    # Запрашиваются только вакансии, опубликованные не раньше самой свежей из загруженных,
+    # уже загруженные (с той же датой публикации) повторно не сохраняются.
+    stub_server.handler.found = 300
+    session.reset_stats()
+    prof_hh.vacancies_all()
+    assert session.stats[host]['count'] == 1
+    assert prof_hh.size_new == 2 and prof_hh.size_dict == len(prof_hh.store) == 252
+    ids = [vacancy['_id'] for vacancy in prof_hh.store]
+    assert len(set(ids)) == 252 and ids[-2:] == ['251', '279']
+
+    # Запрос с другими параметрами загружает вакансии заново и заменяет состояние запросов сервиса.
+    other = VacHH('водитель', area=76, url=stub_server.url, path_vak=str(tmp_path / 'hh'), session=session,
+                  incremental=True, state=state)
+    other.vacancies_all()
+    assert other.size_dict == other.size_new == len(other.store) == 300
+    assert state.get(prof_hh.query_key()) is None and state.get(other.query_key()) is not None
+
+    prof_sj = VacSJ('водитель', url=stub_server.url, path_vak=str(tmp_path / 'sj'), session=session,
+                    incremental=True, state=state)
+    prof_sj.vacancies_all()
+    assert prof_sj.size_dict == 300 and state.get(prof_sj.query_key()) == 1698818400 + 86400 * 27
+    stub_server.handler.found = 350
+    session.reset_stats()
+    prof_sj.vacancies_all()
+    assert session.stats[host]['count'] == 1
+    assert prof_sj.size_new == 2 and len(prof_sj.store) == 302
+    # Состояние запросов hh.ru не затронуто.
+    assert state.get(other.query_key()) is not None
+
+
+def test_page_retries(stub_server, tmp_path):
+    """
+    Тестирование повторных попыток загрузки страницы при ошибке сервиса.
+    """
+    stub_server.handler.found = 500
+    stub_server.handler.failures.update({0: 1, 3: 2})
+    prof_hh = VacHH('водитель', url=stub_server.url, path_vak=str(tmp_path), retries=2, backoff=0)
+    prof_hh.vacancies_all()
+
+    assert prof_hh.size_dict == 500 and stub_server.handler.failures == {0: 0, 3: 0}
+    urls = [vacancy['14 Подробнее здесь (URL)'] for vacancy in prof_hh.store]
+    assert urls == [f'https://hh.ru/vacancy/{num}' for num in range(500)]
+    # После успешной загрузки контрольная точка удаляется.
+    assert os.listdir(tmp_path) == ['vakhh.jsonl']
+
+
+def test_resume_pages(stub_server, tmp_path):
+    """
+    Тестирование продолжения прерванной загрузки: повторно загружаются только недостающие страницы.
+    """
+    for folder in ('hh', 'sj'):
+        os.makedirs(tmp_path / folder)
+    stub_server.handler.found = 500
+    stub_server.handler.failures[2] = 2
+    session = HttpSession()
+    host = stub_server.url.split('/')[2]
+    prof_hh = VacHH('водитель', url=stub_server.url, path_vak=str(tmp_path / 'hh'), session=session,
+                    retries=1, backoff=0)
+    with pytest.raises(Exception, match='страницы 2 '):
+        prof_hh.vacancies_all()
+    # Страницы после незагруженной сохранены.
+    assert len(prof_hh.store) == 400 and 'vakhh_pages.json' in os.listdir(tmp_path / 'hh')
+
+    session.reset_stats()
+    prof_hh = VacHH('водитель', url=stub_server.url, path_vak=str(tmp_path / 'hh'), session=session,
+                    retries=1, backoff=0)
+    prof_hh.vacancies_all()
+    assert session.stats[host]['count'] == 1
+    ids = [vacancy['_id'] for vacancy in prof_hh.store]
+    assert prof_hh.size_dict == 500 and sorted(ids, key=int) == [str(num) for num in range(500)]
+    assert os.listdir(tmp_path / 'hh') == ['vakhh.jsonl']
+
+    def fail_sj() -> VacSJ:
+        stub_server.handler.failures[2] = 2
+        prof_sj = VacSJ('водитель', url=stub_server.url, path_vak=str(tmp_path / 'sj'), session=session,
+                        retries=1, backoff=0)
+        with pytest.raises(Exception, match='страницу 2 '):
+            prof_sj.vacancies_all()
+        assert len(prof_sj.store) == 200
+        session.reset_stats()
+        return prof_sj
+
+    fail_sj().vacancies_all()
+    assert session.stats[host]['count'] == 3
+
+    # Запрос с другими параметрами и загрузка без продолжения начинаются с первой страницы.
+    fail_sj()
+    VacSJ('повар', url=stub_server.url, path_vak=str(tmp_path / 'sj'), session=session).vacancies_all()
+    assert session.stats[host]['count'] == 5
+    fail_sj()
+    VacSJ('водитель', url=stub_server.url, path_vak=str(tmp_path / 'sj'), session=session,
+          resume=False).vacancies_all()
+    assert session.stats[host]['count'] == 5
+
+
+def test_http_session_stats(stub_server, tmp_path):
+    """
+    Тестирование счётчиков запросов общего пула HTTP-соединений.
+    """
+    session = HttpSession(pool_size=2)
+    VacHH('водитель', url=stub_server.url, path_vak=str(tmp_path), session=session).vacancies_all()
+
+    stats = session.stats[stub_server.url.split('/')[2]]
+    assert stats['count'] == 3
+    assert 0 < stats['avg'] <= stats['max'] <= stats['total']
+
+    assert stub_server.url.split('/')[2] + ': запросов - 3' in session.report()
+    session.reset_stats()
+    assert session.stats == {} and session.report() == 'Запросов к сервисам не было.'
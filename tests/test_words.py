@@ -0,0 +1,19 @@
+# Тестирование модуля words.py
+import pytest
+
+from src.utils.words import coord_words_num
+
+
+@pytest.mark.parametrize("digit, result", [
+    (1, '1 вакансия'),
+    (21, '21 вакансия'),
+    (3, '3 вакансии'),
+    (12, '12 вакансий'),
+    (25, '25 вакансий'),
+    (0, '0 вакансий'),
+])
+def test_coord_words_num(digit, result):
+    """
+    Тестирование согласования слова "вакансии" с числительными.
+    """
+    assert coord_words_num(digit) == result